@@ -0,0 +1,159 @@
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import json
+import os
+import tempfile
+import time
+import unicodedata
+import numpy as np
+import soundfile as sf
+from .encoder import write_samples
+
+class AudioCache:
+    """Content-addressed on-disk store of synthesized segment audio with LRU eviction.
+
+    Entries are keyed by normalized text, TTS model name, prosody parameters
+    rounded to ``quantization_step`` and a signature of the post-processing
+    applied to the audio, so near-identical prosody reuses the same audio.
+
+    The directory itself is the index: lookups check for the keyed file, recency
+    is its modification time and eviction rescans the directory. Several
+    processes, such as TTS pool workers, can therefore share one cache and one
+    size limit, and the LRU order survives restarts.
+
+    Each process keeps a running estimate of the directory size and rescans only
+    when its own stores push the estimate past the limit, or after
+    ``rescan_interval`` stores so that other processes' entries are counted.
+    Eviction goes down to ``evict_to`` of the limit, so a full cache is not
+    rescanned on every store.
+    """
+
+    def __init__(self,
+                 cache_dir: str,
+                 max_size_bytes: int = 2_000_000_000,
+                 quantization_step: float = 0.05,
+                 extension: str = "wav",
+                 rescan_interval: int = 1000,
+                 evict_to: float = 0.9):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.quantization_step = quantization_step
+        self.extension = extension
+        self.rescan_interval = rescan_interval
+        self.evict_to = evict_to
+
+        # Directory size at the last scan plus this process's stores since; None until the first scan
+        self._estimated_size: Optional[int] = None
+        self._stores_since_scan = 0
+
+    def key(self,
+            text: str,
+            model_name: str,
+            prosody_params: Dict[str, Any],
+            processing: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key; ``processing`` describes any DSP applied after synthesis."""
+        payload = json.dumps({
+            'text': self.normalize_text(text),
+            'model_name': model_name,
+            'prosody': self.quantize(prosody_params),
+            'processing': processing
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def normalize_text(self, text: str) -> str:
+        return ' '.join(unicodedata.normalize('NFC', text).split())
+
+    def quantize(self, prosody_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Round numeric parameters to the quantization step; other values pass through."""
+        quantized = {}
+        for name, value in prosody_params.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = round(round(value / self.quantization_step) * self.quantization_step, 6)
+            elif isinstance(value, (list, tuple, set)):
+                value = sorted(value)
+            quantized[name] = value
+        return quantized
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached file path for a key and mark it recently used, or None."""
+        path = self._path(key)
+        try:
+            self._touch(path)
+        except FileNotFoundError:
+            return None
+        return str(path)
+
+    def load_samples(self, key: str) -> Optional[Tuple[np.ndarray, int]]:
+        """Return (samples, sample_rate) for a key and mark it recently used, or None."""
+        cached_path = self.get(key)
+        if cached_path is None:
+            return None
+        try:
+            samples, sample_rate = sf.read(cached_path, dtype='float32')
+        except (OSError, RuntimeError):
+            # Evicted by another process since the lookup
+            return None
+        return samples, sample_rate
+
+    def store_samples(self, key: str, samples: np.ndarray, sample_rate: int) -> str:
+        """Encode samples into the cache and evict old entries beyond the size limit."""
+        # Write to a temporary file first so readers never see partial audio
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        os.close(fd)
+        path = self._path(key)
+        try:
+            write_samples(temp_path, samples, sample_rate, self.extension)
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self._touch(path)
+
+        self._stores_since_scan += 1
+        if self._estimated_size is not None:
+            self._estimated_size += size
+        if (self._estimated_size is None
+                or self._estimated_size > self.max_size_bytes
+                or self._stores_since_scan >= self.rescan_interval):
+            self._evict(keep=path)
+        return str(path)
+
+    def _evict(self, keep: Path) -> None:
+        # Rescan so the limit also covers entries other processes wrote
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(f".{self.extension}"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, entry.path, stat.st_size))
+
+        total_size = sum(size for _, _, size in entries)
+        if total_size > self.max_size_bytes:
+            target = self.max_size_bytes * self.evict_to
+            for _, path, size in sorted(entries):
+                if total_size <= target:
+                    break
+                if path == str(keep):
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total_size -= size
+
+        self._estimated_size = total_size
+        self._stores_since_scan = 0
+
+    def _touch(self, path: Path) -> None:
+        # An explicit timestamp, as the filesystem's own clock is too coarse to order entries
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.{self.extension}"
\ No newline at end of file
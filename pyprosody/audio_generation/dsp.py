@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+import numpy as np
+from .encoder import resample
+
+@dataclass
+class DSPConfig:
+    frame_size: int = 1024  # Phase vocoder FFT size
+    hop_size: int = 256  # Must divide frame_size
+    min_pitch_shift: float = 0.05  # Semitones; smaller shifts are skipped
+
+class ProsodyDSP:
+    """Applies the pitch and energy parts of ProsodyParameters to synthesized audio.
+
+    Pitch is shifted with a phase-vocoder time stretch followed by resampling,
+    which keeps the segment duration. Energy is a linear gain, optionally a
+    per-sample contour. Samples may exceed full scale afterwards; the output
+    writer's normalization brings the whole book back into range.
+    """
+
+    def __init__(self, config: Optional[DSPConfig] = None):
+        self.config = config or DSPConfig()
+        if self.config.frame_size % self.config.hop_size:
+            raise ValueError("hop_size must divide frame_size")
+        self._window = np.hanning(self.config.frame_size).astype(np.float32)
+
+    def apply(self, samples: np.ndarray, sample_rate: int, prosody_params: Dict[str, Any]) -> np.ndarray:
+        samples = self.pitch_shift(samples, sample_rate, prosody_params.get("pitch", 0.0))
+        return self.apply_gain(samples, prosody_params.get("energy", 1.0))
+
+    def apply_gain(self, samples: np.ndarray, gain: Union[float, np.ndarray]) -> np.ndarray:
+        """Scale by a scalar gain or a per-sample gain contour."""
+        if np.isscalar(gain) and gain == 1.0:
+            return samples
+        return samples * np.asarray(gain, dtype=np.float32)
+
+    def pitch_shift(self, samples: np.ndarray, sample_rate: int, semitones: float) -> np.ndarray:
+        """Shift pitch by ``semitones`` without changing duration."""
+        if abs(semitones) < self.config.min_pitch_shift or not len(samples):
+            return samples
+        factor = 2.0 ** (semitones / 12.0)
+
+        # Stretch by the pitch factor, then resample back to the original length
+        stretched = self.time_stretch(samples, 1.0 / factor)
+        shifted = resample(stretched, sample_rate * factor, sample_rate)
+        if len(shifted) >= len(samples):
+            return shifted[:len(samples)]
+        return np.pad(shifted, (0, len(samples) - len(shifted)))
+
+    def time_stretch(self, samples: np.ndarray, rate: float) -> np.ndarray:
+        """Phase-vocoder time stretch; ``rate`` > 1 shortens the audio."""
+        n_fft, hop = self.config.frame_size, self.config.hop_size
+        overlap = n_fft // hop
+
+        # Analysis frames, all at once
+        padded = np.pad(np.asarray(samples, dtype=np.float32), (n_fft // 2, n_fft))
+        n_frames = 1 + (len(padded) - n_fft) // hop
+        frames = np.lib.stride_tricks.sliding_window_view(padded, n_fft)[::hop][:n_frames]
+        spectrum = np.fft.rfft(frames * self._window, axis=1)
+
+        # Interpolate magnitudes at fractional frame positions and accumulate phase
+        steps = np.arange(0, n_frames - 1, rate)
+        index = steps.astype(int)
+        fraction = (steps - index)[:, None].astype(np.float32)
+        magnitude = np.abs(spectrum)
+        magnitude = (1.0 - fraction) * magnitude[index] + fraction * magnitude[index + 1]
+
+        angle = np.angle(spectrum)
+        advance = 2.0 * np.pi * hop * np.arange(spectrum.shape[1]) / n_fft
+        delta = angle[index + 1] - angle[index] - advance
+        delta -= 2.0 * np.pi * np.round(delta / (2.0 * np.pi))
+        phase = np.empty_like(delta)
+        phase[0] = angle[0]
+        np.cumsum(delta[:-1] + advance, axis=0, out=phase[1:])
+        phase[1:] += angle[0]
+
+        output_frames = np.fft.irfft(magnitude * np.exp(1j * phase), n=n_fft, axis=1).astype(np.float32)
+        output_frames *= self._window
+
+        # Overlap-add in ``overlap`` vectorized passes over hop-sized blocks
+        blocks = output_frames.reshape(len(steps), overlap, hop)
+        window_blocks = (self._window ** 2).reshape(overlap, hop)
+        output = np.zeros((len(steps) + overlap - 1, hop), dtype=np.float32)
+        norm = np.zeros_like(output)
+        for offset in range(overlap):
+            output[offset:offset + len(steps)] += blocks[:, offset]
+            norm[offset:offset + len(steps)] += window_blocks[offset]
+        output = output.ravel() / np.maximum(norm.ravel(), 1e-3)
+
+        length = int(round(len(samples) / rate))
+        return output[n_fft // 2:n_fft // 2 + length]
\ No newline at end of file
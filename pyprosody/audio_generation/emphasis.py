@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+import re
+import numpy as np
+from .dsp import ProsodyDSP
+
+# Same word split as the attention weights: the tokenizer breaks on punctuation
+WORD_PATTERN = re.compile(r"\w+")
+
+@dataclass
+class EmphasisConfig:
+    gain_db: float = 3.0  # Boost applied to emphasized words
+    stretch: float = 1.0  # Duration factor for emphasized words; 1.0 keeps timing
+    ramp_ms: float = 20.0  # Gain ramp on each side of a word
+    frame_ms: float = 10.0  # Envelope frame used for alignment
+    snap_ms: float = 60.0  # How far a word boundary may move towards a quieter frame
+    silence_threshold: float = 0.05  # Envelope level, relative to the peak, treated as silence
+
+class EmphasisRenderer:
+    """Renders ``ProsodyParameters.emphasis_words`` onto a synthesized segment.
+
+    Words are aligned once per segment by spreading the text's letters over the
+    voiced frames and snapping boundaries to nearby envelope valleys. All
+    emphasized words then share a single gain contour, and optionally a single
+    re-assembly of the buffer for duration changes.
+    """
+
+    def __init__(self, config: Optional[EmphasisConfig] = None, dsp: Optional[ProsodyDSP] = None):
+        self.config = config or EmphasisConfig()
+        self.dsp = dsp or ProsodyDSP()
+
+    def render(self,
+               samples: np.ndarray,
+               sample_rate: int,
+               text: str,
+               emphasis_words: Optional[Iterable[str]]) -> np.ndarray:
+        targets = {word.lower() for word in emphasis_words or ()}
+        if not targets or not len(samples):
+            return samples
+
+        words, bounds = self.align(samples, sample_rate, text)
+        selected = bounds[np.array([word.lower() in targets for word in words], dtype=bool)]
+        if not len(selected):
+            return samples
+
+        samples = self.dsp.apply_gain(samples, self._gain_contour(len(samples), sample_rate, selected))
+        if self.config.stretch != 1.0:
+            samples = self._stretch(samples, selected)
+        return samples
+
+    def align(self, samples: np.ndarray, sample_rate: int, text: str) -> Tuple[List[str], np.ndarray]:
+        """Estimate a (start, end) sample range for every word in ``text``."""
+        matches = list(WORD_PATTERN.finditer(text))
+        if not matches or not len(samples):
+            return [], np.zeros((0, 2), dtype=np.int64)
+
+        # Frame energy envelope, computed once for the whole segment
+        frame = max(1, int(sample_rate * self.config.frame_ms / 1000))
+        n_frames = max(1, len(samples) // frame)
+        framed = np.resize(np.asarray(samples, dtype=np.float32), n_frames * frame).reshape(n_frames, frame)
+        envelope = np.sqrt(np.mean(framed ** 2, axis=1))
+
+        # Letters are spread over voiced frames only, so pauses fall into the silences
+        voiced = envelope > self.config.silence_threshold * envelope.max()
+        if not voiced.any():
+            voiced[:] = True
+        voiced_count = np.cumsum(voiced)
+        letters = np.concatenate([[0], np.cumsum([char.isalnum() for char in text])])
+        char_bounds = np.array([[m.start(), m.end()] for m in matches])
+        position = np.round(letters[char_bounds] / letters[-1] * voiced_count[-1])
+        starts = np.searchsorted(voiced_count, position[:, 0], side='right')
+        ends = np.searchsorted(voiced_count, position[:, 1], side='left') + 1
+
+        # Snap starts to the last and ends to the first quiet frame nearby
+        snap = max(0, int(self.config.snap_ms / self.config.frame_ms))
+        padded = np.pad(envelope, snap, constant_values=np.inf)
+        windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * snap + 1)
+        start_windows = windows[np.clip(starts, 0, n_frames - 1), ::-1]
+        starts = starts + snap - np.argmin(start_windows, axis=-1)
+        ends = ends - snap + np.argmin(windows[np.clip(ends, 0, n_frames - 1)], axis=-1)
+
+        # Keep boundaries ordered so neighbouring words never overlap
+        bounds = np.stack([starts, ends], axis=1) * frame
+        bounds = np.maximum.accumulate(np.clip(bounds, 0, len(samples)).ravel()).reshape(-1, 2)
+        return [m.group(0) for m in matches], bounds
+
+    def _gain_contour(self, length: int, sample_rate: int, ranges: np.ndarray) -> np.ndarray:
+        # Mark emphasized samples with a difference array, then smooth the edges
+        edges = np.zeros(length + 1, dtype=np.float32)
+        np.add.at(edges, ranges[:, 0], 1.0)
+        np.add.at(edges, ranges[:, 1], -1.0)
+        inside = (np.cumsum(edges[:length]) > 0).astype(np.float32)
+
+        ramp = int(sample_rate * self.config.ramp_ms / 1000)
+        if ramp:
+            width = 2 * ramp + 1
+            running = np.cumsum(np.pad(inside, (ramp + 1, ramp)), dtype=np.float64)
+            inside = ((running[width:] - running[:-width]) / width).astype(np.float32)
+
+        boost = 10 ** (self.config.gain_db / 20) - 1.0
+        return 1.0 + boost * inside
+
+    def _stretch(self, samples: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+        pieces = []
+        position = 0
+        for start, end in ranges:
+            if end <= start:
+                continue
+            pieces.append(samples[position:start])
+            pieces.append(self.dsp.time_stretch(samples[start:end], 1.0 / self.config.stretch))
+            position = end
+        pieces.append(samples[position:])
+        return np.concatenate(pieces)
\ No newline at end of file
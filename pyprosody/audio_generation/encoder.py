@@ -0,0 +1,66 @@
+from typing import Optional
+from fractions import Fraction
+import subprocess
+import numpy as np
+import soundfile as sf
+from pydub.utils import get_encoder_name
+from ..utils.exceptions import AudioGenerationError
+
+try:
+    import soxr
+except ImportError:
+    soxr = None  # Fall back to scipy's polyphase resampler
+
+def resample(samples: np.ndarray, sample_rate: float, target_rate: float) -> np.ndarray:
+    """Resample float32 audio along its first axis, preferring soxr when installed.
+
+    Rates may be fractional, which pitch shifting relies on.
+    """
+    if sample_rate == target_rate or not len(samples):
+        return samples
+    if soxr is not None:
+        return soxr.resample(samples, sample_rate, target_rate).astype(np.float32, copy=False)
+
+    from scipy.signal import resample_poly
+    ratio = Fraction(target_rate / sample_rate).limit_denominator(1000)
+    return resample_poly(
+        samples, ratio.numerator, ratio.denominator, axis=0
+    ).astype(np.float32, copy=False)
+
+def is_native_format(output_format: str) -> bool:
+    """Whether soundfile can encode the format in-process (WAV, FLAC, OGG, ...)."""
+    return output_format.upper() in sf.available_formats()
+
+def open_encoder(path: str,
+                 output_format: str,
+                 sample_rate: int,
+                 channels: int,
+                 subtype: Optional[str] = None) -> sf.SoundFile:
+    return sf.SoundFile(path, 'w', sample_rate, channels, subtype=subtype, format=output_format.upper())
+
+def write_samples(path: str, samples: np.ndarray, sample_rate: int, output_format: str) -> None:
+    """Write float audio, keeping samples beyond full scale where the format can hold them."""
+    output_format = output_format.upper()
+    if sf.check_format(output_format, 'FLOAT'):
+        sf.write(path, samples, sample_rate, subtype='FLOAT', format=output_format)
+    else:
+        sf.write(path, np.clip(samples, -1.0, 1.0), sample_rate, format=output_format)
+
+def ffmpeg_convert(source_path: str, output_path: str, output_format: str, sample_rate: int, channels: int) -> None:
+    """Transcode a file with ffmpeg, for formats soundfile cannot write."""
+    command = [
+        get_encoder_name(), '-y', '-loglevel', 'error',
+        '-i', source_path,
+        '-ar', str(sample_rate),
+        '-ac', str(channels),
+        '-f', output_format,
+        output_path
+    ]
+    try:
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except OSError as e:
+        raise AudioGenerationError(f"Cannot encode {output_format} without ffmpeg: {str(e)}") from e
+    if result.returncode != 0:
+        raise AudioGenerationError(
+            f"ffmpeg failed to encode {output_format}: {result.stderr.decode(errors='replace').strip()}"
+        )
\ No newline at end of file
@@ -1,8 +1,7 @@
 from dataclasses import dataclass
-from typing import List, Optional
-from pydub import AudioSegment as PydubSegment
-import os
+from typing import Iterable, Optional
 from .tts import AudioSegment
+from .writer import StreamingAudioWriter
 
 @dataclass
 class AudioProcessingConfig:
@@ -15,35 +14,23 @@ class AudioProcessingConfig:
 class AudioProcessor:
     def __init__(self, config: Optional[AudioProcessingConfig] = None):
         self.config = config or AudioProcessingConfig()
-    
-    def merge_segments(self, segments: List[AudioSegment], output_path: str) -> str:
-        """Merge multiple audio segments into a single file with smooth transitions."""
-        if not segments:
-            raise ValueError("No audio segments provided")
-            
-        # Load the first segment
-        merged = PydubSegment.from_wav(segments[0].audio_path)
-        
-        # Add subsequent segments with crossfade
-        for i in range(1, len(segments)):
-            next_segment = PydubSegment.from_wav(segments[i].audio_path)
-            
-            # Apply crossfade
-            merged = merged.append(next_segment, 
-                                 crossfade=int(self.config.crossfade_duration))
-        
-        # Normalize if configured
-        if self.config.normalize:
-            merged = merged.normalize()
-            
-        # Export the final audio
-        merged.export(
+
+    def merge_segments(self, segments: Iterable[AudioSegment], output_path: str) -> str:
+        """Merge multiple audio segments into a single file with smooth transitions.
+
+        Segments are streamed into the output, so ``segments`` may be a generator.
+        """
+        with self.open_writer(output_path) as writer:
+            for segment in segments:
+                writer.write_segment(segment)
+        return output_path
+
+    def open_writer(self, output_path: str) -> StreamingAudioWriter:
+        return StreamingAudioWriter(
             output_path,
-            format=self.config.output_format,
-            parameters=[
-                "-ar", str(self.config.sample_rate),
-                "-ac", str(self.config.channels)
-            ]
-        )
-        
-        return output_path
\ No newline at end of file
+            sample_rate=self.config.sample_rate,
+            crossfade_duration=self.config.crossfade_duration,
+            normalize=self.config.normalize,
+            output_format=self.config.output_format,
+            channels=self.config.channels
+        )
\ No newline at end of file
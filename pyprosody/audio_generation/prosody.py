@@ -1,6 +1,8 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 from ..emotion_analysis.combiner import EmotionProfile
+from ..emotion_analysis.store import ProfileStore, ProfileView
 from ..text_processing.segmentation import TextSegment
 
 @dataclass
@@ -10,6 +12,14 @@ class ProsodyParameters:
     energy: float = 1.0     # Range: 0.5 to 2.0
     emphasis_words: List[str] = None
 
+@dataclass
+class EmotionArrays:
+    """Struct-of-arrays view of many EmotionProfiles, one row per segment."""
+    polarity: np.ndarray  # (n,)
+    sarcasm: np.ndarray  # (n,) sarcasm probability
+    intensities: np.ndarray  # (n, len(emotion_types)); repeated types are summed
+    emotion_types: Tuple[str, ...]
+
 class ProsodyMapper:
     def __init__(self):
         self.emotion_speed_map = {
@@ -37,43 +47,101 @@ class ProsodyMapper:
         }
     
     def map_emotion_to_prosody(self, profile: EmotionProfile) -> ProsodyParameters:
-        params = ProsodyParameters()
-        
-        # Adjust for basic sentiment
-        sentiment_intensity = abs(profile.basic_sentiment['polarity'])
-        
-        # Speed adjustments
-        base_speed = 1.0
-        if profile.basic_sentiment['polarity'] > 0:
-            base_speed *= 1.1
-        elif profile.basic_sentiment['polarity'] < 0:
-            base_speed *= 0.9
-            
-        # Adjust for sarcasm
-        if profile.sarcasm_indicators['probability'] > 0.7:
-            base_speed *= 1.15
-            params.pitch += 2.0
-            
-        # Apply emotion-specific modifiers
-        for emotion in profile.complex_emotions:
-            emotion_type = emotion['type']
-            intensity = emotion['intensity']
-            
-            if emotion_type in self.emotion_speed_map:
-                base_speed += (self.emotion_speed_map[emotion_type] - 1.0) * intensity
-                params.pitch += self.emotion_pitch_map[emotion_type] * intensity
-                params.energy *= (1.0 + (self.emotion_energy_map[emotion_type] - 1.0) * intensity)
-        
+        return self.map_batch([profile])[0]
+
+    def map_batch(self, profiles: Sequence[EmotionProfile], smoothing: int = 0) -> List[ProsodyParameters]:
+        """Map many profiles at once; ``smoothing`` blends each segment with that many neighbours."""
+        if not profiles:
+            return []
+        values = self.map_arrays(self.to_arrays(profiles), smoothing=smoothing)
+        return [
+            ProsodyParameters(
+                speed=float(speed),
+                pitch=float(pitch),
+                energy=float(energy),
+                emphasis_words=self._emphasis_words(profile)
+            )
+            for speed, pitch, energy, profile in zip(
+                values['speed'], values['pitch'], values['energy'], profiles
+            )
+        ]
+
+    def to_arrays(self, profiles: Sequence[EmotionProfile]) -> EmotionArrays:
+        emotion_types = tuple(self.emotion_speed_map)
+        if isinstance(profiles, ProfileStore):
+            return self._store_arrays(profiles, emotion_types)
+
+        columns = {emotion_type: i for i, emotion_type in enumerate(emotion_types)}
+        intensities = np.zeros((len(profiles), len(emotion_types)))
+        for row, profile in enumerate(profiles):
+            for emotion in profile.complex_emotions:
+                column = columns.get(emotion['type'])
+                if column is not None:
+                    intensities[row, column] += emotion['intensity']
+        return EmotionArrays(
+            polarity=np.array([p.basic_sentiment['polarity'] for p in profiles], dtype=np.float64),
+            sarcasm=np.array([p.sarcasm_indicators['probability'] for p in profiles], dtype=np.float64),
+            intensities=intensities,
+            emotion_types=emotion_types
+        )
+
+    def map_arrays(self, arrays: EmotionArrays, smoothing: int = 0) -> Dict[str, np.ndarray]:
+        """Compute speed, pitch and energy for every row with matrix operations."""
+        speed_weights = np.array([self.emotion_speed_map[e] for e in arrays.emotion_types]) - 1.0
+        pitch_weights = np.array([self.emotion_pitch_map[e] for e in arrays.emotion_types])
+        energy_weights = np.array([self.emotion_energy_map[e] for e in arrays.emotion_types]) - 1.0
+
+        # Sentiment and sarcasm scale the base speed
+        sarcastic = arrays.sarcasm > 0.7
+        speed = np.where(arrays.polarity > 0, 1.1, np.where(arrays.polarity < 0, 0.9, 1.0))
+        speed = np.where(sarcastic, speed * 1.15, speed)
+        pitch = np.where(sarcastic, 2.0, 0.0)
+
+        # Emotion-specific modifiers
+        speed = speed + arrays.intensities @ speed_weights
+        pitch = pitch + arrays.intensities @ pitch_weights
+        energy = np.prod(1.0 + arrays.intensities * energy_weights, axis=1)
+
         # Clamp values to valid ranges
-        params.speed = max(0.5, min(2.0, base_speed))
-        params.pitch = max(-20.0, min(20.0, params.pitch))
-        params.energy = max(0.5, min(2.0, params.energy))
-        
+        values = {
+            'speed': np.clip(speed, 0.5, 2.0),
+            'pitch': np.clip(pitch, -20.0, 20.0),
+            'energy': np.clip(energy, 0.5, 2.0)
+        }
+        if smoothing > 0:
+            values = {name: self._smooth(column, smoothing) for name, column in values.items()}
+        return values
+
+    def _smooth(self, values: np.ndarray, radius: int) -> np.ndarray:
+        # Triangular window, renormalized where it runs past either end. The full
+        # convolution is sliced, as 'same' returns the kernel's length when it is longer
+        kernel = np.concatenate([np.arange(1, radius + 2), np.arange(radius, 0, -1)]).astype(np.float64)
+        window = slice(radius, radius + len(values))
+        total = np.convolve(values, kernel, mode='full')[window]
+        weight = np.convolve(np.ones_like(values), kernel, mode='full')[window]
+        return total / weight
+
+    def _store_arrays(self, store: ProfileStore, emotion_types: Tuple[str, ...]) -> EmotionArrays:
+        # Columns are already arrays; only the emotion axis needs reordering
+        size = len(store)
+        intensities = np.zeros((size, len(emotion_types)))
+        for column, emotion_type in enumerate(emotion_types):
+            if emotion_type in store.emotion_types:
+                intensities[:, column] = store.intensities[:size, store.emotion_types.index(emotion_type)]
+        return EmotionArrays(
+            polarity=np.nan_to_num(store.sentiment[:size, 0].astype(np.float64)),
+            sarcasm=np.nan_to_num(store.sarcasm[:size].astype(np.float64)),
+            intensities=intensities,
+            emotion_types=emotion_types
+        )
+
+    def _emphasis_words(self, profile: EmotionProfile) -> List[str]:
         # Extract emphasis words from attention weights
-        attention_weights = profile.metadata.get('attention_weights', {})
-        params.emphasis_words = [
+        if isinstance(profile, ProfileView):
+            attention_weights = profile.attention_weights
+        else:
+            attention_weights = profile.metadata.get('attention_weights', {})
+        return [
             word for word, weight in attention_weights.items()
             if weight > 0.7
-        ]
-        
-        return params
\ No newline at end of file
+        ]
\ No newline at end of file
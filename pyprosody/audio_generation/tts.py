@@ -1,82 +1,155 @@
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from dataclasses import asdict, dataclass
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple
 import os
-import torch
-from TTS.api import TTS
+import numpy as np
 from ..text_processing.segmentation import TextSegment
+from .cache import AudioCache
+from .dsp import ProsodyDSP
+from .emphasis import EmphasisRenderer
+from .encoder import write_samples
 from ..utils.device import get_optimal_device
 
+# Bump when DSP or emphasis rendering changes so cached audio is not reused
+AUDIO_PROCESSING_VERSION = '2'
+
 @dataclass
 class TTSConfig:
     model_name: str = "tts_models/en/ljspeech/glow-tts"
     device: Optional[str] = None  # Now optional, will use optimal device if None
     output_format: str = "wav"
     sample_rate: int = 44100
+    cache_dir: Optional[str] = None  # Enables the synthesized audio cache when set
+    cache_max_bytes: int = 2_000_000_000
+    cache_quantization: float = 0.05  # Prosody parameter step shared by cache entries
+    spill_to_disk: bool = False  # Write each segment to a file instead of keeping samples
+    apply_prosody_dsp: bool = True  # Apply pitch and energy to the synthesized samples
+    render_emphasis: bool = True  # Boost emphasis_words within the segment
 
 @dataclass
 class AudioSegment:
     segment_id: str
-    audio_path: str
+    audio_path: Optional[str]  # Set when the audio lives on disk
     duration: float
     sample_rate: int
     metadata: Dict[str, Any]
+    samples: Optional[np.ndarray] = None  # Float32 audio when kept in memory
 
 class TTSEngine:
     def __init__(self, config: Optional[TTSConfig] = None):
         self.config = config or TTSConfig()
-        self.device = torch.device(self.config.device) if self.config.device else get_optimal_device()
         
-        # Initialize TTS
-        self.tts = TTS(
-            model_name=self.config.model_name,
-            progress_bar=False,
-            gpu=self.device.type in ["cuda", "mps"]  # Support both CUDA and MPS
-        )
+        # torch and the TTS model are loaded on first synthesis, so cache hits never pay for them
+        self._device = None
+        self._tts = None
+        
+        self.dsp = ProsodyDSP() if self.config.apply_prosody_dsp else None
+        self.emphasis = EmphasisRenderer(dsp=self.dsp) if self.config.render_emphasis else None
+        
+        # Cached audio is post-processed, so its key covers how
+        self.processing = {
+            'version': AUDIO_PROCESSING_VERSION,
+            'dsp': asdict(self.dsp.config) if self.dsp is not None else None,
+            'emphasis': asdict(self.emphasis.config) if self.emphasis is not None else None
+        }
+        
+        self.cache = None
+        if self.config.cache_dir:
+            self.cache = AudioCache(
+                self.config.cache_dir,
+                max_size_bytes=self.config.cache_max_bytes,
+                quantization_step=self.config.cache_quantization,
+                extension=self.config.output_format
+            )
         
+    @property
+    def device(self):
+        if self._device is None:
+            import torch
+            self._device = torch.device(self.config.device) if self.config.device else get_optimal_device()
+        return self._device
+    
+    @property
+    def tts(self):
+        if self._tts is None:
+            from TTS.api import TTS
+            
+            # Initialize TTS
+            self._tts = TTS(
+                model_name=self.config.model_name,
+                progress_bar=False,
+                gpu=self.device.type in ["cuda", "mps"]  # Support both CUDA and MPS
+            )
+        return self._tts
+    
     def generate_speech(self, 
                        segment: TextSegment, 
                        output_dir: str,
                        prosody_params: Optional[Dict[str, float]] = None) -> AudioSegment:
-        """Generate speech from text segment with optional prosody parameters."""
-        
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Prepare output path
-        output_path = os.path.join(
-            output_dir,
-            f"{segment.id}.{self.config.output_format}"
-        )
+        """Generate speech from text segment with optional prosody parameters.
+
+        Audio stays in memory as samples unless ``spill_to_disk`` is configured,
+        in which case it is written under ``output_dir`` instead.
+        """
         
         # Apply default prosody parameters if none provided
         prosody_params = prosody_params or {
             "speed": 1.0,
-            "pitch": 1.0,
+            "pitch": 0.0,
             "energy": 1.0
         }
         
         try:
-            # Generate speech with prosody parameters
-            self.tts.tts_to_file(
-                text=segment.text,
-                file_path=output_path,
-                speed=prosody_params.get("speed", 1.0),
-                energy=prosody_params.get("energy", 1.0)
-            )
+            cache_key = None
+            cached = None
+            synthesis_params = prosody_params
+            if self.cache is not None:
+                # Synthesize with the quantized values so cached audio matches its key
+                synthesis_params = self.cache.quantize(prosody_params)
+                cache_key = self.cache.key(
+                    segment.text, self.config.model_name, prosody_params, self.processing
+                )
+                cached = self.cache.load_samples(cache_key)
+            
+            if cached is not None:
+                samples, sample_rate = cached
+            else:
+                # Generate speech at the requested speed; pitch and energy are
+                # applied to the samples since the model ignores them
+                samples = np.asarray(self.tts.tts(
+                    text=segment.text,
+                    speed=synthesis_params.get("speed", 1.0)
+                ), dtype=np.float32)
+                sample_rate = self.tts.synthesizer.output_sample_rate
+                if self.dsp is not None:
+                    samples = self.dsp.apply(samples, sample_rate, synthesis_params)
+                if self.emphasis is not None:
+                    samples = self.emphasis.render(
+                        samples, sample_rate, segment.text, synthesis_params.get("emphasis_words")
+                    )
+                if cache_key is not None:
+                    self.cache.store_samples(cache_key, samples, sample_rate)
             
-            # Get audio duration and metadata
-            duration = self._get_audio_duration(output_path)
+            audio_path = None
+            if self.config.spill_to_disk:
+                os.makedirs(output_dir, exist_ok=True)
+                audio_path = os.path.join(
+                    output_dir,
+                    f"{segment.id}.{self.config.output_format}"
+                )
+                write_samples(audio_path, samples, sample_rate, self.config.output_format)
             
             return AudioSegment(
                 segment_id=segment.id,
-                audio_path=output_path,
-                duration=duration,
-                sample_rate=self.config.sample_rate,
+                audio_path=audio_path,
+                duration=len(samples) / float(sample_rate),
+                sample_rate=sample_rate,
                 metadata={
                     "prosody_params": prosody_params,
                     "model_name": self.config.model_name,
-                    "text_length": len(segment.text)
-                }
+                    "text_length": len(segment.text),
+                    "cache_hit": cached is not None
+                },
+                samples=None if self.config.spill_to_disk else samples
             )
             
         except Exception as e:
@@ -84,13 +157,12 @@ class TTSEngine:
                 f"Failed to generate speech for segment {segment.id}: {str(e)}"
             )
     
-    def _get_audio_duration(self, audio_path: str) -> float:
-        """Get the duration of an audio file in seconds."""
-        import wave
-        with wave.open(audio_path, 'rb') as wav_file:
-            frames = wav_file.getnframes()
-            rate = wav_file.getframerate()
-            return frames / float(rate)
+    def generate_batch(self,
+                       jobs: Iterable[Tuple[TextSegment, Optional[Dict[str, float]]]],
+                       output_dir: str) -> Iterator[AudioSegment]:
+        """Generate speech for (segment, prosody_params) pairs, yielding results in order."""
+        for segment, prosody_params in jobs:
+            yield self.generate_speech(segment, output_dir, prosody_params)
 
 class TTSGenerationError(Exception):
     """Exception raised for errors during TTS generation."""
@@ -0,0 +1,72 @@
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Iterable, Iterator, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+from .tts import TTSEngine, TTSConfig, AudioSegment
+from ..text_processing.segmentation import TextSegment
+
+@dataclass
+class TTSPoolConfig:
+    workers: int = field(default_factory=lambda: os.cpu_count() or 1)
+    threads_per_worker: int = 1  # Torch intra-op threads in each worker
+    chunksize: int = 1           # Segments handed to a worker at a time
+
+# Engine owned by the current worker process, created once by _init_worker
+_worker_engine: Optional[TTSEngine] = None
+
+def _init_worker(config: TTSConfig, threads: int) -> None:
+    import torch
+    torch.set_num_threads(threads)
+    torch.set_num_interop_threads(1)
+
+    global _worker_engine
+    _worker_engine = TTSEngine(config)
+
+def _synthesize(job: Tuple[TextSegment, str, Optional[Dict[str, float]]]) -> AudioSegment:
+    segment, output_dir, prosody_params = job
+    return _worker_engine.generate_speech(segment, output_dir, prosody_params)
+
+class TTSWorkerPool:
+    """Synthesize segments across worker processes that each load the TTS model once.
+
+    Exposes the same generate_speech/generate_batch interface as TTSEngine.
+    """
+
+    def __init__(self, config: Optional[TTSConfig] = None, pool_config: Optional[TTSPoolConfig] = None):
+        self.config = config or TTSConfig()
+        self.pool_config = pool_config or TTSPoolConfig()
+
+        # Spawn rather than fork: forking a process that holds torch state can deadlock
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.pool_config.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(self.config, self.pool_config.threads_per_worker)
+        )
+
+    def generate_speech(self,
+                        segment: TextSegment,
+                        output_dir: str,
+                        prosody_params: Optional[Dict[str, float]] = None) -> AudioSegment:
+        return self.executor.submit(_synthesize, (segment, output_dir, prosody_params)).result()
+
+    def generate_batch(self,
+                       jobs: Iterable[Tuple[TextSegment, Optional[Dict[str, float]]]],
+                       output_dir: str) -> Iterator[AudioSegment]:
+        """Distribute (segment, prosody_params) pairs over the workers, yielding results in order."""
+        os.makedirs(output_dir, exist_ok=True)
+        return self.executor.map(
+            _synthesize,
+            ((segment, output_dir, prosody_params) for segment, prosody_params in jobs),
+            chunksize=self.pool_config.chunksize
+        )
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
\ No newline at end of file
@@ -0,0 +1,175 @@
+from typing import Optional
+import os
+import tempfile
+import numpy as np
+import soundfile as sf
+from .tts import AudioSegment
+from .encoder import ffmpeg_convert, is_native_format, open_encoder, resample
+
+# Temporary files are RF64, a WAV variant without the 4 GiB RIFF size limit,
+# since float32 WAV runs out at under seven hours of 44.1 kHz mono
+TEMP_FORMAT = 'rf64'
+
+def prepare_samples(samples: np.ndarray, sample_rate: int, target_rate: int) -> np.ndarray:
+    """Downmix to mono float32 and resample to ``target_rate``."""
+    samples = np.asarray(samples, dtype=np.float32)
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1)
+    return resample(samples, sample_rate, target_rate)
+
+def crossfade_ramp(length: int) -> np.ndarray:
+    # Sample-centred linear ramp, so fade-in and fade-out always sum to one
+    return (np.arange(length, dtype=np.float32) + 0.5) / length
+
+class StreamingAudioWriter:
+    """Crossfades segments into an audio file as they arrive.
+
+    Only the not-yet-faded tail of the previous segment is held back, so memory
+    stays within one crossfade window plus the segment being written. With
+    ``normalize`` the audio is first streamed to a float temporary file while the
+    running peak is tracked, then scaled block by block into the output file.
+    """
+
+    def __init__(self,
+                 output_path: str,
+                 sample_rate: int = 44100,
+                 crossfade_duration: float = 100,  # milliseconds
+                 normalize: bool = True,
+                 output_format: str = "wav",
+                 channels: int = 1,
+                 block_size: int = 65_536):
+        self.output_path = output_path
+        self.sample_rate = sample_rate
+        self.normalize = normalize
+        self.output_format = output_format
+        self.channels = channels
+        self.block_size = block_size
+
+        self.segment_count = 0
+        self.frames_written = 0
+        self._fade = int(round(crossfade_duration * sample_rate / 1000))
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._peak = 0.0
+        self._file: Optional[sf.SoundFile] = None
+        self._temp_path: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return (self.frames_written + len(self._pending)) / self.sample_rate
+
+    def write_segment(self, segment: AudioSegment) -> None:
+        if segment.samples is not None:
+            self.write(segment.samples, segment.sample_rate)
+        else:
+            samples, sample_rate = sf.read(segment.audio_path, dtype='float32')
+            self.write(samples, sample_rate)
+
+    def write(self, samples: np.ndarray, sample_rate: int) -> None:
+        """Append one segment, crossfading it with the held-back tail of the previous one."""
+        samples = prepare_samples(samples, sample_rate, self.sample_rate)
+        if self._file is None:
+            self._open()
+        self.segment_count += 1
+
+        # The overlap is bounded by both neighbours, as with pydub's append
+        overlap = min(len(self._pending), len(samples))
+        self._flush(self._pending[:len(self._pending) - overlap])
+        if overlap:
+            ramp = crossfade_ramp(overlap)
+            head = self._pending[len(self._pending) - overlap:] * (1.0 - ramp) + samples[:overlap] * ramp
+            samples = np.concatenate([head, samples[overlap:]])
+
+        # Hold back the tail that the next segment will fade into
+        keep = min(self._fade, len(samples))
+        self._flush(samples[:len(samples) - keep])
+        self._pending = samples[len(samples) - keep:].copy()
+
+    def close(self) -> str:
+        """Flush the held-back tail, finish normalization and return the output path."""
+        if self._file is None:
+            raise ValueError("No audio segments provided")
+        self._flush(self._pending)
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._file.close()
+        self._file = None
+
+        if self._temp_path is not None:
+            try:
+                self._finish(self._temp_path)
+            finally:
+                os.remove(self._temp_path)
+                self._temp_path = None
+        return self.output_path
+
+    def abort(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        # Only remove an output file this writer created
+        paths = [self._temp_path, self.output_path if self.segment_count else None]
+        for path in paths:
+            if path and os.path.exists(path):
+                os.remove(path)
+        self._temp_path = None
+
+    def __enter__(self) -> "StreamingAudioWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _open(self) -> None:
+        # Formats soundfile cannot encode are transcoded from a temporary file on close
+        if self.normalize or not is_native_format(self.output_format):
+            fd, self._temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.output_path)), suffix='.tmp.wav'
+            )
+            os.close(fd)
+            subtype = 'FLOAT' if self.normalize else None
+            self._file = open_encoder(self._temp_path, TEMP_FORMAT, self.sample_rate, 1, subtype=subtype)
+        else:
+            self._file = open_encoder(self.output_path, self.output_format, self.sample_rate, self.channels)
+
+    def _flush(self, block: np.ndarray) -> None:
+        if not len(block):
+            return
+        if self._temp_path is not None:
+            self._peak = max(self._peak, float(np.max(np.abs(block))))
+            self._file.write(block)
+        else:
+            # Segments are not clipped upstream, so clip here when nothing normalizes
+            self._file.write(self._layout(np.clip(block, -1.0, 1.0)))
+        self.frames_written += len(block)
+
+    def _finish(self, temp_path: str) -> None:
+        # Peak scale with pydub's default 0.1 dB headroom
+        gain = 10 ** (-0.1 / 20) / self._peak if self.normalize and self._peak > 0 else 1.0
+
+        if is_native_format(self.output_format):
+            self._rescale(temp_path, self.output_path, gain, self.output_format, self.channels)
+            return
+
+        source_path = temp_path
+        if gain != 1.0:
+            source_path = temp_path + '.scaled.wav'
+            self._rescale(temp_path, source_path, gain, TEMP_FORMAT, 1)
+        try:
+            ffmpeg_convert(source_path, self.output_path, self.output_format, self.sample_rate, self.channels)
+        finally:
+            if source_path != temp_path:
+                os.remove(source_path)
+
+    def _rescale(self, source_path: str, target_path: str, gain: float, output_format: str, channels: int) -> None:
+        with open_encoder(target_path, output_format, self.sample_rate, channels) as target:
+            for block in sf.blocks(source_path, blocksize=self.block_size, dtype='float32'):
+                block = np.clip(block * np.float32(gain), -1.0, 1.0)
+                target.write(self._layout(block, channels))
+
+    def _layout(self, block: np.ndarray, channels: Optional[int] = None) -> np.ndarray:
+        channels = channels or self.channels
+        if channels == 1:
+            return block
+        return np.repeat(block[:, None], channels, axis=1)
\ No newline at end of file
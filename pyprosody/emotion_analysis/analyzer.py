@@ -1,52 +1,104 @@
 from typing import List, Optional
 from datetime import datetime
 
-from .lexical import LexicalAnalyzer
-from .contextual import ContextualAnalyzer
+from .lexical import LexicalAnalyzer, LexicalScore
+from .features import SegmentFeatures
+from .resources import NLTKResources
+from .contextual import ContextualAnalyzer, ContextualScore
 from .sarcasm import SarcasmDetector
-from .pragmatic import PragmaticAnalyzer
+from .pragmatic import PragmaticAnalyzer, PragmaticScore
 from .combiner import EmotionProfile
+from .cache import ProfileCache
 from ..text_processing.segmentation import TextSegment
 
+# Bump when analysis output changes so cached profiles are not reused
+ANALYZER_VERSION = '1.4'
+
 class EmotionAnalyzer:
-    def __init__(self):
-        self.lexical_analyzer = LexicalAnalyzer()
-        self.contextual_analyzer = ContextualAnalyzer()
+    def __init__(self,
+                 attention_mode: str = 'last',
+                 cache: Optional[ProfileCache] = None,
+                 nltk_resources: Optional[NLTKResources] = None):
+        self.lexical_analyzer = LexicalAnalyzer(nltk_resources)
+        self.contextual_analyzer = ContextualAnalyzer(attention_mode=attention_mode)
         self.sarcasm_detector = SarcasmDetector()
         self.pragmatic_analyzer = PragmaticAnalyzer()
-    
+        self.cache = cache
+        self.version = f"{ANALYZER_VERSION}:{self.contextual_analyzer.model_name}:{attention_mode}"
+
     def analyze(self, segment: TextSegment) -> EmotionProfile:
-        # Run all analysis components
-        lexical_score = self.lexical_analyzer.analyze(segment.text)
-        contextual_score = self.contextual_analyzer.analyze(segment.text)
-        sarcasm_score = self.sarcasm_detector.detect(segment.text)
-        pragmatic_score = self.pragmatic_analyzer.analyze(segment.text)
-        
+        return self.analyze_batch([segment], batch_size=1)[0]
+
+    def analyze_batch(self, segments: List[TextSegment], batch_size: int = 32) -> List[EmotionProfile]:
+        """Analyze many segments, running the transformer in padded batches.
+
+        With a cache, only texts not seen before are analyzed, each once per batch.
+        """
+        if self.cache is None:
+            return self._analyze_uncached(segments, batch_size)
+
+        keys = [self.cache.key(segment.text, self.version) for segment in segments]
+        profiles: List[Optional[EmotionProfile]] = [
+            self.cache.get(key, segment) for key, segment in zip(keys, segments)
+        ]
+
+        # Analyze the first segment of each missing text
+        pending = {}
+        for index, (key, profile) in enumerate(zip(keys, profiles)):
+            if profile is None and key not in pending:
+                pending[key] = index
+        analyzed = self._analyze_uncached([segments[index] for index in pending.values()], batch_size)
+        self.cache.put_many(zip(pending, analyzed))
+
+        for index, (key, profile) in enumerate(zip(keys, profiles)):
+            if profile is None:
+                profiles[index] = self.cache.get(key, segments[index])
+        return profiles
+
+    def _analyze_uncached(self, segments: List[TextSegment], batch_size: int) -> List[EmotionProfile]:
+        # Lowercasing, splitting and token lookups happen once per segment for all analyzers
+        features = [SegmentFeatures.from_segment(segment) for segment in segments]
+        contextual_scores = self.contextual_analyzer.analyze_batch(segments, batch_size=batch_size)
+        lexical_scores = self.lexical_analyzer.analyze_batch(segments, features)
+        pragmatic_scores = self.pragmatic_analyzer.analyze_batch(segments, features)
+        return [
+            self._build_profile(segment, segment_features, contextual_score, lexical_score, pragmatic_score)
+            for segment, segment_features, contextual_score, lexical_score, pragmatic_score
+            in zip(segments, features, contextual_scores, lexical_scores, pragmatic_scores)
+        ]
+
+    def _build_profile(self,
+                       segment: TextSegment,
+                       features: SegmentFeatures,
+                       contextual_score: ContextualScore,
+                       lexical_score: LexicalScore,
+                       pragmatic_score: PragmaticScore) -> EmotionProfile:
+        # Run the remaining analysis components
+        sarcasm_score = self.sarcasm_detector.detect_sarcasm(segment, segment_features=features)
+
         # Create emotion profile
         return EmotionProfile(
             segment_id=segment.id,
             text_reference=segment,
             basic_sentiment={
-                'polarity': contextual_score.sentiment,
-                'objectivity': contextual_score.objectivity
+                'polarity': contextual_score.sentiment_score,
+                'objectivity': lexical_score.objective_score
             },
-            complex_emotions=[
-                {'type': emotion, 'intensity': score}
-                for emotion, score in contextual_score.emotions.items()
-            ],
+            complex_emotions=[],
             sarcasm_indicators={
                 'probability': sarcasm_score.probability,
-                'features': sarcasm_score.features
+                'features': sarcasm_score.features.feature_descriptions
             },
             prosody_markers={
                 'speed_factor': 1.0,
                 'pitch_shift': 0.0,
                 'volume_adjust': 1.0,
-                'emphasis_points': pragmatic_score.emphasis_points
+                'emphasis_level': pragmatic_score.emotional_intensity
             },
             metadata={
                 'timestamp': datetime.now(),
-                'model_version': '1.0',
-                'processing_time': contextual_score.processing_time
+                'model_version': ANALYZER_VERSION,
+                'processing_time': contextual_score.processing_time,
+                'attention_weights': contextual_score.attention_weights
             }
         )
\ No newline at end of file
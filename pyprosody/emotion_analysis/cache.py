@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+import hashlib
+import json
+import sqlite3
+import threading
+import zlib
+
+from .combiner import EmotionProfile
+from ..text_processing.segmentation import TextSegment
+
+class ProfileCache:
+    """Persistent memo of EmotionProfile results keyed by segment text and analyzer version.
+
+    Profiles are stored as zlib-compressed JSON in a single SQLite file, without
+    their ``text_reference``, and re-attached to whichever segment asks for them.
+    A bounded in-memory LRU of the compressed records sits in front of the file.
+    """
+
+    def __init__(self, path: str, memory_entries: int = 10_000):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Pipeline stages may use the cache from worker threads
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS profiles (key TEXT PRIMARY KEY, data BLOB NOT NULL)")
+        self._db.commit()
+
+    def key(self, text: str, version: str) -> str:
+        return hashlib.sha256(f"{version}\0{text}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str, segment: TextSegment) -> Optional[EmotionProfile]:
+        """Return the cached profile re-bound to ``segment``, or None on a miss."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+            else:
+                row = self._db.execute("SELECT data FROM profiles WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                data = row[0]
+                self._remember(key, data)
+        return self._deserialize(data, segment)
+
+    def put(self, key: str, profile: EmotionProfile) -> None:
+        self.put_many([(key, profile)])
+
+    def put_many(self, items: Iterable[Tuple[str, EmotionProfile]]) -> None:
+        """Store (key, profile) pairs in a single transaction."""
+        records = [(key, self._serialize(profile)) for key, profile in items]
+        with self._lock:
+            with self._db:
+                self._db.executemany("INSERT OR REPLACE INTO profiles (key, data) VALUES (?, ?)", records)
+            for key, data in records:
+                self._remember(key, data)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _remember(self, key: str, data: bytes) -> None:
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _serialize(self, profile: EmotionProfile) -> bytes:
+        metadata = dict(profile.metadata)
+        timestamp = metadata.pop('timestamp', None)
+        record = {
+            'basic_sentiment': profile.basic_sentiment,
+            'complex_emotions': profile.complex_emotions,
+            'sarcasm_indicators': profile.sarcasm_indicators,
+            'prosody_markers': profile.prosody_markers,
+            'metadata': metadata,
+            'timestamp': timestamp.isoformat() if timestamp else None
+        }
+        return zlib.compress(json.dumps(record, separators=(',', ':')).encode('utf-8'))
+
+    def _deserialize(self, data: bytes, segment: TextSegment) -> EmotionProfile:
+        record = json.loads(zlib.decompress(data))
+        metadata = record['metadata']
+        if record['timestamp']:
+            metadata['timestamp'] = datetime.fromisoformat(record['timestamp'])
+        return EmotionProfile(
+            segment_id=segment.id,
+            text_reference=segment,
+            basic_sentiment=record['basic_sentiment'],
+            complex_emotions=record['complex_emotions'],
+            sarcasm_indicators=record['sarcasm_indicators'],
+            prosody_markers=record['prosody_markers'],
+            metadata=metadata
+        )
\ No newline at end of file
@@ -1,69 +1,211 @@
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 from dataclasses import dataclass
-import torch
-from transformers import DistilBertTokenizer, DistilBertForSequenceClassification
+import math
+import time
+import numpy as np
 from ..text_processing.segmentation import TextSegment
 from ..utils.device import get_optimal_device
 
+if TYPE_CHECKING:
+    import torch
+
+# 'off' skips attention entirely, 'last' captures only the last head of the last
+# layer through a hook, 'full' asks the model for every layer's attention
+ATTENTION_MODES = ('off', 'last', 'full')
+
 @dataclass
 class ContextualScore:
     sentiment_score: float  # Range: -1.0 to 1.0
     confidence: float      # Range: 0.0 to 1.0
     attention_weights: Dict[str, float]
+    processing_time: float = 0.0  # Seconds, amortized over the batch
 
 class ContextualAnalyzer:
-    def __init__(self, model_name: str = "distilbert-base-uncased-finetuned-sst-2-english"):
-        self.device = get_optimal_device()
-        self.tokenizer = DistilBertTokenizer.from_pretrained(model_name)
-        self.model = DistilBertForSequenceClassification.from_pretrained(model_name).to(self.device)
-        self.model.eval()
+    def __init__(self,
+                 model_name: str = "distilbert-base-uncased-finetuned-sst-2-english",
+                 attention_mode: str = 'last'):
+        if attention_mode not in ATTENTION_MODES:
+            raise ValueError(f"Invalid attention mode: {attention_mode}. Choose from: {', '.join(ATTENTION_MODES)}")
+
+        self.model_name = model_name
+        self.attention_mode = attention_mode
+
+        # torch, transformers and the model itself are loaded on first use
+        self._device = None
+        self._tokenizer = None
+        self._model = None
+
+        # Hidden states entering the last transformer block, set by the hook
+        self._last_block_input: Optional["torch.Tensor"] = None
+
+    @property
+    def device(self) -> "torch.device":
+        if self._model is None:
+            self._load()
+        return self._device
+
+    @property
+    def tokenizer(self):
+        if self._model is None:
+            self._load()
+        return self._tokenizer
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._load()
+        return self._model
+
+    def _load(self) -> None:
+        from transformers import DistilBertTokenizerFast, DistilBertForSequenceClassification
+
+        device = get_optimal_device()
+        tokenizer = DistilBertTokenizerFast.from_pretrained(self.model_name)
+        model = DistilBertForSequenceClassification.from_pretrained(self.model_name).to(device)
+        model.eval()
+
+        if self.attention_mode == 'last':
+            self._last_block = model.distilbert.transformer.layer[-1]
+            self._last_block.register_forward_pre_hook(self._capture_last_block_input, with_kwargs=True)
+        self._device, self._tokenizer, self._model = device, tokenizer, model
 
     def analyze_segment(self, segment: TextSegment, context_window: int = 2) -> ContextualScore:
+        return self.analyze_batch([segment], batch_size=1)[0]
+
+    def analyze_batch(self, segments: List[TextSegment], batch_size: int = 32) -> List[ContextualScore]:
+        """Analyze many segments at once, returning one score per segment in input order.
+
+        Segments are sorted by token length and grouped into batches that are only
+        padded to their own longest member, so short sentences never pay for long ones.
+        """
+        if not segments:
+            return []
+        import torch
+
+        # Tokenize once without padding so batches can be formed by length
+        texts = [segment.text for segment in segments]
+        encodings = self.tokenizer(
+            texts,
+            truncation=True,
+            max_length=512,
+            return_offsets_mapping=self.attention_mode != 'off'
+        )
+        order = sorted(range(len(segments)), key=lambda i: len(encodings['input_ids'][i]))
+
+        scores: List[Optional[ContextualScore]] = [None] * len(segments)
         with torch.no_grad():
-            # Prepare input
-            inputs = self.tokenizer(
-                segment.text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512
-            ).to(self.device)
-
-            # Get model outputs
-            outputs = self.model(**inputs, output_attentions=True)
-            
-            # Process logits
-            logits = outputs.logits.squeeze()
-            probs = torch.softmax(logits, dim=0)
-            
-            # Convert to sentiment score (-1 to 1)
-            sentiment_score = float((probs[1] - probs[0]).cpu().numpy())
-            confidence = float(torch.max(probs).cpu().numpy())
-            
-            # Process attention weights
-            attention_weights = self._process_attention_weights(
-                inputs['input_ids'][0],
-                outputs.attentions[-1][0][-1].mean(dim=0)
-            )
-
-            return ContextualScore(
-                sentiment_score=sentiment_score,
-                confidence=confidence,
-                attention_weights=attention_weights
-            )
-
-    def _process_attention_weights(self, input_ids: torch.Tensor, attention: torch.Tensor) -> Dict[str, float]:
-        tokens = self.tokenizer.convert_ids_to_tokens(input_ids)
-        attention = attention.cpu().numpy()
-        
-        # Create token-attention mapping
-        token_attention = {}
-        for token, weight in zip(tokens, attention):
-            if token not in ['[CLS]', '[SEP]', '[PAD]']:
-                # Remove ## from wordpiece tokens
-                clean_token = token.replace('##', '')
-                if clean_token in token_attention:
-                    token_attention[clean_token] = max(token_attention[clean_token], float(weight))
-                else:
-                    token_attention[clean_token] = float(weight)
-        
-        return token_attention
\ No newline at end of file
+            for start in range(0, len(order), batch_size):
+                batch_indices = order[start:start + batch_size]
+                started = time.perf_counter()
+
+                # Pad only to the longest sequence in this bucket
+                inputs = self.tokenizer.pad(
+                    {
+                        'input_ids': [encodings['input_ids'][i] for i in batch_indices],
+                        'attention_mask': [encodings['attention_mask'][i] for i in batch_indices]
+                    },
+                    return_tensors="pt"
+                ).to(self.device)
+
+                # Get model outputs
+                outputs = self.model(**inputs, output_attentions=self.attention_mode == 'full')
+
+                # Process logits
+                probs = torch.softmax(outputs.logits, dim=-1).cpu()
+
+                # Attention received per token: (batch, seq)
+                attention = self._batch_attention(outputs, inputs['attention_mask'])
+                lengths = inputs['attention_mask'].sum(dim=1).tolist()
+
+                elapsed = (time.perf_counter() - started) / len(batch_indices)
+                for row, index in enumerate(batch_indices):
+                    attention_weights = {}
+                    if attention is not None:
+                        length = int(lengths[row])
+                        attention_weights = self._process_attention_weights(
+                            texts[index],
+                            encodings.word_ids(index),
+                            np.asarray(encodings['offset_mapping'][index]),
+                            attention[row, :length]
+                        )
+                    scores[index] = self._build_score(probs[row], attention_weights, elapsed)
+
+        return scores
+
+    def _capture_last_block_input(self, module, args, kwargs):
+        self._last_block_input = args[0] if args else kwargs.get('x', kwargs.get('hidden_states'))
+
+    def _batch_attention(self, outputs, attention_mask: "torch.Tensor") -> Optional[np.ndarray]:
+        """Average attention each token receives from the last head of the last layer."""
+        if self.attention_mode == 'off':
+            return None
+        import torch
+
+        mask = attention_mask.bool()
+        if self.attention_mode == 'full':
+            weights = outputs.attentions[-1][:, -1]
+        else:
+            # Recompute just the last head from the captured block input instead of
+            # materializing every layer's attention tensors
+            attention = self._last_block.attention
+            head_dim = attention.dim // attention.n_heads
+            head = slice(attention.dim - head_dim, attention.dim)
+            hidden = self._last_block_input
+            query = attention.q_lin(hidden)[..., head]
+            key = attention.k_lin(hidden)[..., head]
+            scores = query @ key.transpose(1, 2) / math.sqrt(head_dim)
+            scores = scores.masked_fill(~mask[:, None, :], torch.finfo(scores.dtype).min)
+            weights = torch.softmax(scores, dim=-1)
+            self._last_block_input = None
+
+        # Ignore padded query positions so results match unbatched inference
+        weights = weights * mask[:, :, None]
+        received = weights.sum(dim=1) / mask.sum(dim=1, keepdim=True)
+        return received.float().cpu().numpy()
+
+    def _build_score(self,
+                     probs: "torch.Tensor",
+                     attention_weights: Dict[str, float],
+                     processing_time: float) -> ContextualScore:
+        # Convert to sentiment score (-1 to 1)
+        sentiment_score = float((probs[1] - probs[0]).numpy())
+        confidence = float(probs.max().numpy())
+
+        return ContextualScore(
+            sentiment_score=sentiment_score,
+            confidence=confidence,
+            attention_weights=attention_weights,
+            processing_time=processing_time
+        )
+
+    def _process_attention_weights(self,
+                                   text: str,
+                                   word_ids: List[Optional[int]],
+                                   offsets: np.ndarray,
+                                   attention: np.ndarray) -> Dict[str, float]:
+        """Map token attention to the words of the original text using offset mappings."""
+        word_index = np.array([-1 if word is None else word for word in word_ids])
+        valid = word_index >= 0  # Drops [CLS], [SEP] and padding
+        if not valid.any():
+            return {}
+
+        word_index = word_index[valid]
+        offsets = offsets[valid]
+        word_count = int(word_index.max()) + 1
+
+        # Each word keeps its strongest wordpiece and spans all of its pieces
+        word_weight = np.full(word_count, -np.inf)
+        np.maximum.at(word_weight, word_index, attention[valid])
+        word_start = np.full(word_count, len(text))
+        np.minimum.at(word_start, word_index, offsets[:, 0])
+        word_end = np.zeros(word_count, dtype=int)
+        np.maximum.at(word_end, word_index, offsets[:, 1])
+
+        # Create word-attention mapping
+        word_attention = {}
+        present = np.isfinite(word_weight)
+        for weight, start, end in zip(word_weight[present], word_start[present], word_end[present]):
+            word = text[start:end].lower()
+            word_attention[word] = max(word_attention.get(word, 0.0), float(weight))
+
+        return word_attention
\ No newline at end of file
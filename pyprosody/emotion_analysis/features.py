@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Tuple
+import string
+from ..text_processing.segmentation import TextSegment
+
+# Punctuation is turned into spaces before a text is split into words
+WORD_SEPARATORS = str.maketrans({
+    char: ' ' for char in string.punctuation + '\u2018\u2019\u201c\u201d\u2013\u2014\u2026'
+})
+
+@dataclass
+class SegmentFeatures:
+    """Text preprocessing shared by every analyzer of one segment.
+
+    EmotionAnalyzer builds one per segment and hands it to each analyzer, so the
+    text is lowercased, split and scanned for punctuation once. Analyzers called
+    on their own build it themselves.
+    """
+    text: str
+    lower: str
+    words: List[str]  # Lowercased and split on whitespace, punctuation attached
+    word_set: FrozenSet[str]
+    tokens: List[str]  # Lowercased and split on whitespace and punctuation
+    token_set: FrozenSet[str]
+    punctuation: Dict[str, int]  # Occurrences of each ASCII punctuation character present
+    tagged: Optional[List[Tuple[str, str]]] = None  # Segmenter's (word, tag) pairs, if it tagged the segment
+
+    @classmethod
+    def from_segment(cls, segment: TextSegment) -> "SegmentFeatures":
+        return cls.from_text(segment.text, getattr(segment, 'tokens', None))
+
+    @classmethod
+    def from_text(cls, text: str, tagged: Optional[List[Tuple[str, str]]] = None) -> "SegmentFeatures":
+        lower = text.lower()
+        words = lower.split()
+        tokens = lower.translate(WORD_SEPARATORS).split()
+        return cls(
+            text=text,
+            lower=lower,
+            words=words,
+            word_set=frozenset(words),
+            tokens=tokens,
+            token_set=frozenset(tokens),
+            punctuation={char: text.count(char) for char in string.punctuation if char in text},
+            tagged=tagged
+        )
+
+    def count(self, char: str) -> int:
+        return self.punctuation.get(char, 0)
\ No newline at end of file
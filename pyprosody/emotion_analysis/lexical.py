@@ -1,9 +1,8 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from datetime import datetime
-from afinn import Afinn
-import nltk
-from nltk.corpus import sentiwordnet as swn
+from .features import SegmentFeatures
+from .resources import NLTKResources
 from ..text_processing.segmentation import TextSegment
 
 @dataclass
@@ -15,23 +14,47 @@ class LexicalScore:
     compound_score: float
 
 class LexicalAnalyzer:
-    def __init__(self):
-        # Initialize AFINN
-        self.afinn = Afinn()
-        
-        # Download required NLTK data
-        nltk.download('sentiwordnet', quiet=True)
-        nltk.download('averaged_perceptron_tagger', quiet=True)
-        nltk.download('wordnet', quiet=True)
-        
+    def __init__(self, resources: Optional[NLTKResources] = None):
+        # AFINN, NLTK and SentiWordNet are loaded, and NLTK data verified, on first use
+        self.resources = resources or NLTKResources()
+        self._afinn = None
+        self._swn = None
+
+    @property
+    def afinn(self):
+        if self._afinn is None:
+            from afinn import Afinn
+            self._afinn = Afinn()
+        return self._afinn
+
+    @property
+    def sentiwordnet(self):
+        if self._swn is None:
+            self._swn = self.resources.sentiwordnet()
+        return self._swn
+
     def analyze_segment(self, segment: TextSegment) -> LexicalScore:
-        text = segment.text
-        
+        return self.analyze_batch([segment])[0]
+
+    def analyze_batch(self,
+                      segments: Sequence[TextSegment],
+                      features: Optional[Sequence[SegmentFeatures]] = None) -> List[LexicalScore]:
+        """Score many segments, reusing the segmenter's tokens and tags where segments carry them.
+
+        Only segments without tokens, such as preprocessed copies, go through
+        NLTK, and those are tagged together.
+        """
+        return [
+            self._score(segment.text, tagged)
+            for segment, tagged in zip(segments, self._tagged_tokens(segments, features))
+        ]
+
+    def _score(self, text: str, tagged: List[Tuple[str, str]]) -> LexicalScore:
         # Get AFINN score
         afinn_score = self.afinn.score(text)
         
         # Get SentiWordNet scores
-        pos_score, neg_score, obj_score = self._get_sentiwordnet_scores(text)
+        pos_score, neg_score, obj_score = self._get_sentiwordnet_scores(tagged)
         
         # Calculate compound score (weighted average)
         compound_score = (afinn_score + (pos_score - neg_score)) / 2
@@ -43,11 +66,26 @@ class LexicalAnalyzer:
             objective_score=obj_score,
             compound_score=compound_score
         )
+
+    def _tagged_tokens(self,
+                       segments: Sequence[TextSegment],
+                       features: Optional[Sequence[SegmentFeatures]] = None) -> List[List[Tuple[str, str]]]:
+        if features is None:
+            tagged = [getattr(segment, 'tokens', None) for segment in segments]
+        else:
+            tagged = [segment_features.tagged for segment_features in features]
+        untagged = [index for index, tokens in enumerate(tagged) if tokens is None]
+        if untagged:
+            import nltk
+
+            # Checked once per process; downloads only happen for missing packages
+            self.resources.ensure(('tokenizer', 'tagger'))
+            sentences = nltk.pos_tag_sents([nltk.word_tokenize(segments[index].text) for index in untagged])
+            for index, tokens in zip(untagged, sentences):
+                tagged[index] = tokens
+        return tagged
     
-    def _get_sentiwordnet_scores(self, text: str) -> tuple[float, float, float]:
-        tokens = nltk.word_tokenize(text)
-        tagged = nltk.pos_tag(tokens)
-        
+    def _get_sentiwordnet_scores(self, tagged: List[Tuple[str, str]]) -> tuple[float, float, float]:
         pos_score = 0.0
         neg_score = 0.0
         obj_score = 0.0
@@ -57,14 +95,12 @@ class LexicalAnalyzer:
             # Convert POS tag to WordNet format
             pos = self._get_wordnet_pos(tag)
             if pos:
-                # Get SentiWordNet synsets
-                synsets = list(swn.senti_synsets(word, pos))
-                if synsets:
-                    # Average scores for all synsets
-                    synset = synsets[0]  # Use first synset
-                    pos_score += synset.pos_score()
-                    neg_score += synset.neg_score()
-                    obj_score += synset.obj_score()
+                # Scores of the first SentiWordNet synset
+                scores = self.sentiwordnet.word_scores(word, pos)
+                if scores is not None:
+                    pos_score += scores[0]
+                    neg_score += scores[1]
+                    obj_score += scores[2]
                     count += 1
         
         if count > 0:
@@ -1,8 +1,29 @@
 from dataclasses import dataclass
-from typing import List, Dict, Set
+from typing import AbstractSet, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 import re
-from collections import Counter
+from collections import Counter, defaultdict
+from .features import SegmentFeatures, WORD_SEPARATORS
 from ..text_processing.segmentation import TextSegment
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Every pattern here runs in linear time; nothing relies on backtracking
+CAPITALIZATION_PATTERN = re.compile(r'\b[A-Z]{2,}\b')
+MULTIPLE_PUNCTUATION_PATTERN = re.compile(r'[!?]{2,}')
+QUESTION_WORD_PATTERN = re.compile(r'\b(?:why|how|what|when|where|who)\b')
+
+# Repeated phrases made only of these words are not parallel structure
+FUNCTION_WORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'but', 'of', 'to', 'in', 'on', 'at', 'for', 'with', 'by',
+    'from', 'as', 'is', 'was', 'are', 'were', 'be', 'it', 'its', 'this', 'that', 'he', 'she',
+    'they', 'i', 'you', 'we', 'his', 'her', 'their', 'not', 's', 't'
+})
+
+@dataclass
+class PragmaticConfig:
+    parallel_ngram: int = 2  # Words in a repeated phrase that counts as parallel structure
+    max_pattern_chars: int = 100_000  # Longer segments skip the emphasis and rhetorical pattern checks
 
 @dataclass
 class DiscourseFeatures:
@@ -19,8 +40,43 @@ class PragmaticScore:
     certainty_level: float
     formality_level: float
 
+class PhraseMatcher:
+    """Counts the distinct phrases of each category found in a lowercased text.
+
+    The text is split into words once and single-word phrases are found with one
+    set intersection. Multi-word phrases run a precompiled pattern only when their
+    first word occurs. Matching is on whole words, so "so" does not match inside
+    "also". A phrase may belong to several categories.
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        phrase_categories = defaultdict(tuple)
+        for category, phrases in categories.items():
+            for phrase in phrases:
+                phrase_categories[' '.join(phrase.split())] += (category,)
+        self.categories: Dict[str, Tuple[str, ...]] = dict(phrase_categories)
+        self._single = {phrase for phrase in self.categories if ' ' not in phrase}
+        self._multi = [
+            (phrase.split()[0], re.compile(r'\b' + r'\s+'.join(map(re.escape, phrase.split())) + r'\b'), phrase)
+            for phrase in self.categories if ' ' in phrase
+        ]
+
+    def count(self, text: str, words: Optional[AbstractSet[str]] = None) -> Dict[str, int]:
+        """Count phrases in ``text``; ``words`` is its word set when the caller already has it."""
+        if words is None:
+            words = set(text.translate(WORD_SEPARATORS).split())
+        found = self._single & words
+        found.update(phrase for first, pattern, phrase in self._multi if first in words and pattern.search(text))
+
+        counts: Dict[str, int] = Counter()
+        for phrase in found:
+            for category in self.categories[phrase]:
+                counts[category] += 1
+        return counts
+
 class PragmaticAnalyzer:
-    def __init__(self):
+    def __init__(self, config: Optional[PragmaticConfig] = None):
+        self.config = config or PragmaticConfig()
         self.discourse_markers = {
             'causal': {'because', 'therefore', 'thus', 'hence', 'so'},
             'contrast': {'however', 'but', 'although', 'nevertheless', 'yet'},
@@ -38,24 +94,65 @@ class PragmaticAnalyzer:
             'like', 'well', 'you know', 'kind of', 'sort of', 'basically',
             'actually', 'pretty much', 'stuff', 'things'
         }
+
+        self.certainty_indicators = {
+            'certainly', 'definitely', 'surely', 'clearly',
+            'undoubtedly', 'absolutely', 'obviously'
+        }
+
+        self.uncertainty_indicators = {
+            'maybe', 'perhaps', 'possibly', 'probably',
+            'might', 'could', 'may', 'seems'
+        }
+
+        self.comparison_indicators = {'like', 'as', 'than'}
+
+        # All word lists are matched together, with one split per segment
+        self.matcher = PhraseMatcher({
+            **self.discourse_markers,
+            'formal': self.formal_indicators,
+            'informal': self.informal_indicators,
+            'certainty': self.certainty_indicators,
+            'uncertainty': self.uncertainty_indicators,
+            'comparison': self.comparison_indicators
+        })
         
-    def analyze_segment(self, segment: TextSegment) -> PragmaticScore:
-        text = segment.text
-        
+    def analyze_segment(self, segment: TextSegment, features: Optional[SegmentFeatures] = None) -> PragmaticScore:
+        features = features or SegmentFeatures.from_segment(segment)
+        return self._score(features, self.matcher.count(features.lower, features.token_set))
+
+    def analyze_batch(self,
+                      segments: Sequence[TextSegment],
+                      features: Optional[Sequence[SegmentFeatures]] = None) -> List[PragmaticScore]:
+        """Analyze many segments; segments with the same text share one score."""
+        scores: Dict[str, PragmaticScore] = {}
+        for index, segment in enumerate(segments):
+            if segment.text not in scores:
+                scores[segment.text] = self.analyze_segment(segment, features[index] if features else None)
+        return [scores[segment.text] for segment in segments]
+
+    def _score(self, features: SegmentFeatures, counts: Dict[str, int]) -> PragmaticScore:
         # Analyze discourse markers
-        markers = self._identify_discourse_markers(text)
+        markers = self._identify_discourse_markers(counts)
         
-        # Identify emphasis patterns
-        emphasis = self._identify_emphasis_patterns(text)
-        
-        # Detect rhetorical devices
-        rhetorical = self._identify_rhetorical_devices(text)
+        # The pattern checks are linear, so capping the input bounds their cost
+        # while keeping the score independent of machine load
+        if len(features.text) > self.config.max_pattern_chars:
+            logger.warning("Segment of %d characters is over max_pattern_chars, skipped pattern checks",
+                           len(features.text))
+            emphasis, rhetorical = [], []
+        else:
+            # Identify emphasis patterns
+            emphasis = self._identify_emphasis_patterns(features)
+            
+            # Detect rhetorical devices
+            rhetorical = self._identify_rhetorical_devices(features, counts)
         
         # Calculate formality score
-        formality = self._calculate_formality(text)
+        formality = self._calculate_formality(counts)
         
         # Find repetition patterns
-        repetition = self._identify_repetition(text)
+        repetition = self._identify_repetition(features.words)
         
         # Calculate emotional intensity based on features
         emotional_intensity = self._calculate_emotional_intensity(
@@ -63,7 +160,7 @@ class PragmaticAnalyzer:
         )
         
         # Calculate certainty level
-        certainty = self._calculate_certainty_level(markers, text)
+        certainty = self._calculate_certainty_level(markers, counts)
         
         return PragmaticScore(
             features=DiscourseFeatures(
@@ -78,63 +175,78 @@ class PragmaticAnalyzer:
             formality_level=formality
         )
     
-    def _identify_discourse_markers(self, text: str) -> Dict[str, int]:
-        text_lower = text.lower()
-        markers = {}
-        
-        for category, words in self.discourse_markers.items():
-            count = sum(1 for word in words if word in text_lower)
-            if count > 0:
-                markers[category] = count
-                
-        return markers
+    def _identify_discourse_markers(self, counts: Dict[str, int]) -> Dict[str, int]:
+        return {category: counts[category] for category in self.discourse_markers if counts.get(category, 0) > 0}
     
-    def _identify_emphasis_patterns(self, text: str) -> List[str]:
-        patterns = []
-        
-        # Check for capitalization emphasis
-        if re.search(r'\b[A-Z]{2,}\b', text):
-            patterns.append('capitalization')
-            
-        # Check for repetitive punctuation
-        if re.search(r'[!?]{2,}', text):
-            patterns.append('multiple_punctuation')
-            
-        # Check for italics markers
-        if re.search(r'[*_].+?[*_]', text):
-            patterns.append('italics_markers')
-            
-        return patterns
+    def _identify_emphasis_patterns(self, features: SegmentFeatures) -> List[str]:
+        text = features.text
+        return self._run_checks([
+            # Capitalization emphasis
+            ('capitalization', lambda: CAPITALIZATION_PATTERN.search(text)),
+            # Repetitive punctuation, needing at least two of '!' and '?'
+            ('multiple_punctuation', lambda: features.count('!') + features.count('?') >= 2
+                and MULTIPLE_PUNCTUATION_PATTERN.search(text)),
+            # Italics markers, needing at least two of '*' and '_'
+            ('italics_markers', lambda: features.count('*') + features.count('_') >= 2
+                and self._has_italics_markers(text))
+        ])
     
-    def _identify_rhetorical_devices(self, text: str) -> List[str]:
-        devices = []
-        
-        # Check for rhetorical questions
-        if re.search(r'\b(?:why|how|what|when|where|who)\b.*\?', text.lower()):
-            devices.append('rhetorical_question')
-            
-        # Check for parallel structures
-        if re.search(r'(\b\w+\b).*\1', text):
-            devices.append('parallel_structure')
-            
-        # Check for comparative structures
-        if any(word in text.lower() for word in ['like', 'as', 'than']):
-            devices.append('comparison')
-            
-        return devices
+    def _identify_rhetorical_devices(self,
+                                     features: SegmentFeatures,
+                                     counts: Dict[str, int]) -> List[str]:
+        return self._run_checks([
+            # Rhetorical questions
+            ('rhetorical_question', lambda: features.count('?') and self._has_question(features.lower)),
+            # Parallel structures
+            ('parallel_structure', lambda: self._has_parallel_structure(features.tokens)),
+            # Comparative structures
+            ('comparison', lambda: counts.get('comparison', 0) > 0)
+        ])
+
+    def _run_checks(self, checks: List[Tuple[str, Callable[[], object]]]) -> List[str]:
+        return [name for name, check in checks if check()]
+
+    def _has_italics_markers(self, text: str) -> bool:
+        # Two of '*' or '_' on one line with something between them
+        for line in text.split('\n'):
+            positions = [p for p in (line.find('*'), line.find('_'), line.rfind('*'), line.rfind('_')) if p >= 0]
+            if positions and max(positions) - min(positions) >= 2:
+                return True
+        return False
+
+    def _has_question(self, text: str) -> bool:
+        # A question word before the last '?' of the same line
+        for line in text.split('\n'):
+            end = line.rfind('?')
+            if end > 0 and QUESTION_WORD_PATTERN.search(line, 0, end):
+                return True
+        return False
+
+    def _has_parallel_structure(self, words: List[str]) -> bool:
+        """True if a run of ``parallel_ngram`` words, not all function words, occurs twice.
+
+        Each n-gram of the word array is hashed into a set once, so the check takes
+        O(words * parallel_ngram) time and memory however the text repeats itself.
+        """
+        n = self.config.parallel_ngram
+        seen = set()
+        for ngram in zip(*(words[i:] for i in range(n))):
+            if ngram in seen:
+                return True
+            if not FUNCTION_WORDS.issuperset(ngram):
+                seen.add(ngram)
+        return False
     
-    def _calculate_formality(self, text: str) -> float:
-        text_lower = text.lower()
-        formal_count = sum(1 for word in self.formal_indicators if word in text_lower)
-        informal_count = sum(1 for word in self.informal_indicators if word in text_lower)
+    def _calculate_formality(self, counts: Dict[str, int]) -> float:
+        formal_count = counts.get('formal', 0)
+        informal_count = counts.get('informal', 0)
         
         if formal_count + informal_count == 0:
             return 0.5
         
         return formal_count / (formal_count + informal_count)
     
-    def _identify_repetition(self, text: str) -> List[str]:
-        words = text.lower().split()
+    def _identify_repetition(self, words: List[str]) -> List[str]:
         word_counts = Counter(words)
         
         return [word for word, count in word_counts.items() 
@@ -163,19 +275,9 @@ class PragmaticAnalyzer:
     
     def _calculate_certainty_level(self, 
                                  markers: Dict[str, int], 
-                                 text: str) -> float:
-        certainty_indicators = {
-            'certainly', 'definitely', 'surely', 'clearly',
-            'undoubtedly', 'absolutely', 'obviously'
-        }
-        uncertainty_indicators = {
-            'maybe', 'perhaps', 'possibly', 'probably',
-            'might', 'could', 'may', 'seems'
-        }
-        
-        text_lower = text.lower()
-        certainty_count = sum(1 for word in certainty_indicators if word in text_lower)
-        uncertainty_count = sum(1 for word in uncertainty_indicators if word in text_lower)
+                                 counts: Dict[str, int]) -> float:
+        certainty_count = counts.get('certainty', 0)
+        uncertainty_count = counts.get('uncertainty', 0)
         
         # Add emphasis markers as certainty indicators
         certainty_count += markers.get('emphasis', 0)
@@ -0,0 +1,270 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+import hashlib
+import os
+import tempfile
+import threading
+import numpy as np
+
+from ..utils.exceptions import ModelLoadError
+
+# (download package, data path) per resource. NLTK 3.8.2 replaced the pickled
+# punkt and tagger models with tab/JSON based packages under new names.
+NLTK_RESOURCES = {
+    'tokenizer': ('punkt_tab', 'tokenizers/punkt_tab/english/'),
+    'tagger': ('averaged_perceptron_tagger_eng', 'taggers/averaged_perceptron_tagger_eng/'),
+    'wordnet': ('wordnet', 'corpora/wordnet/'),
+    'sentiwordnet': ('sentiwordnet', 'corpora/sentiwordnet/SentiWordNet_3.0.0.txt'),
+}
+LEGACY_NLTK_RESOURCES = {
+    'tokenizer': ('punkt', 'tokenizers/punkt/'),
+    'tagger': ('averaged_perceptron_tagger', 'taggers/averaged_perceptron_tagger/'),
+}
+
+# Bump when the SentiWordNetTable file layout or key hashing changes
+TABLE_FORMAT = 1
+
+# Verification and the parsed SentiWordNet tables are shared by the whole process
+_lock = threading.Lock()
+_verified: Set[Tuple[Optional[str], str]] = set()
+_lookups: Dict[str, "SentiWordNetLookup"] = {}
+_tables: Dict[str, "SentiWordNetTable"] = {}
+
+@dataclass
+class NLTKResourceConfig:
+    data_dir: Optional[str] = None  # Preprovisioned nltk_data directory, searched before NLTK's defaults
+    allow_download: bool = True  # Fetch missing packages; disable on offline workers to fail fast
+    table_dir: Optional[str] = None  # Where the precomputed SentiWordNetTable is kept; built on first use
+
+class NLTKResources:
+    """Makes sure the NLTK data used by lexical analysis is available.
+
+    Presence is checked against the local data directories once per process and
+    nothing touches the network unless a package is actually missing. NLTK's own
+    ``NLTK_DATA`` environment variable is honoured as well as ``data_dir``.
+    """
+
+    def __init__(self, config: Optional[NLTKResourceConfig] = None):
+        self.config = config or NLTKResourceConfig()
+
+    def ensure(self, names: Iterable[str] = tuple(NLTK_RESOURCES)) -> None:
+        """Verify, and if allowed download, the named resources (all by default)."""
+        with _lock:
+            names = [name for name in names if (self.config.data_dir, name) not in _verified]
+            if not names:
+                return
+            import nltk
+
+            if self.config.data_dir and self.config.data_dir not in nltk.data.path:
+                nltk.data.path.insert(0, self.config.data_dir)
+
+            resources = self._resources()
+            required = [resources[name] for name in names]
+            missing = [package for package, path in required if not self._exists(path)]
+            if missing and self.config.allow_download:
+                for package in missing:
+                    nltk.download(package, download_dir=self.config.data_dir, quiet=True)
+                missing = [package for package, path in required if not self._exists(path)]
+            if missing:
+                target = f" -d {self.config.data_dir}" if self.config.data_dir else ""
+                raise ModelLoadError(
+                    f"Missing NLTK data: {', '.join(missing)}. "
+                    f"Provision it with: python -m nltk.downloader{target} {' '.join(missing)}"
+                )
+            _verified.update((self.config.data_dir, name) for name in names)
+
+    def sentiwordnet(self):
+        """Word scorer: the SentiWordNetTable when ``table_dir`` is set, else the SentiWordNetLookup."""
+        if self.config.table_dir:
+            return self.sentiwordnet_table()
+        return self.sentiwordnet_lookup()
+
+    def sentiwordnet_table(self) -> "SentiWordNetTable":
+        """Memory-map the precomputed word table, building and saving it if missing."""
+        import nltk
+
+        path = os.path.join(self.config.table_dir, f"sentiwordnet-v{TABLE_FORMAT}-nltk{nltk.__version__}.npy")
+        with _lock:
+            if path in _tables:
+                return _tables[path]
+        if not os.path.exists(path):
+            SentiWordNetTable.build(self.sentiwordnet_lookup()).save(path)
+        with _lock:
+            return _tables.setdefault(path, SentiWordNetTable.load(path))
+
+    def sentiwordnet_lookup(self) -> "SentiWordNetLookup":
+        """Return the process-wide SentiWordNet synset scores, parsing them on first use."""
+        self.ensure(('wordnet', 'sentiwordnet'))
+        import nltk
+
+        pointer = nltk.data.find(self._resources()['sentiwordnet'][1])
+        key = str(pointer)
+        with _lock:
+            if key not in _lookups:
+                with pointer.open(encoding='utf-8') as source:
+                    _lookups[key] = SentiWordNetLookup.parse(source)
+            return _lookups[key]
+
+    def _resources(self) -> Dict[str, Tuple[str, str]]:
+        from nltk import tokenize
+
+        resources = dict(NLTK_RESOURCES)
+        if not hasattr(tokenize, 'PunktTokenizer'):
+            resources.update(LEGACY_NLTK_RESOURCES)
+        return resources
+
+    def _exists(self, path: str) -> bool:
+        import nltk
+
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            return False
+        return True
+
+class SentiWordNetLookup:
+    """SentiWordNet scores held as two sorted numpy columns instead of a dict of tuples.
+
+    Keys pack the part of speech and synset offset into one int64, so a lookup is
+    a binary search and the whole table takes a couple of megabytes.
+    """
+
+    def __init__(self, keys: np.ndarray, scores: np.ndarray):
+        self.keys = keys
+        self.scores = scores
+        self._memo: Dict[str, Dict[str, Optional[Tuple[float, float, float]]]] = {}
+
+    @classmethod
+    def parse(cls, lines) -> "SentiWordNetLookup":
+        keys = []
+        scores = []
+        for line in lines:
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            fields = line.split('\t')
+            pos, offset = fields[0].strip(), fields[1].strip()
+            if pos and offset:
+                keys.append(cls._key(pos, int(offset)))
+                scores.append((float(fields[2]), float(fields[3])))
+
+        keys = np.array(keys, dtype=np.int64)
+        order = np.argsort(keys, kind='stable')
+        return cls(keys[order], np.array(scores, dtype=np.float32).reshape(-1, 2)[order])
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def synset_scores(self, pos: str, offset: int) -> Optional[Tuple[float, float, float]]:
+        """(positive, negative, objective) scores of one synset, or None if unknown."""
+        key = self._key('a' if pos == 's' else pos, offset)
+        index = int(np.searchsorted(self.keys, key))
+        if index == len(self.keys) or self.keys[index] != key:
+            return None
+        pos_score, neg_score = (float(score) for score in self.scores[index])
+        return pos_score, neg_score, 1.0 - (pos_score + neg_score)
+
+    def word_scores(self, word: str, pos: str) -> Optional[Tuple[float, float, float]]:
+        """Scores of the first WordNet sense of ``word`` that SentiWordNet covers, memoized."""
+        word = word.lower()
+        memo = self._memo.setdefault(pos, {})
+        if word not in memo:
+            memo[word] = self.first_sense_scores(word, pos)
+        return memo[word]
+
+    def first_sense_scores(self, word: str, pos: str) -> Optional[Tuple[float, float, float]]:
+        """Like ``word_scores`` but not memoized, for one-off passes over the vocabulary."""
+        from nltk.corpus import wordnet
+
+        for synset in wordnet.synsets(word.lower(), pos):
+            scores = self.synset_scores(synset.pos(), synset.offset())
+            if scores is not None:
+                return scores
+        return None
+
+    @staticmethod
+    def _key(pos: str, offset: int) -> int:
+        return ord(pos) << 32 | offset
+
+class SentiWordNetTable:
+    """First-sense SentiWordNet scores for every word form WordNet can resolve.
+
+    Built once from SentiWordNetLookup over all lemma names, morphological
+    exceptions and regular inflections, so scoring a token never touches WordNet.
+    The file is a (2, N) uint64 array: sorted 64-bit key hashes, then each row's
+    float32 positive and negative scores packed into 64 bits. It is memory-mapped,
+    and per-word row numbers are memoized in a dict in front of it.
+    """
+
+    def __init__(self, table: np.ndarray):
+        self.table = table
+        self.keys = table[0]
+        self.scores = table[1].view(np.float32).reshape(-1, 2)
+        self._rows: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def build(cls, lookup: SentiWordNetLookup) -> "SentiWordNetTable":
+        from nltk.corpus import wordnet
+
+        # Unmemoized, so the lookup does not keep every form of the vocabulary alive
+        rows = {}
+        for word, pos in cls._forms(wordnet):
+            scores = lookup.first_sense_scores(word, pos)
+            if scores is not None:
+                rows[cls._key(word, pos)] = scores[:2]
+        ordered = sorted(rows)
+        keys = np.array(ordered, dtype=np.uint64)
+        scores = np.array([rows[key] for key in ordered], dtype=np.float32).reshape(-1, 2)
+        return cls(np.stack([keys, scores.view(np.uint64).ravel()]))
+
+    @classmethod
+    def load(cls, path: str) -> "SentiWordNetTable":
+        return cls(np.load(path, mmap_mode='r'))
+
+    def save(self, path: str) -> None:
+        # Written to a temporary file first, so concurrent readers never see a partial table
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, np.ascontiguousarray(self.table))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def word_scores(self, word: str, pos: str) -> Optional[Tuple[float, float, float]]:
+        """(positive, negative, objective) scores of ``word``, or None if WordNet has no sense."""
+        word = word.lower()
+        rows = self._rows.setdefault(pos, {})
+        row = rows.get(word)
+        if row is None:
+            key = self._key(word, pos)
+            index = int(np.searchsorted(self.keys, key))
+            row = rows[word] = index if index < len(self.keys) and self.keys[index] == key else -1
+        if row < 0:
+            return None
+        pos_score, neg_score = (float(score) for score in self.scores[row])
+        return pos_score, neg_score, 1.0 - (pos_score + neg_score)
+
+    @staticmethod
+    def _forms(wordnet) -> Iterator[Tuple[str, str]]:
+        # Everything WordNet's morphy resolves: lemmas, exception-list words and
+        # lemmas with each suffix rule inverted
+        for pos in ('n', 'v', 'a', 'r'):
+            lemmas = set(wordnet.all_lemma_names(pos))
+            forms = lemmas | set(wordnet._exception_map[pos])
+            for suffix, ending in wordnet.MORPHOLOGICAL_SUBSTITUTIONS[pos]:
+                forms.update(
+                    lemma[:len(lemma) - len(ending)] + suffix for lemma in lemmas if lemma.endswith(ending)
+                )
+            for form in forms:
+                yield form, pos
+
+    @staticmethod
+    def _key(word: str, pos: str) -> np.uint64:
+        digest = hashlib.blake2b(f"{pos}\0{word}".encode('utf-8'), digest_size=8).digest()
+        return np.uint64(int.from_bytes(digest, 'little'))
\ No newline at end of file
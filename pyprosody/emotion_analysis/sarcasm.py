@@ -1,8 +1,17 @@
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 import re
+from .features import SegmentFeatures
 from ..text_processing.segmentation import TextSegment
 
+# Repeated or mixed sentence punctuation
+PUNCTUATION_PATTERNS = [
+    re.compile(r'[!?]{2,}'),          # Multiple ! or ?
+    re.compile(r'[!?][.!?]+'),        # Mixed punctuation
+    re.compile(r'\.{3,}'),            # Ellipsis
+    re.compile(r'(!|\?)\s*\1{1,}')    # Repeated ! or ? with possible spaces
+]
+
 @dataclass
 class SarcasmFeatures:
     punctuation_patterns: bool
@@ -30,29 +39,30 @@ class SarcasmDetector:
         }
         
     def detect_sarcasm(self, segment: TextSegment, 
-                      context_segments: Optional[List[TextSegment]] = None) -> SarcasmScore:
-        text = segment.text
+                      context_segments: Optional[List[TextSegment]] = None,
+                      segment_features: Optional[SegmentFeatures] = None) -> SarcasmScore:
+        segment_features = segment_features or SegmentFeatures.from_segment(segment)
         features = []
         
         # Check punctuation patterns
-        punctuation_pattern = self._check_punctuation_patterns(text)
+        punctuation_pattern = self._check_punctuation_patterns(segment_features)
         if punctuation_pattern:
             features.append("Unusual punctuation patterns detected")
             
         # Check for intensifiers
-        intensifiers = self._check_intensifiers(text)
+        intensifiers = self._check_intensifiers(segment_features)
         if intensifiers:
             features.append("Excessive use of intensifiers")
             
         # Check for sentiment contrast
-        sentiment_contrast = self._check_sentiment_contrast(text)
+        sentiment_contrast = self._check_sentiment_contrast(segment_features)
         if sentiment_contrast:
             features.append("Contrasting sentiment indicators")
             
         # Check context incongruity
         context_incongruity = False
         if context_segments:
-            context_incongruity = self._check_context_incongruity(segment, context_segments)
+            context_incongruity = self._check_context_incongruity(segment_features, context_segments)
             if context_incongruity:
                 features.append("Contextual incongruity detected")
         
@@ -82,33 +92,27 @@ class SarcasmDetector:
             confidence=confidence
         )
     
-    def _check_punctuation_patterns(self, text: str) -> bool:
-        # Check for repeated punctuation or mixed punctuation
-        patterns = [
-            r'[!?]{2,}',          # Multiple ! or ?
-            r'[!?][.!?]+',        # Mixed punctuation
-            r'\.{3,}',            # Ellipsis
-            r'(!|\?)\s*\1{1,}'    # Repeated ! or ? with possible spaces
-        ]
-        return any(re.search(pattern, text) for pattern in patterns)
+    def _check_punctuation_patterns(self, features: SegmentFeatures) -> bool:
+        # Every pattern needs a '!', a '?' or three '.'
+        if not (features.count('!') or features.count('?') or features.count('.') >= 3):
+            return False
+        return any(pattern.search(features.text) for pattern in PUNCTUATION_PATTERNS)
     
-    def _check_intensifiers(self, text: str) -> bool:
-        words = text.lower().split()
-        intensifier_count = sum(1 for word in words if word in self.intensifier_words)
+    def _check_intensifiers(self, features: SegmentFeatures) -> bool:
+        intensifier_count = sum(1 for word in features.words if word in self.intensifier_words)
         return intensifier_count >= 2
     
-    def _check_sentiment_contrast(self, text: str) -> bool:
+    def _check_sentiment_contrast(self, features: SegmentFeatures) -> bool:
         # Check for positive phrases in negative contexts or vice versa
-        words = text.lower().split()
-        positive_count = sum(1 for word in words if word in self.positive_phrases)
-        has_negation = any(neg in text.lower() for neg in ['not', "n't", 'never'])
-        return positive_count > 0 and has_negation
+        if self.positive_phrases.isdisjoint(features.word_set):
+            return False
+        return any(neg in features.lower for neg in ['not', "n't", 'never'])
     
     def _check_context_incongruity(self, 
-                                 segment: TextSegment, 
+                                 features: SegmentFeatures, 
                                  context_segments: List[TextSegment]) -> bool:
         # Simple check for tonal shift between segments
-        current_words = set(segment.text.lower().split())
+        current_words = features.word_set
         context_words = set()
         
         for ctx_segment in context_segments:
@@ -0,0 +1,325 @@
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+
+from .combiner import EmotionProfile
+from ..text_processing.segmentation import TextSegment
+
+# Fixed column layouts; keys outside them are kept in a sparse side table
+EMOTION_TYPES = ('joy', 'sadness', 'anger', 'fear', 'surprise')
+SENTIMENT_FIELDS = ('polarity', 'objectivity')
+MARKER_FIELDS = ('speed_factor', 'pitch_shift', 'volume_adjust', 'emphasis_level')
+MAX_FEATURE_FLAGS = 64
+
+class ProfileStore:
+    """Columnar store of EmotionProfiles for a whole document.
+
+    Scores live in float32 arrays over a fixed emotion axis, sarcasm features
+    are interned into per-profile bit flags, attention weights share one word
+    vocabulary in CSR form, and model versions are interned. Indexing returns a
+    ProfileView that reads like an EmotionProfile without materializing one.
+    """
+
+    def __init__(self, emotion_types: Sequence[str] = EMOTION_TYPES, capacity: int = 1024):
+        self.emotion_types = tuple(emotion_types)
+        self._emotion_columns = {emotion_type: i for i, emotion_type in enumerate(self.emotion_types)}
+        self._size = 0
+
+        # Per-profile columns; NaN marks a key the profile did not have
+        self.sentiment = np.full((capacity, len(SENTIMENT_FIELDS)), np.nan, dtype=np.float32)
+        self.intensities = np.zeros((capacity, len(self.emotion_types)), dtype=np.float32)
+        self.sarcasm = np.full(capacity, np.nan, dtype=np.float32)
+        self.feature_flags = np.zeros(capacity, dtype=np.uint64)
+        self.markers = np.full((capacity, len(MARKER_FIELDS)), np.nan, dtype=np.float32)
+        self.timestamps = np.full(capacity, np.nan, dtype=np.float64)
+        self.processing_time = np.full(capacity, np.nan, dtype=np.float32)
+        self.version_ids = np.full(capacity, -1, dtype=np.int16)
+        self.attention_offsets = np.zeros(capacity + 1, dtype=np.int64)
+        self.segments: List[Optional[TextSegment]] = []
+        self.segment_ids: List[str] = []
+
+        # Shared tables
+        self.attention_words = np.zeros(capacity, dtype=np.int32)
+        self.attention_weights = np.zeros(capacity, dtype=np.float32)
+        self.words: List[str] = []
+        self._word_ids: Dict[str, int] = {}
+        self.features: List[str] = []
+        self._feature_bits: Dict[str, int] = {}
+        self.versions: List[str] = []
+        self._extras: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> "ProfileView":
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("profile index out of range")
+        return ProfileView(self, index)
+
+    def __iter__(self) -> Iterator["ProfileView"]:
+        for index in range(self._size):
+            yield ProfileView(self, index)
+
+    def extend(self, profiles: Iterable[EmotionProfile]) -> None:
+        for profile in profiles:
+            self.append(profile)
+
+    def append(self, profile: EmotionProfile) -> int:
+        """Copy a profile into the columns and return its index."""
+        index = self._size
+        if index == len(self.sarcasm):
+            self._grow_rows(2 * index)
+        self._size += 1
+        extras: Dict[str, Any] = {}
+
+        self.segments.append(profile.text_reference)
+        self.segment_ids.append(profile.segment_id)
+        self._store_fields(self.sentiment[index], SENTIMENT_FIELDS, profile.basic_sentiment, extras, 'basic_sentiment')
+        self._store_fields(self.markers[index], MARKER_FIELDS, profile.prosody_markers, extras, 'prosody_markers')
+
+        for emotion in profile.complex_emotions:
+            column = self._emotion_columns.get(emotion.get('type', emotion.get('emotion_type')))
+            if column is None:
+                extras.setdefault('complex_emotions', []).append(emotion)
+            else:
+                self.intensities[index, column] += emotion['intensity']
+
+        sarcasm = dict(profile.sarcasm_indicators)
+        if 'probability' in sarcasm:
+            self.sarcasm[index] = sarcasm.pop('probability')
+        for feature in sarcasm.pop('features', []):
+            bit = self._feature_bit(feature)
+            if bit is None:
+                extras.setdefault('features', []).append(feature)
+            else:
+                self.feature_flags[index] |= np.uint64(1 << bit)
+        if sarcasm:
+            extras['sarcasm_indicators'] = sarcasm
+
+        metadata = dict(profile.metadata)
+        timestamp = metadata.pop('timestamp', None)
+        if isinstance(timestamp, datetime):
+            self.timestamps[index] = timestamp.timestamp()
+        elif timestamp is not None:
+            metadata['timestamp'] = timestamp
+        if 'processing_time' in metadata:
+            self.processing_time[index] = metadata.pop('processing_time')
+        if 'model_version' in metadata:
+            self.version_ids[index] = self._intern_version(metadata.pop('model_version'))
+        self._store_attention(index, metadata.pop('attention_weights', {}))
+        if metadata:
+            extras['metadata'] = metadata
+
+        if extras:
+            self._extras[index] = extras
+        return index
+
+    def profile(self, index: int) -> EmotionProfile:
+        """Materialize a full EmotionProfile for one row."""
+        view = self[index]
+        return EmotionProfile(
+            segment_id=view.segment_id,
+            text_reference=view.text_reference,
+            basic_sentiment=view.basic_sentiment,
+            complex_emotions=view.complex_emotions,
+            sarcasm_indicators=view.sarcasm_indicators,
+            prosody_markers=view.prosody_markers,
+            metadata=view.metadata
+        )
+
+    def blend(self,
+              sources: Sequence[Sequence[Tuple[int, float]]],
+              attention_sources: Sequence[Sequence[int]]) -> "ProfileStore":
+        """New store with one row per entry of ``sources``, a weighted average of (row, weight) pairs.
+
+        Sentiment, sarcasm probability and emotion intensities are averaged on the
+        columns; the first row of each entry is the new row's own and supplies
+        everything else. Attention weights are the per-word maximum over the rows
+        in ``attention_sources``.
+        """
+        size = len(sources)
+        blended = ProfileStore(self.emotion_types, capacity=size)
+        if not size:
+            return blended
+
+        # Flattened (unit, row, weight) triples of a sparse weight matrix
+        units = np.repeat(np.arange(size), [len(entry) for entry in sources])
+        rows = np.array([row for entry in sources for row, _ in entry], dtype=np.int64)
+        weights = np.array([weight for entry in sources for _, weight in entry], dtype=np.float64)
+        totals = np.bincount(units, weights=weights, minlength=size)
+
+        def average(column: np.ndarray) -> np.ndarray:
+            weighted = column[rows].astype(np.float64) * weights.reshape((-1,) + (1,) * (column.ndim - 1))
+            summed = np.zeros((size,) + column.shape[1:])
+            np.add.at(summed, units, weighted)
+            return summed / totals.reshape((-1,) + (1,) * (column.ndim - 1))
+
+        # Missing values count as neutral, as in SynthesisUnitSelector._aggregate
+        sentiment = self.sentiment[:self._size]
+        neutral = np.where(np.isnan(sentiment), np.array([0.0, 0.5], dtype=np.float32), sentiment)
+        blended.sentiment[:] = average(neutral)
+        blended.sarcasm[:] = average(np.nan_to_num(self.sarcasm[:self._size]))
+        blended.intensities[:] = average(self.intensities[:self._size])
+
+        own = np.array([entry[0][0] for entry in sources], dtype=np.int64)
+        for name in ('feature_flags', 'markers', 'timestamps', 'processing_time', 'version_ids'):
+            getattr(blended, name)[:] = getattr(self, name)[own]
+        blended.segments = [self.segments[row] for row in own]
+        blended.segment_ids = [self.segment_ids[row] for row in own]
+        blended.features = list(self.features)
+        blended._feature_bits = dict(self._feature_bits)
+        blended.versions = list(self.versions)
+        blended._size = size
+
+        for index, (row, attention_rows) in enumerate(zip(own, attention_sources)):
+            extras = {key: dict(value) if isinstance(value, dict) else list(value)
+                      for key, value in self._extras.get(int(row), {}).items()}
+            extras.setdefault('metadata', {})['aggregated_from'] = [
+                self.segment_ids[source] for source, _ in sources[index]
+            ]
+            blended._extras[index] = extras
+
+            attention: Dict[str, float] = {}
+            for source in attention_rows:
+                start, end = self.attention_offsets[source], self.attention_offsets[source + 1]
+                for word_id, weight in zip(self.attention_words[start:end], self.attention_weights[start:end]):
+                    word = self.words[word_id]
+                    attention[word] = max(attention.get(word, 0.0), float(weight))
+            blended._store_attention(index, attention)
+        return blended
+
+    def _store_fields(self,
+                      row: np.ndarray,
+                      fields: Sequence[str],
+                      values: Dict[str, Any],
+                      extras: Dict[str, Any],
+                      name: str) -> None:
+        other = {}
+        for key, value in values.items():
+            if key in fields and isinstance(value, (int, float)):
+                row[fields.index(key)] = value
+            else:
+                other[key] = value
+        if other:
+            extras[name] = other
+
+    def _store_attention(self, index: int, attention_weights: Dict[str, float]) -> None:
+        start = self.attention_offsets[index]
+        end = start + len(attention_weights)
+        if end > len(self.attention_words):
+            new_size = max(end, 2 * len(self.attention_words))
+            self.attention_words = np.resize(self.attention_words, new_size)
+            self.attention_weights = np.resize(self.attention_weights, new_size)
+        for position, (word, weight) in enumerate(attention_weights.items(), start):
+            word_id = self._word_ids.get(word)
+            if word_id is None:
+                word_id = self._word_ids[word] = len(self.words)
+                self.words.append(word)
+            self.attention_words[position] = word_id
+            self.attention_weights[position] = weight
+        self.attention_offsets[index + 1] = end
+
+    def _feature_bit(self, feature: str) -> Optional[int]:
+        bit = self._feature_bits.get(feature)
+        if bit is None and len(self.features) < MAX_FEATURE_FLAGS:
+            bit = self._feature_bits[feature] = len(self.features)
+            self.features.append(feature)
+        return bit
+
+    def _intern_version(self, version: str) -> int:
+        if version not in self.versions:
+            self.versions.append(version)
+        return self.versions.index(version)
+
+    def _grow_rows(self, capacity: int) -> None:
+        capacity = max(capacity, 1)
+        for name, fill in (('sentiment', np.nan), ('intensities', 0.0), ('sarcasm', np.nan),
+                           ('feature_flags', 0), ('markers', np.nan), ('timestamps', np.nan),
+                           ('processing_time', np.nan), ('version_ids', -1)):
+            column = getattr(self, name)
+            grown = np.full((capacity,) + column.shape[1:], fill, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+        offsets = np.zeros(capacity + 1, dtype=np.int64)
+        offsets[:len(self.attention_offsets)] = self.attention_offsets
+        self.attention_offsets = offsets
+
+class ProfileView:
+    """Read-only EmotionProfile-compatible view of one ProfileStore row."""
+
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store: ProfileStore, index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def segment_id(self) -> str:
+        return self.store.segment_ids[self.index]
+
+    @property
+    def text_reference(self) -> Optional[TextSegment]:
+        return self.store.segments[self.index]
+
+    @property
+    def basic_sentiment(self) -> Dict[str, float]:
+        return self._fields(self.store.sentiment[self.index], SENTIMENT_FIELDS, 'basic_sentiment')
+
+    @property
+    def complex_emotions(self) -> List[Dict[str, float]]:
+        row = self.store.intensities[self.index]
+        emotions = [
+            {'type': self.store.emotion_types[column], 'intensity': float(row[column])}
+            for column in np.flatnonzero(row)
+        ]
+        return emotions + list(self._extras.get('complex_emotions', []))
+
+    @property
+    def sarcasm_indicators(self) -> Dict[str, Any]:
+        indicators = dict(self._extras.get('sarcasm_indicators', {}))
+        probability = self.store.sarcasm[self.index]
+        if not np.isnan(probability):
+            indicators['probability'] = float(probability)
+        flags = int(self.store.feature_flags[self.index])
+        features = [feature for bit, feature in enumerate(self.store.features) if flags >> bit & 1]
+        features += self._extras.get('features', [])
+        if features or 'probability' in indicators:
+            indicators['features'] = features
+        return indicators
+
+    @property
+    def prosody_markers(self) -> Dict[str, float]:
+        return self._fields(self.store.markers[self.index], MARKER_FIELDS, 'prosody_markers')
+
+    @property
+    def attention_weights(self) -> Dict[str, float]:
+        store = self.store
+        start, end = store.attention_offsets[self.index], store.attention_offsets[self.index + 1]
+        return {
+            store.words[word_id]: float(weight)
+            for word_id, weight in zip(store.attention_words[start:end], store.attention_weights[start:end])
+        }
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        store = self.store
+        metadata = dict(self._extras.get('metadata', {}))
+        if not np.isnan(store.timestamps[self.index]):
+            metadata['timestamp'] = datetime.fromtimestamp(store.timestamps[self.index])
+        if store.version_ids[self.index] >= 0:
+            metadata['model_version'] = store.versions[store.version_ids[self.index]]
+        if not np.isnan(store.processing_time[self.index]):
+            metadata['processing_time'] = float(store.processing_time[self.index])
+        metadata['attention_weights'] = self.attention_weights
+        return metadata
+
+    @property
+    def _extras(self) -> Dict[str, Any]:
+        return self.store._extras.get(self.index, {})
+
+    def _fields(self, row: np.ndarray, fields: Sequence[str], name: str) -> Dict[str, float]:
+        values = {field: float(value) for field, value in zip(fields, row) if not np.isnan(value)}
+        values.update(self._extras.get(name, {}))
+        return values
\ No newline at end of file
@@ -5,9 +5,15 @@ from pathlib import Path
 from ..text_processing.reader import TextReader
 from ..text_processing.segmentation import TextSegmenter
 from ..emotion_analysis.analyzer import EmotionAnalyzer 
-from ..audio_generation.tts import TTSEngine
+from ..emotion_analysis.cache import ProfileCache
+from ..emotion_analysis.store import ProfileStore
+from ..emotion_analysis.resources import NLTKResources, NLTKResourceConfig
+from ..audio_generation.tts import TTSEngine, TTSConfig
+from ..audio_generation.tts_pool import TTSWorkerPool, TTSPoolConfig
 from ..audio_generation.prosody import ProsodyMapper
 from ..audio_generation.processor import AudioProcessor
+from .synthesis_units import SynthesisUnitSelector, SynthesisUnitConfig
+from .streaming import StageRunner, group_paragraphs
 
 from ..utils.exceptions import PipelineError, TextProcessingError, EmotionAnalysisError, AudioGenerationError
 from ..utils.logging import get_logger, LogContext
@@ -21,50 +27,88 @@ class Pipeline:
             # Initialize components
             self.text_reader = TextReader()
             self.text_segmenter = TextSegmenter()
-            self.emotion_analyzer = EmotionAnalyzer()
-            self.tts_engine = TTSEngine()
+            profile_cache_path = self.config.get('profile_cache_path')
+            self.profile_cache = ProfileCache(profile_cache_path) if profile_cache_path else None
+            self.emotion_analyzer = EmotionAnalyzer(
+                attention_mode=self.config.get('attention_mode', 'last'),
+                cache=self.profile_cache,
+                nltk_resources=NLTKResources(NLTKResourceConfig(
+                    data_dir=self.config.get('nltk_data_dir'),
+                    allow_download=self.config.get('nltk_download', True),
+                    table_dir=self.config.get('sentiwordnet_table_dir')
+                ))
+            )
+            tts_config = TTSConfig(cache_dir=self.config.get('audio_cache_dir'))
+            tts_workers = self.config.get('tts_workers', 1)
+            if tts_workers > 1:
+                self.tts_engine = TTSWorkerPool(tts_config, TTSPoolConfig(
+                    workers=tts_workers,
+                    threads_per_worker=self.config.get('tts_threads_per_worker', 1)
+                ))
+            else:
+                self.tts_engine = TTSEngine(tts_config)
             self.prosody_mapper = ProsodyMapper()
             self.audio_processor = AudioProcessor()
+            self.unit_selector = SynthesisUnitSelector(SynthesisUnitConfig(
+                level=self.config.get('synthesis_level', 'sentence')
+            ))
         except Exception as e:
             raise PipelineError(f"Failed to initialize pipeline: {str(e)}") from e
+
+    def close(self) -> None:
+        """Shut down the TTS worker processes and close the profile cache.
+
+        A pipeline can process any number of files before it is closed.
+        """
+        close_engine = getattr(self.tts_engine, 'close', None)
+        if close_engine is not None:
+            close_engine()
+        if self.profile_cache is not None:
+            self.profile_cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
         
     def process(self, input_path: str, output_path: str) -> Dict:
         with LogContext(self.logger, input_path=input_path, output_path=output_path):
             try:
+                if self.config.get('streaming', False):
+                    return self._process_streaming(input_path, output_path)
+                
                 # Read and segment text
                 self.logger.info("Processing input file", extra={'file': input_path})
-                text = self.text_reader.read_file(input_path)
-                segments = self.text_segmenter.segment(text)
+                text, _ = self.text_reader.read_file(input_path)
+                segments = self.text_segmenter.segment_text(text)
                 
                 # Analyze emotions
                 self.logger.info("Analyzing emotions", extra={'segment_count': len(segments)})
-                emotion_profiles = []
-                for segment in segments:
-                    profile = self.emotion_analyzer.analyze(segment)
-                    emotion_profiles.append(profile)
+                emotion_profiles = self._analyze_into_store(segments)
                 
-                # Generate audio segments
-                self.logger.info("Generating audio")
-                audio_segments = []
-                for segment, profile in zip(segments, emotion_profiles):
-                    prosody_params = self.prosody_mapper.map_emotion_to_prosody(profile)
-                    audio = self.tts_engine.generate_speech(
-                        segment, 
-                        output_dir=str(Path(output_path).parent),
-                        prosody_params=prosody_params.__dict__
-                    )
-                    audio_segments.append(audio)
+                # Synthesize one non-overlapping level, carrying emotion from the others
+                synthesis_units, unit_profiles = self.unit_selector.select_store(segments, emotion_profiles)
                 
-                # Merge audio segments
-                self.logger.info("Merging audio segments")
-                final_path = self.audio_processor.merge_segments(audio_segments, output_path)
+                # Generate audio segments, crossfading each into the output as it arrives
+                self.logger.info("Generating audio", extra={'unit_count': len(synthesis_units)})
+                jobs = self._prosody_jobs(synthesis_units, unit_profiles)
+                total_duration = 0.0
+                with self.audio_processor.open_writer(output_path) as writer:
+                    for audio_segment in self.tts_engine.generate_batch(
+                        jobs,
+                        output_dir=str(Path(output_path).parent)
+                    ):
+                        writer.write_segment(audio_segment)
+                        total_duration += audio_segment.duration
                 
                 return {
                     "success": True,
-                    "output_path": final_path,
+                    "output_path": output_path,
                     "stats": {
                         "segments_processed": len(segments),
-                        "total_duration": sum(seg.duration for seg in audio_segments)
+                        "units_synthesized": len(synthesis_units),
+                        "total_duration": total_duration
                     }
                 }
                 
@@ -79,4 +123,74 @@ class Pipeline:
                 return {"success": False, "error": str(e), "stats": {}}
             except Exception as e:
                 self.logger.error("Unexpected error in pipeline", exc_info=True)
-                return {"success": False, "error": str(e), "stats": {}}
\ No newline at end of file
+                return {"success": False, "error": str(e), "stats": {}}
+
+    def _process_streaming(self, input_path: str, output_path: str) -> Dict:
+        """Run segmentation, analysis, prosody mapping and TTS as concurrent stages.
+
+        Memory is bounded by the stage queues rather than the document length, and
+        synthesis starts as soon as the first paragraphs have been analyzed.
+        """
+        batch_size = self.config.get('analysis_batch_size', 32)
+        output_dir = str(Path(output_path).parent)
+        stats = {"segments_processed": 0, "units_synthesized": 0}
+
+        def read_groups():
+            segments = self.text_reader.stream_segments(input_path)
+            for group in group_paragraphs(segments, min_size=batch_size):
+                stats["segments_processed"] += len(group)
+                yield group
+
+        # Stages pass whole paragraph groups so a TTS worker pool can run a
+        # group's units in parallel
+        def analyze(group):
+            store = ProfileStore(capacity=len(group))
+            store.extend(self.emotion_analyzer.analyze_batch(group, batch_size=batch_size))
+            yield self.unit_selector.select_store(group, store)
+
+        def map_prosody(units):
+            yield self._prosody_jobs(*units)
+
+        def synthesize(jobs):
+            return self.tts_engine.generate_batch(jobs, output_dir=output_dir)
+
+        self.logger.info("Processing input file in streaming mode", extra={'file': input_path})
+        runner = StageRunner(queue_size=self.config.get('queue_size', 8))
+
+        # Crossfade each segment into the output as it arrives instead of
+        # collecting the whole book's audio first
+        total_duration = 0.0
+        with self.audio_processor.open_writer(output_path) as writer:
+            for audio_segment in runner.run(read_groups(), [analyze, map_prosody, synthesize]):
+                writer.write_segment(audio_segment)
+                total_duration += audio_segment.duration
+        stats["units_synthesized"] = writer.segment_count
+
+        return {
+            "success": True,
+            "output_path": output_path,
+            "stats": {
+                **stats,
+                "total_duration": total_duration
+            }
+        }
+
+    def _prosody_jobs(self, units, profiles: ProfileStore):
+        """Map a run of adjacent units and their profile store to (segment, prosody params) TTS jobs."""
+        parameters = self.prosody_mapper.map_batch(
+            profiles,
+            smoothing=self.config.get('prosody_smoothing', 0)
+        )
+        return [(segment, params.__dict__) for segment, params in zip(units, parameters)]
+
+    def _analyze_into_store(self, segments) -> ProfileStore:
+        """Analyze in chunks, keeping only one chunk of full EmotionProfile objects alive."""
+        batch_size = self.config.get('analysis_batch_size', 32)
+        chunk_size = self.config.get('analysis_chunk_size', 1024)
+        store = ProfileStore()
+        for start in range(0, len(segments), chunk_size):
+            store.extend(self.emotion_analyzer.analyze_batch(
+                segments[start:start + chunk_size],
+                batch_size=batch_size
+            ))
+        return store
\ No newline at end of file
@@ -0,0 +1,110 @@
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List
+
+from ..text_processing.segmentation import TextSegment
+
+# Marks the end of a stage's output
+_END = object()
+
+class StageRunner:
+    """Run pipeline stages concurrently in threads connected by bounded queues.
+
+    Each stage maps one input item to an iterable of output items. A full queue
+    blocks the upstream stage, so at most ``queue_size`` items wait between any
+    two stages no matter how long the input is.
+    """
+
+    def __init__(self, queue_size: int = 8, poll_interval: float = 0.1):
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+
+    def run(self, source: Iterable[Any], stages: List[Callable[[Any], Iterable[Any]]]) -> Iterator[Any]:
+        """Yield the last stage's outputs in order; re-raises the first stage error."""
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(stages) + 1)]
+        stop = threading.Event()
+        errors: List[BaseException] = []
+
+        def put(target: queue.Queue, item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=self.poll_interval)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(origin: queue.Queue) -> Any:
+            while not stop.is_set():
+                try:
+                    return origin.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    continue
+            return _END
+
+        def produce() -> None:
+            try:
+                for item in source:
+                    if not put(queues[0], item):
+                        return
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                put(queues[0], _END)
+
+        def work(stage: Callable[[Any], Iterable[Any]], inbox: queue.Queue, outbox: queue.Queue) -> None:
+            try:
+                while True:
+                    item = get(inbox)
+                    if item is _END:
+                        break
+                    for result in stage(item):
+                        if not put(outbox, result):
+                            return
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                put(outbox, _END)
+
+        threads = [threading.Thread(target=produce, name="pyprosody-stage-source", daemon=True)]
+        for index, stage in enumerate(stages):
+            threads.append(threading.Thread(
+                target=work,
+                args=(stage, queues[index], queues[index + 1]),
+                name=f"pyprosody-stage-{index}",
+                daemon=True
+            ))
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = get(queues[-1])
+                if item is _END:
+                    break
+                yield item
+        finally:
+            # Also unblocks upstream stages when the consumer stops early
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+def group_paragraphs(segments: Iterable[TextSegment], min_size: int = 1) -> Iterator[List[TextSegment]]:
+    """Group a segment stream into whole paragraphs holding at least ``min_size`` segments.
+
+    Splitting only at paragraph boundaries keeps every segment's parent and
+    children in the same group.
+    """
+    group: List[TextSegment] = []
+    for segment in segments:
+        if segment.segment_type == 'paragraph' and len(group) >= min_size:
+            yield group
+            group = []
+        group.append(segment)
+    if group:
+        yield group
\ No newline at end of file
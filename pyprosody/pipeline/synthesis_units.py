@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from ..emotion_analysis.combiner import EmotionProfile
+from ..emotion_analysis.store import ProfileStore
+from ..text_processing.segmentation import TextSegment
+
+# Levels that cover the text without gaps; phrases are only partial spans
+SYNTHESIS_LEVELS = ('paragraph', 'sentence')
+
+@dataclass
+class SynthesisUnitConfig:
+    level: str = 'sentence'
+    parent_weight: float = 0.25  # Share of the enclosing segment's emotion
+    child_weight: float = 0.25   # Share of the contained segments' emotion, split evenly
+
+class SynthesisUnitSelector:
+    """Pick one non-overlapping segment level for TTS and fold neighbouring levels into it."""
+
+    def __init__(self, config: Optional[SynthesisUnitConfig] = None):
+        self.config = config or SynthesisUnitConfig()
+        if self.config.level not in SYNTHESIS_LEVELS:
+            raise ValueError(
+                f"Invalid synthesis level: {self.config.level}. Choose from: {', '.join(SYNTHESIS_LEVELS)}"
+            )
+
+    def select(self,
+               segments: List[TextSegment],
+               profiles: List[EmotionProfile]) -> List[Tuple[TextSegment, EmotionProfile]]:
+        """Return (segment, aggregated profile) pairs for the synthesis level, in text order."""
+        profiles_by_id = {profile.segment_id: profile for profile in profiles}
+        children_by_parent: Dict[str, List[EmotionProfile]] = {}
+        for segment in segments:
+            if segment.parent_id is not None and segment.id in profiles_by_id:
+                children_by_parent.setdefault(segment.parent_id, []).append(profiles_by_id[segment.id])
+
+        units = []
+        for segment in segments:
+            if segment.segment_type != self.config.level or segment.id not in profiles_by_id:
+                continue
+
+            parent = profiles_by_id.get(segment.parent_id) if segment.parent_id else None
+            children = children_by_parent.get(segment.id, [])
+            units.append((
+                segment,
+                self._aggregate(profiles_by_id[segment.id], parent, children)
+            ))
+
+        return units
+
+    def select_store(self,
+                     segments: List[TextSegment],
+                     store: ProfileStore) -> Tuple[List[TextSegment], ProfileStore]:
+        """Columnar ``select``: the synthesis-level segments and a store of their aggregated profiles.
+
+        The aggregation runs on the store's columns, so no EmotionProfile is built.
+        """
+        rows = {segment_id: row for row, segment_id in enumerate(store.segment_ids)}
+        children_by_parent: Dict[str, List[int]] = {}
+        for segment in segments:
+            if segment.parent_id is not None and segment.id in rows:
+                children_by_parent.setdefault(segment.parent_id, []).append(rows[segment.id])
+
+        units = []
+        sources = []
+        attention_sources = []
+        for segment in segments:
+            if segment.segment_type != self.config.level or segment.id not in rows:
+                continue
+
+            own = rows[segment.id]
+            parent = rows.get(segment.parent_id) if segment.parent_id else None
+            children = children_by_parent.get(segment.id, [])
+            units.append(segment)
+            sources.append(self._weights(own, parent, children))
+            attention_sources.append([own] + children)
+
+        return units, store.blend(sources, attention_sources)
+
+    def _weights(self, own, parent, children) -> List[Tuple[object, float]]:
+        # The unit counts fully; neighbours add their configured shares before normalizing
+        sources = [(own, 1.0)]
+        if parent is not None:
+            sources.append((parent, self.config.parent_weight))
+        for child in children:
+            sources.append((child, self.config.child_weight / len(children)))
+        return sources
+
+    def _aggregate(self,
+                   own: EmotionProfile,
+                   parent: Optional[EmotionProfile],
+                   children: List[EmotionProfile]) -> EmotionProfile:
+        sources = self._weights(own, parent, children)
+        total_weight = sum(weight for _, weight in sources)
+
+        def weighted(get_value) -> float:
+            return sum(get_value(profile) * weight for profile, weight in sources) / total_weight
+
+        # Merge complex emotions by type
+        emotion_totals: Dict[str, float] = {}
+        for profile, weight in sources:
+            for emotion in profile.complex_emotions:
+                emotion_type = emotion.get('type', emotion.get('emotion_type'))
+                emotion_totals[emotion_type] = emotion_totals.get(emotion_type, 0.0) + emotion['intensity'] * weight
+
+        # Emphasis can only land on words the unit actually speaks, so the
+        # parent's attention is left out
+        attention_weights = dict(own.metadata.get('attention_weights', {}))
+        for child in children:
+            for word, weight in child.metadata.get('attention_weights', {}).items():
+                attention_weights[word] = max(attention_weights.get(word, 0.0), weight)
+
+        return EmotionProfile(
+            segment_id=own.segment_id,
+            text_reference=own.text_reference,
+            basic_sentiment={
+                **own.basic_sentiment,
+                'polarity': weighted(lambda p: p.basic_sentiment.get('polarity', 0.0)),
+                'objectivity': weighted(lambda p: p.basic_sentiment.get('objectivity', 0.5))
+            },
+            complex_emotions=[
+                {'type': emotion_type, 'intensity': intensity / total_weight}
+                for emotion_type, intensity in emotion_totals.items()
+            ],
+            sarcasm_indicators={
+                **own.sarcasm_indicators,
+                'probability': weighted(lambda p: p.sarcasm_indicators.get('probability', 0.0))
+            },
+            prosody_markers=dict(own.prosody_markers),
+            metadata={
+                **own.metadata,
+                'attention_weights': attention_weights,
+                'aggregated_from': [profile.segment_id for profile, _ in sources]
+            }
+        )
\ No newline at end of file
@@ -14,6 +14,11 @@ class TextPreprocessor:
         for segment in segments:
             processed_text = self._normalize_text(segment.text)
             
+            # Reuse segments that normalization leaves unchanged
+            if processed_text == segment.text:
+                processed_segments.append(segment)
+                continue
+            
             # Create new segment with processed text while preserving metadata
             processed_segment = TextSegment(
                 id=segment.id,
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -8,6 +8,8 @@ class TextProcessingConfig:
     encoding: str = 'utf-8'
     max_file_size: int = 10_000_000  # 10MB
     retry_attempts: int = 3
+    chunk_size: int = 65_536  # Characters per read when streaming
+    max_paragraph_chars: int = 100_000  # Longer streamed paragraphs are split at a line or sentence break
 
 @dataclass
 class SegmentationMetadata:
@@ -41,6 +43,85 @@ class TextReader:
         
         return processed_segments, metadata
 
+    def stream_segments(self, file_path: str) -> Iterator[TextSegment]:
+        """Segment a file incrementally with bounded memory, regardless of its size."""
+        return self.segmenter.segment_stream(self.iter_paragraphs(file_path))
+
+    def iter_paragraphs(self, file_path: str) -> Iterator[Tuple[int, str]]:
+        """Yield (offset, paragraph) pairs using the same offsets as read_file's content.
+
+        Only newly read text is searched for paragraph breaks, and paragraphs over
+        ``max_paragraph_chars`` are split, so time is linear and memory bounded
+        even for text without blank lines.
+        """
+        path = Path(file_path)
+        
+        try:
+            with path.open('r', encoding=self.config.encoding) as file:
+                buffer = ''
+                buffer_start = 0  # Global offset of buffer[0]
+                search_from = 0  # Breaks before this index of buffer were already found
+                
+                while True:
+                    chunk = file.read(self.config.chunk_size)
+                    buffer += chunk
+                    
+                    # (start, end) of each complete block within buffer
+                    blocks = []
+                    start = 0
+                    end = buffer.find('\n\n', search_from)
+                    while end >= 0:
+                        blocks.extend(self._bounded_blocks(buffer, start, end))
+                        start = end + 2
+                        end = buffer.find('\n\n', start)
+                    
+                    # The last block may continue in the next chunk; only its overlong head is split off
+                    if not chunk:
+                        blocks.extend(self._bounded_blocks(buffer, start, len(buffer)))
+                    elif len(buffer) - start > self.config.max_paragraph_chars:
+                        *pieces, (start, _) = self._bounded_blocks(buffer, start, len(buffer))
+                        blocks.extend(pieces)
+                    
+                    for block_start, block_end in blocks:
+                        block = buffer[block_start:block_end]
+                        stripped = block.strip()
+                        if stripped:
+                            yield buffer_start + block_start + len(block) - len(block.lstrip()), stripped
+                    
+                    if not chunk:
+                        break
+                    
+                    # A break may straddle reads, so the next search starts one character back
+                    buffer = buffer[start:]
+                    buffer_start += start
+                    search_from = max(len(buffer) - 1, 0)
+                        
+        except FileNotFoundError:
+            raise TextProcessingError(f"File not found: {file_path}")
+        except PermissionError:
+            raise TextProcessingError(f"Permission denied: {file_path}")
+        except UnicodeDecodeError:
+            raise TextProcessingError(f"File encoding error: {file_path}")
+
+    def _bounded_blocks(self, text: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """Split text[start:end] into (start, end) pieces of at most ``max_paragraph_chars``."""
+        limit = self.config.max_paragraph_chars
+        blocks = []
+        while end - start > limit:
+            blocks.append((start, self._split_point(text, start, start + limit)))
+            start = blocks[-1][1]
+        blocks.append((start, end))
+        return blocks
+
+    def _split_point(self, text: str, start: int, end: int) -> int:
+        # The last line break, else sentence end, else space in text[start:end]; a hard cut at worst
+        for separators in (('\n',), ('. ', '! ', '? '), (' ',)):
+            found = [(text.rfind(separator, start, end), separator) for separator in separators]
+            cut = max((position + len(separator) for position, separator in found if position >= 0), default=-1)
+            if cut > start:
+                return cut
+        return end
+
     def read_file(self, file_path: str) -> tuple[str, SegmentationMetadata]:
         path = Path(file_path)
         start_time = datetime.utcnow()
@@ -1,8 +1,13 @@
-from dataclasses import dataclass
-from typing import List, Optional
-import spacy
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
+# Segment levels in nesting order, with the prefixes used to build their ids
+SEGMENT_LEVELS = ('paragraph', 'sentence', 'phrase')
+ID_PREFIXES = ('p', 's', 'ph')
+
 @dataclass
 class TextSegment:
     id: str
@@ -12,56 +17,210 @@ class TextSegment:
     end_pos: int
     parent_id: Optional[str] = None
 
+class SegmentStore(Sequence[TextSegment]):
+    """Segments of one document as offset arrays over a single copy of its text.
+
+    Each segment is a row of (start, end, level, parent index, ordinal within
+    its parent). Indexing builds a SegmentView whose text and id are derived
+    on access, so no per-segment strings are kept. The tagger's tokens are kept
+    the same way, as offset arrays plus an interned part-of-speech tag, so
+    later stages can reuse them instead of tokenizing again.
+    """
+
+    def __init__(self, text: str, offset: int = 0):
+        self.text = text
+        self.offset = offset  # Document position of text[0]
+        self.starts = array('q')
+        self.ends = array('q')
+        self.levels = array('b')
+        self.parents = array('i')  # -1 for paragraphs
+        self.ordinals = array('i')
+
+        # Tokens in document order
+        self.token_starts = array('q')
+        self.token_ends = array('q')
+        self.token_tags = array('H')
+        self.tags: List[str] = []
+        self._tag_ids: Dict[str, int] = {}
+
+    def append(self, level: int, start: int, end: int, ordinal: int, parent: int = -1) -> int:
+        self.starts.append(start)
+        self.ends.append(end)
+        self.levels.append(level)
+        self.parents.append(parent)
+        self.ordinals.append(ordinal)
+        return len(self.starts) - 1
+
+    def append_token(self, start: int, end: int, tag: str) -> None:
+        tag_id = self._tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = self._tag_ids[tag] = len(self.tags)
+            self.tags.append(tag)
+        self.token_starts.append(start)
+        self.token_ends.append(end)
+        self.token_tags.append(tag_id)
+
+    def tokens(self, index: int) -> Optional[List[Tuple[str, str]]]:
+        """(word, tag) pairs of the tokens inside a segment, or None if the store is untagged."""
+        if not self.tags:
+            return None
+        first = bisect_left(self.token_starts, self.starts[index])
+        last = bisect_left(self.token_starts, self.ends[index])
+        return [
+            (self.text[self.token_starts[i] - self.offset:self.token_ends[i] - self.offset],
+             self.tags[self.token_tags[i]])
+            for i in range(first, last)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [SegmentView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        return SegmentView(self, index)
+
+    def __iter__(self) -> Iterator[TextSegment]:
+        for index in range(len(self)):
+            yield SegmentView(self, index)
+
+    def segment_id(self, index: int) -> str:
+        own = f"{ID_PREFIXES[self.levels[index]]}{self.ordinals[index]}"
+        parent = self.parents[index]
+        return own if parent < 0 else f"{self.segment_id(parent)}_{own}"
+
+class SegmentView(TextSegment):
+    """Lazy TextSegment backed by a SegmentStore row.
+
+    A view holds only its store and row index; TextSegment is a plain dataclass,
+    so views still carry an instance dict. It compares equal to any TextSegment
+    with the same field values.
+    """
+
+    def __init__(self, store: SegmentStore, index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def id(self) -> str:
+        return self.store.segment_id(self.index)
+
+    @property
+    def text(self) -> str:
+        store = self.store
+        return store.text[store.starts[self.index] - store.offset:store.ends[self.index] - store.offset]
+
+    @property
+    def segment_type(self) -> str:
+        return SEGMENT_LEVELS[self.store.levels[self.index]]
+
+    @property
+    def start_pos(self) -> int:
+        return self.store.starts[self.index]
+
+    @property
+    def end_pos(self) -> int:
+        return self.store.ends[self.index]
+
+    @property
+    def parent_id(self) -> Optional[str]:
+        parent = self.store.parents[self.index]
+        return None if parent < 0 else self.store.segment_id(parent)
+
+    @property
+    def tokens(self) -> Optional[List[Tuple[str, str]]]:
+        return self.store.tokens(self.index)
+
+    def __eq__(self, other):
+        if not isinstance(other, TextSegment):
+            return NotImplemented
+        return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(TextSegment))
+
+    def __reduce__(self):
+        # Pickle as a plain segment so worker processes don't receive the whole text
+        return (TextSegment, (self.id, self.text, self.segment_type,
+                              self.start_pos, self.end_pos, self.parent_id))
+
+@dataclass
+class SegmentationConfig:
+    model_name: str = 'en_core_web_sm'
+    batch_size: int = 64   # Paragraphs per nlp.pipe batch
+    n_process: int = 1     # Worker processes for nlp.pipe
+    # Segmentation needs sentences, noun chunks and dependency roots only
+    disabled_pipes: List[str] = field(default_factory=lambda: ['ner', 'lemmatizer'])
+
 class TextSegmenter:
-    def __init__(self):
-        self.nlp = spacy.load('en_core_web_sm')
+    def __init__(self, config: Optional[SegmentationConfig] = None):
+        self.config = config or SegmentationConfig()
+        self._nlp = None
 
-    def segment_text(self, text: str) -> List[TextSegment]:
-        segments = []
-        doc = self.nlp(text)
-        
+    @property
+    def nlp(self):
+        # spaCy is imported and its model loaded on first use
+        if self._nlp is None:
+            import spacy
+            self._nlp = spacy.load(self.config.model_name, disable=self.config.disabled_pipes)
+        return self._nlp
+
+    def segment_text(self, text: str) -> SegmentStore:
+        """Segment a whole document into a compact store of lazy TextSegment views."""
         # Process paragraphs (split by double newlines)
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-        
-        for p_idx, para in enumerate(paragraphs):
-            para_id = f'p{p_idx}'
-            para_start = text.find(para)
-            para_end = para_start + len(para)
-            
-            segments.append(TextSegment(
-                id=para_id,
-                text=para,
-                segment_type='paragraph',
-                start_pos=para_start,
-                end_pos=para_end
-            ))
-            
-            # Process sentences within paragraph
-            para_doc = self.nlp(para)
-            for s_idx, sent in enumerate(para_doc.sents):
-                sent_id = f'{para_id}_s{s_idx}'
-                segments.append(TextSegment(
-                    id=sent_id,
-                    text=sent.text,
-                    segment_type='sentence',
-                    start_pos=para_start + sent.start_char,
-                    end_pos=para_start + sent.end_char,
-                    parent_id=para_id
-                ))
-                
-                # Process phrases within sentence
-                for p_idx, phrase in enumerate(self._extract_phrases(sent)):
-                    phrase_id = f'{sent_id}_ph{p_idx}'
-                    segments.append(TextSegment(
-                        id=phrase_id,
-                        text=phrase.text,
-                        segment_type='phrase',
-                        start_pos=para_start + phrase.start_char,
-                        end_pos=para_start + phrase.end_char,
-                        parent_id=sent_id
-                    ))
-        
-        return segments
+        paragraphs = ((start, text[start:end]) for start, end in self._paragraph_spans(text))
+        store = SegmentStore(text)
+        for p_idx, para_start, para_doc in self._iter_docs(paragraphs):
+            self._append_paragraph(store, p_idx, para_start, para_doc)
+        return store
+
+    def segment_stream(self, paragraphs: Iterable[Tuple[int, str]]) -> Iterator[TextSegment]:
+        """Segment (offset, paragraph) pairs lazily, yielding segments with global offsets.
+
+        Each paragraph gets its own small SegmentStore, so memory stays bounded
+        while segments still carry their tokens.
+        """
+        for p_idx, para_start, para_doc in self._iter_docs(paragraphs):
+            store = SegmentStore(para_doc.text, offset=para_start)
+            self._append_paragraph(store, p_idx, para_start, para_doc)
+            yield from store
+
+    def _iter_docs(self, paragraphs: Iterable[Tuple[int, str]]) -> Iterator[Tuple[int, int, object]]:
+        """Yield (paragraph index, paragraph start, parsed paragraph) in document order."""
+        para_docs = self.nlp.pipe(
+            ((para, para_start) for para_start, para in paragraphs),
+            as_tuples=True,
+            batch_size=self.config.batch_size,
+            n_process=self.config.n_process
+        )
+        for p_idx, (para_doc, para_start) in enumerate(para_docs):
+            yield p_idx, para_start, para_doc
+
+    def _append_paragraph(self, store: SegmentStore, p_idx: int, para_start: int, para_doc) -> None:
+        """Add a parsed paragraph's segments, and its tokens with their tags, to ``store``."""
+        paragraph = store.append(0, para_start, para_start + len(para_doc.text), p_idx)
+        for token in para_doc:
+            if not token.is_space:
+                store.append_token(para_start + token.idx, para_start + token.idx + len(token.text), token.tag_)
+
+        # Process sentences within paragraph
+        for s_idx, sent in enumerate(para_doc.sents):
+            sentence = store.append(1, para_start + sent.start_char, para_start + sent.end_char, s_idx, paragraph)
+
+            # Process phrases within sentence
+            for ph_idx, phrase in enumerate(self._extract_phrases(sent)):
+                store.append(2, para_start + phrase.start_char, para_start + phrase.end_char, ph_idx, sentence)
+
+    def _paragraph_spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) offsets of stripped, non-empty paragraphs in a single pass."""
+        position = 0
+        for block in text.split('\n\n'):
+            stripped = block.strip()
+            if stripped:
+                start = position + len(block) - len(block.lstrip())
+                yield start, start + len(stripped)
+            position += len(block) + 2
 
     def _extract_phrases(self, sent):
         """Extract meaningful phrases from a sentence using syntactic parsing"""
@@ -70,5 +229,6 @@ class TextSegmenter:
             phrases.append(chunk)
         for token in sent:
             if token.dep_ in ['ROOT', 'VERB']:
-                phrases.append(token)
+                # Wrap as a span so it carries character offsets like noun chunks
+                phrases.append(sent.doc[token.i:token.i + 1])
         return sorted(phrases, key=lambda x: x.start_char)
\ No newline at end of file
@@ -1,10 +1,16 @@
-import torch
+from typing import TYPE_CHECKING
 
-def get_optimal_device() -> torch.device:
+if TYPE_CHECKING:
+    import torch
+
+def get_optimal_device() -> "torch.device":
     """
     Determines the optimal available device for PyTorch operations.
     Priority: CUDA > MPS > CPU
     """
+    # Imported here so that importing pyprosody does not pull in torch
+    import torch
+
     if torch.cuda.is_available():
         return torch.device("cuda")
     elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
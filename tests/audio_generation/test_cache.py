@@ -0,0 +1,132 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+import numpy as np
+from pyprosody.audio_generation.cache import AudioCache
+
+class TestAudioCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = AudioCache(os.path.join(self.test_dir, "cache"), max_size_bytes=300)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _store(self, cache: AudioCache, key: str) -> str:
+        # Ten float samples make a 120 byte WAV, so two entries fit in 300 bytes,
+        # and in the 270 bytes left after an eviction
+        return cache.store_samples(key, np.zeros(10, dtype=np.float32), 1000)
+
+    def test_key_normalizes_text_and_quantizes_prosody(self):
+        key = self.cache.key("Hello  there.\n", "model", {"speed": 1.21, "pitch": 2.0})
+
+        self.assertEqual(key, self.cache.key("Hello there.", "model", {"speed": 1.19, "pitch": 2.01}))
+        self.assertNotEqual(key, self.cache.key("Hello there.", "model", {"speed": 1.3, "pitch": 2.0}))
+        self.assertNotEqual(key, self.cache.key("Hello there.", "other", {"speed": 1.21, "pitch": 2.0}))
+
+    def test_key_covers_processing(self):
+        params = {"speed": 1.0, "energy": 1.2}
+        processing = {"version": "1", "dsp": {"frame_size": 1024}, "emphasis": None}
+        key = self.cache.key("text", "model", params, processing)
+
+        self.assertEqual(key, self.cache.key("text", "model", params, dict(processing)))
+        self.assertNotEqual(key, self.cache.key("text", "model", params))
+        self.assertNotEqual(key, self.cache.key("text", "model", params, {**processing, "version": "2"}))
+        self.assertNotEqual(key, self.cache.key("text", "model", params, {**processing, "dsp": {"frame_size": 512}}))
+
+    def test_load_after_store(self):
+        key = self.cache.key("text", "model", {"speed": 1.0})
+
+        self.assertIsNone(self.cache.load_samples(key))
+        self._store(self.cache, key)
+
+        samples, sample_rate = self.cache.load_samples(key)
+        self.assertEqual(len(samples), 10)
+        self.assertEqual(sample_rate, 1000)
+
+    def test_samples_beyond_full_scale_round_trip(self):
+        key = self.cache.key("loud", "model", {})
+        samples = np.array([0.5, 1.5, -2.0], dtype=np.float32)
+
+        self.cache.store_samples(key, samples, 1000)
+        loaded, sample_rate = self.cache.load_samples(key)
+
+        self.assertEqual(sample_rate, 1000)
+        np.testing.assert_array_equal(loaded, samples)
+
+    def test_lru_eviction(self):
+        keys = [self.cache.key(f"text {i}", "model", {}) for i in range(3)]
+        self._store(self.cache, keys[0])
+        self._store(self.cache, keys[1])
+
+        # Touch the first entry so the second becomes least recently used
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self._store(self.cache, keys[2])
+
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertIsNotNone(self.cache.get(keys[2]))
+
+    def test_index_survives_restart(self):
+        key = self.cache.key("persisted", "model", {})
+        self._store(self.cache, key)
+
+        reopened = AudioCache(str(self.cache.cache_dir), max_size_bytes=300)
+
+        self.assertIsNotNone(reopened.get(key))
+
+    def test_processes_share_entries_and_limit(self):
+        # Each TTS pool worker has its own AudioCache on the same directory; other
+        # workers' entries are counted at each cache's next rescan
+        cache_dir = str(self.cache.cache_dir)
+        first = AudioCache(cache_dir, max_size_bytes=300, rescan_interval=1)
+        other = AudioCache(cache_dir, max_size_bytes=300, rescan_interval=1)
+        keys = [first.key(f"shared {i}", "model", {}) for i in range(3)]
+
+        self._store(first, keys[0])
+        self.assertIsNotNone(other.load_samples(keys[0]))
+
+        self._store(other, keys[1])
+        self._store(first, keys[2])
+
+        cached = os.listdir(cache_dir)
+        self.assertEqual(len(cached), 2)
+        self.assertLessEqual(sum(os.path.getsize(os.path.join(cache_dir, name)) for name in cached), 300)
+        self.assertIsNone(other.get(keys[0]))
+
+    def test_rescans_only_past_the_estimate(self):
+        cache = AudioCache(str(self.cache.cache_dir), max_size_bytes=10_000)
+
+        with patch('pyprosody.audio_generation.cache.os.scandir', wraps=os.scandir) as scandir:
+            for i in range(20):
+                self._store(cache, cache.key(f"text {i}", "model", {}))
+
+        # One scan to seed the estimate, then none until the limit is crossed
+        self.assertEqual(scandir.call_count, 1)
+        self.assertEqual(len(os.listdir(cache.cache_dir)), 20)
+
+    def test_full_cache_is_not_rescanned_on_every_store(self):
+        cache = AudioCache(str(self.cache.cache_dir), max_size_bytes=12_000)
+
+        with patch('pyprosody.audio_generation.cache.os.scandir', wraps=os.scandir) as scandir:
+            for i in range(150):
+                self._store(cache, cache.key(f"text {i}", "model", {}))
+
+        # Eviction leaves 10% headroom, so the 50 stores past the limit rescan about five times
+        self.assertLess(scandir.call_count, 10)
+        self.assertLessEqual(sum(entry.stat().st_size for entry in os.scandir(cache.cache_dir)), 12_000)
+
+    def test_failed_write_removes_temp_file(self):
+        key = self.cache.key("text", "model", {})
+
+        with patch('pyprosody.audio_generation.cache.write_samples', side_effect=RuntimeError("disk full")):
+            with self.assertRaises(RuntimeError):
+                self._store(self.cache, key)
+
+        self.assertEqual(os.listdir(self.cache.cache_dir), [])
+        self.assertIsNone(self.cache.get(key))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+from pyprosody.audio_generation.dsp import ProsodyDSP, DSPConfig
+
+class TestProsodyDSP(unittest.TestCase):
+    def setUp(self):
+        self.dsp = ProsodyDSP()
+        self.sample_rate = 22050
+        t = np.arange(self.sample_rate * 2) / self.sample_rate
+        self.tone = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+    def _dominant_frequency(self, samples):
+        spectrum = np.abs(np.fft.rfft(samples))
+        return np.argmax(spectrum) * self.sample_rate / len(samples)
+
+    def test_pitch_shift_keeps_duration(self):
+        for semitones in (-12.0, -3.0, 4.0, 12.0):
+            shifted = self.dsp.pitch_shift(self.tone, self.sample_rate, semitones)
+
+            self.assertEqual(len(shifted), len(self.tone))
+            self.assertAlmostEqual(
+                self._dominant_frequency(shifted), 440 * 2 ** (semitones / 12), delta=3
+            )
+
+    def test_small_shift_is_skipped(self):
+        self.assertIs(self.dsp.pitch_shift(self.tone, self.sample_rate, 0.01), self.tone)
+
+    def test_time_stretch_length(self):
+        stretched = self.dsp.time_stretch(self.tone, 0.8)
+
+        self.assertEqual(len(stretched), int(round(len(self.tone) / 0.8)))
+        self.assertAlmostEqual(self._dominant_frequency(stretched), 440, delta=3)
+
+    def test_gain_contour_is_not_clipped(self):
+        contour = np.linspace(0.0, 4.0, len(self.tone), dtype=np.float32)
+
+        scaled = self.dsp.apply_gain(self.tone, contour)
+
+        # Left for the writer's normalization instead of clipping each segment
+        self.assertAlmostEqual(float(np.max(np.abs(scaled))), 2.0, delta=0.01)
+        self.assertAlmostEqual(float(np.max(np.abs(scaled[:1000]))), 0.0, delta=0.1)
+
+    def test_invalid_hop(self):
+        with self.assertRaises(ValueError):
+            ProsodyDSP(DSPConfig(frame_size=1000, hop_size=256))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+from pyprosody.audio_generation.emphasis import EmphasisRenderer, EmphasisConfig
+
+class TestEmphasisRenderer(unittest.TestCase):
+    def setUp(self):
+        self.renderer = EmphasisRenderer()
+        self.sample_rate = 22050
+        self.text = "Never, ever do that."
+
+        # Tone bursts sized by letter count, separated by silences
+        samples_per_letter = int(self.sample_rate * 0.06)
+        gap = np.zeros(int(self.sample_rate * 0.1), dtype=np.float32)
+        pieces = [gap]
+        self.word_ranges = []
+        position = len(gap)
+        for word in ["Never", "ever", "do", "that"]:
+            burst = 0.3 * np.sin(np.arange(len(word) * samples_per_letter) * 0.1).astype(np.float32)
+            self.word_ranges.append((position, position + len(burst)))
+            pieces.extend([burst, gap])
+            position += len(burst) + len(gap)
+        self.samples = np.concatenate(pieces)
+
+    def test_alignment_follows_pauses(self):
+        words, bounds = self.renderer.align(self.samples, self.sample_rate, self.text)
+
+        self.assertEqual(words, ["Never", "ever", "do", "that"])
+        frame = int(self.sample_rate * 0.01)
+        for (start, end), (true_start, true_end) in zip(bounds, self.word_ranges):
+            self.assertLessEqual(abs(start - true_start), 2 * frame)
+            self.assertLessEqual(abs(end - true_end), 2 * frame)
+
+    def test_render_boosts_only_emphasized_word(self):
+        rendered = self.renderer.render(self.samples, self.sample_rate, self.text, ["EVER"])
+
+        start, end = self.word_ranges[1]
+        middle = slice(start + 1000, end - 1000)
+        expected_gain = 10 ** (3.0 / 20)
+        np.testing.assert_allclose(rendered[middle], self.samples[middle] * expected_gain, rtol=1e-4)
+        first_start, first_end = self.word_ranges[0]
+        np.testing.assert_allclose(rendered[first_start:first_end - 1000], self.samples[first_start:first_end - 1000])
+
+    def test_no_matching_words(self):
+        self.assertIs(self.renderer.render(self.samples, self.sample_rate, self.text, []), self.samples)
+        self.assertIs(self.renderer.render(self.samples, self.sample_rate, self.text, ["missing"]), self.samples)
+
+    def test_stretch_lengthens_emphasized_words(self):
+        renderer = EmphasisRenderer(EmphasisConfig(stretch=1.5))
+
+        rendered = renderer.render(self.samples, self.sample_rate, self.text, ["do", "that"])
+
+        _, bounds = renderer.align(self.samples, self.sample_rate, self.text)
+        stretched = sum(end - start for start, end in bounds[2:])
+        self.assertAlmostEqual(len(rendered) - len(self.samples), 0.5 * stretched, delta=2)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,56 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest import mock
+import numpy as np
+import soundfile as sf
+from pyprosody.audio_generation import encoder
+from pyprosody.audio_generation.writer import StreamingAudioWriter
+from pyprosody.utils.exceptions import AudioGenerationError
+
+class TestEncoder(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        t = np.arange(22050) / 22050
+        self.tone = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _dominant_frequency(self, samples, sample_rate):
+        spectrum = np.abs(np.fft.rfft(samples))
+        return np.argmax(spectrum) * sample_rate / len(samples)
+
+    def test_resample_preserves_pitch(self):
+        resampled = encoder.resample(self.tone, 22050, 44100)
+
+        self.assertEqual(resampled.dtype, np.float32)
+        self.assertEqual(len(resampled), 44100)
+        self.assertAlmostEqual(self._dominant_frequency(resampled, 44100), 440, delta=2)
+
+    def test_resample_without_soxr(self):
+        with mock.patch.object(encoder, 'soxr', None):
+            resampled = encoder.resample(self.tone, 22050, 16000)
+
+        self.assertEqual(len(resampled), 16000)
+        self.assertAlmostEqual(self._dominant_frequency(resampled, 16000), 440, delta=2)
+
+    def test_native_ogg_output(self):
+        output_path = os.path.join(self.test_dir, "book.ogg")
+        with StreamingAudioWriter(output_path, sample_rate=44100, output_format="ogg") as writer:
+            writer.write(self.tone, 22050)
+
+        info = sf.info(output_path)
+        self.assertEqual(info.format, "OGG")
+        self.assertEqual(info.samplerate, 44100)
+
+    def test_missing_ffmpeg(self):
+        output_path = os.path.join(self.test_dir, "book.aac")
+        with mock.patch.object(encoder, 'get_encoder_name', return_value="/nonexistent/ffmpeg"):
+            with self.assertRaises(AudioGenerationError):
+                with StreamingAudioWriter(output_path, output_format="aac") as writer:
+                    writer.write(self.tone, 22050)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
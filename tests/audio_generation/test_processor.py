@@ -1,5 +1,7 @@
 import unittest
 import os
+import numpy as np
+import soundfile as sf
 from pydub import AudioSegment as PydubSegment
 from pyprosody.audio_generation.processor import AudioProcessor, AudioProcessingConfig
 from pyprosody.audio_generation.tts import AudioSegment
@@ -54,6 +56,71 @@ class TestAudioProcessor(unittest.TestCase):
         # Clean up merged file
         os.remove(output_path)
     
+    def test_merge_in_memory_segments(self):
+        output_path = os.path.join(self.test_dir, "merged_memory.wav")
+        segments = [
+            AudioSegment(
+                segment_id=f"memory_{i}",
+                audio_path=None,
+                duration=0.5,
+                sample_rate=22050,
+                metadata={},
+                samples=np.full(11025, 0.1, dtype=np.float32)
+            )
+            for i in range(3)
+        ]
+        
+        result_path = self.processor.merge_segments(segments, output_path)
+        
+        merged = PydubSegment.from_wav(result_path)
+        self.assertAlmostEqual(len(merged), 1500, delta=250)
+        os.remove(output_path)
+    
+    def _merge_to_samples(self, segments):
+        output_path = os.path.join(self.test_dir, "merged_samples.wav")
+        processor = AudioProcessor(AudioProcessingConfig(sample_rate=1000, normalize=False))
+        processor.merge_segments(segments, output_path)
+        merged, sample_rate = sf.read(output_path, dtype='float32')
+        os.remove(output_path)
+        return merged, sample_rate
+
+    def test_merge_crossfade(self):
+        segments = [
+            AudioSegment(
+                segment_id=f"fade_{i}",
+                audio_path=None,
+                duration=0.5,
+                sample_rate=1000,
+                metadata={},
+                samples=np.full(500, 0.5, dtype=np.float32)
+            )
+            for i in range(4)
+        ]
+        
+        merged, sample_rate = self._merge_to_samples(segments)
+        
+        # Three 100ms overlaps are shared between neighbours
+        self.assertEqual(sample_rate, 1000)
+        self.assertEqual(len(merged), 4 * 500 - 3 * 100)
+        np.testing.assert_allclose(merged, 0.5, atol=1e-4)
+    
+    def test_merge_short_segment(self):
+        segments = [
+            AudioSegment(
+                segment_id=f"short_{i}",
+                audio_path=None,
+                duration=length / 1000,
+                sample_rate=1000,
+                metadata={},
+                samples=np.ones(length, dtype=np.float32)
+            )
+            for i, length in enumerate([300, 40, 300])
+        ]
+        
+        merged, _ = self._merge_to_samples(segments)
+        
+        self.assertEqual(len(merged), 640 - 2 * 40)
+    
     def test_merge_empty_segments(self):
         with self.assertRaises(ValueError):
             self.processor.merge_segments([], "output.wav")
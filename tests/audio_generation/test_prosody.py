@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 from pyprosody.audio_generation.prosody import ProsodyMapper, ProsodyParameters
 from pyprosody.emotion_analysis.combiner import EmotionProfile
 from pyprosody.text_processing.segmentation import TextSegment
@@ -116,5 +117,65 @@ class TestProsodyMapper(unittest.TestCase):
         self.assertGreater(params.pitch, 1.0)
         self.assertIn('great', params.emphasis_words)
 
+    def _profile(self, segment_id, polarity, emotions, sarcasm=0.1):
+        return EmotionProfile(
+            segment_id=segment_id,
+            text_reference=TextSegment(
+                id=segment_id,
+                text="Some text.",
+                segment_type="sentence",
+                start_pos=0,
+                end_pos=10
+            ),
+            basic_sentiment={'polarity': polarity, 'objectivity': 0.5},
+            complex_emotions=[{'type': t, 'intensity': i} for t, i in emotions],
+            sarcasm_indicators={'probability': sarcasm, 'features': []},
+            prosody_markers={},
+            metadata={'attention_weights': {'text': 0.8}}
+        )
+
+    def test_batch_matches_single(self):
+        profiles = [
+            self._profile("b1", 0.8, [('joy', 0.8), ('surprise', 0.3)]),
+            self._profile("b2", -0.7, [('sadness', 0.9), ('fear', 0.2)]),
+            self._profile("b3", 0.6, [('surprise', 0.4), ('unknown', 0.9)], sarcasm=0.8),
+            self._profile("b4", 0.0, [])
+        ]
+
+        batch = self.mapper.map_batch(profiles)
+
+        for params, profile in zip(batch, profiles):
+            single = self.mapper.map_emotion_to_prosody(profile)
+            self.assertAlmostEqual(params.speed, single.speed)
+            self.assertAlmostEqual(params.pitch, single.pitch)
+            self.assertAlmostEqual(params.energy, single.energy)
+            self.assertEqual(params.emphasis_words, ['text'])
+        self.assertAlmostEqual(batch[3].speed, 1.0)
+        self.assertAlmostEqual(batch[2].pitch, 2.0 + 5.0 * 0.4)
+
+    def test_temporal_smoothing(self):
+        profiles = [self._profile(f"s{i}", 0.0, []) for i in range(5)]
+        profiles[2] = self._profile("s2", 0.0, [('anger', 1.0)])
+
+        raw = [p.pitch for p in self.mapper.map_batch(profiles)]
+        smoothed = [p.pitch for p in self.mapper.map_batch(profiles, smoothing=1)]
+
+        self.assertLess(smoothed[2], raw[2])
+        self.assertGreater(smoothed[1], 0.0)
+        self.assertEqual(smoothed[0], 0.0)
+        self.assertAlmostEqual(sum(smoothed[1:4]), raw[2])
+
+    def test_smoothing_fewer_segments_than_window(self):
+        smoothed = self.mapper._smooth(np.array([1.0, 2.0]), 3)
+
+        # Kernel [1, 2, 3, 4, 3, 2, 1] centred on each segment, renormalized
+        self.assertEqual(len(smoothed), 2)
+        self.assertAlmostEqual(smoothed[0], (4 * 1.0 + 3 * 2.0) / 7)
+        self.assertAlmostEqual(smoothed[1], (3 * 1.0 + 4 * 2.0) / 7)
+        self.assertEqual(len(self.mapper._smooth(np.array([5.0]), 2)), 1)
+
+    def test_empty_batch(self):
+        self.assertEqual(self.mapper.map_batch([]), [])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
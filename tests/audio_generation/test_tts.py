@@ -36,9 +36,33 @@ class TestTTSEngine(unittest.TestCase):
             self.test_output_dir
         )
         
-        self.assertTrue(os.path.exists(audio_segment.audio_path))
+        self.assertIsNone(audio_segment.audio_path)
         self.assertEqual(audio_segment.segment_id, segment.id)
         self.assertGreater(audio_segment.duration, 0)
+        self.assertAlmostEqual(
+            audio_segment.duration,
+            len(audio_segment.samples) / audio_segment.sample_rate
+        )
+        
+    def test_spill_to_disk(self):
+        config = TTSConfig(
+            model_name="tts_models/en/ljspeech/glow-tts",
+            device="cpu",
+            spill_to_disk=True
+        )
+        segment = TextSegment(
+            id="test_spill",
+            text="This goes to a file.",
+            segment_type="sentence",
+            start_pos=0,
+            end_pos=20
+        )
+        
+        audio_segment = TTSEngine(config).generate_speech(segment, self.test_output_dir)
+        
+        self.assertTrue(os.path.exists(audio_segment.audio_path))
+        self.assertIsNone(audio_segment.samples)
+        self.assertGreater(audio_segment.duration, 0)
         
     def test_prosody_parameters(self):
         segment = TextSegment(
@@ -61,7 +85,7 @@ class TestTTSEngine(unittest.TestCase):
             prosody_params
         )
         
-        self.assertTrue(os.path.exists(audio_segment.audio_path))
+        self.assertIsNotNone(audio_segment.samples)
         self.assertEqual(
             audio_segment.metadata["prosody_params"],
             prosody_params
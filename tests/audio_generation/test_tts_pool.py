@@ -0,0 +1,54 @@
+import unittest
+import os
+import shutil
+from pyprosody.audio_generation.tts import TTSConfig, TTSGenerationError
+from pyprosody.audio_generation.tts_pool import TTSWorkerPool, TTSPoolConfig
+from pyprosody.text_processing.segmentation import TextSegment
+
+class TestTTSWorkerPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = TTSWorkerPool(
+            TTSConfig(device="cpu"),
+            TTSPoolConfig(workers=2, threads_per_worker=1)
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def setUp(self):
+        self.test_output_dir = "/tmp/pyprosody_test_pool_output"
+
+    def tearDown(self):
+        if os.path.exists(self.test_output_dir):
+            shutil.rmtree(self.test_output_dir)
+
+    def test_batch_results_in_order(self):
+        segments = [
+            TextSegment(
+                id=f"pool_{i}",
+                text=text,
+                segment_type="sentence",
+                start_pos=0,
+                end_pos=len(text)
+            )
+            for i, text in enumerate(["First line.", "A somewhat longer second line.", "Third."])
+        ]
+        jobs = [(segment, {"speed": 1.0, "energy": 1.0}) for segment in segments]
+
+        audio_segments = list(self.pool.generate_batch(jobs, self.test_output_dir))
+
+        self.assertEqual([a.segment_id for a in audio_segments], [s.id for s in segments])
+        for audio_segment in audio_segments:
+            self.assertIsNotNone(audio_segment.samples)
+            self.assertGreater(audio_segment.duration, 0)
+
+    def test_worker_errors_propagate(self):
+        segment = TextSegment(id="pool_empty", text="", segment_type="sentence", start_pos=0, end_pos=0)
+
+        with self.assertRaises(TTSGenerationError):
+            self.pool.generate_speech(segment, self.test_output_dir)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+import unittest
+import os
+import shutil
+import tempfile
+import numpy as np
+import soundfile as sf
+from pyprosody.audio_generation.writer import StreamingAudioWriter, crossfade_ramp
+from pyprosody.audio_generation.processor import AudioProcessor, AudioProcessingConfig
+from pyprosody.audio_generation.tts import AudioSegment
+
+class TestStreamingAudioWriter(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        rng = np.random.default_rng(0)
+        self.segments = [
+            AudioSegment(
+                segment_id=f"stream_{i}",
+                audio_path=None,
+                duration=length / 1000,
+                sample_rate=1000,
+                metadata={},
+                samples=rng.uniform(-0.5, 0.5, length).astype(np.float32)
+            )
+            for i, length in enumerate([700, 40, 500, 300])
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_matches_in_memory_merge(self):
+        output_path = os.path.join(self.test_dir, "stream.wav")
+        with StreamingAudioWriter(output_path, sample_rate=1000, normalize=False) as writer:
+            for segment in self.segments:
+                writer.write_segment(segment)
+
+        written, sample_rate = sf.read(output_path, dtype='float32')
+
+        # Whole-buffer reference: each overlap is bounded by both neighbours
+        expected = self.segments[0].samples
+        for previous, segment in zip(self.segments, self.segments[1:]):
+            overlap = min(100, len(previous.samples), len(segment.samples))
+            ramp = crossfade_ramp(overlap)
+            head = expected[len(expected) - overlap:] * (1.0 - ramp) + segment.samples[:overlap] * ramp
+            expected = np.concatenate([expected[:len(expected) - overlap], head, segment.samples[overlap:]])
+
+        self.assertEqual(sample_rate, 1000)
+        self.assertEqual(len(written), len(expected))
+        np.testing.assert_allclose(written, expected, atol=1e-4)
+
+    def test_two_pass_normalization(self):
+        output_path = os.path.join(self.test_dir, "normalized.flac")
+        with StreamingAudioWriter(output_path, sample_rate=1000, output_format="flac",
+                                  block_size=128) as writer:
+            for segment in self.segments:
+                writer.write_segment(segment)
+            # The float pass goes to RF64, which has no 4 GiB limit
+            writer._file.flush()
+            self.assertEqual(sf.info(writer._temp_path).format, 'RF64')
+
+        written, _ = sf.read(output_path, dtype='float32')
+        self.assertAlmostEqual(float(np.max(np.abs(written))), 10 ** (-0.1 / 20), delta=1e-3)
+        self.assertEqual([name for name in os.listdir(self.test_dir)], ["normalized.flac"])
+
+    def test_merge_segments_accepts_generator(self):
+        output_path = os.path.join(self.test_dir, "generator.wav")
+        processor = AudioProcessor(AudioProcessingConfig(sample_rate=2000, channels=2))
+
+        processor.merge_segments((segment for segment in self.segments), output_path)
+
+        info = sf.info(output_path)
+        self.assertEqual(info.samplerate, 2000)
+        self.assertEqual(info.channels, 2)
+
+    def test_empty_and_failed_writes(self):
+        output_path = os.path.join(self.test_dir, "failed.wav")
+        with self.assertRaises(ValueError):
+            with StreamingAudioWriter(output_path):
+                pass
+
+        with self.assertRaises(RuntimeError):
+            with StreamingAudioWriter(output_path) as writer:
+                writer.write_segment(self.segments[0])
+                raise RuntimeError("synthesis failed")
+        self.assertEqual(os.listdir(self.test_dir), [])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
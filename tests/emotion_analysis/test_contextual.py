@@ -62,5 +62,53 @@ class TestContextualAnalyzer(unittest.TestCase):
         self.assertGreater(score.attention_weights["amazing"], 
                           score.attention_weights.get("the", 0))
 
+    def test_analyze_batch_matches_single(self):
+        segments = [
+            TextSegment(
+                id=f"batch_{i}",
+                text=text,
+                segment_type="sentence",
+                start_pos=0,
+                end_pos=len(text)
+            )
+            for i, text in enumerate([
+                "What a wonderful surprise!",
+                "The service was terrible and the food was inedible, cold and late.",
+                "Fine."
+            ])
+        ]
+        batch_scores = self.analyzer.analyze_batch(segments, batch_size=2)
+        
+        self.assertEqual(len(batch_scores), len(segments))
+        for segment, batch_score in zip(segments, batch_scores):
+            single_score = self.analyzer.analyze_segment(segment)
+            self.assertAlmostEqual(batch_score.sentiment_score, single_score.sentiment_score, places=4)
+            self.assertEqual(batch_score.attention_weights.keys(), single_score.attention_weights.keys())
+            
+    def test_analyze_batch_empty(self):
+        self.assertEqual(self.analyzer.analyze_batch([]), [])
+
+    def test_attention_modes(self):
+        segment = TextSegment(
+            id="test_5",
+            text="The unbelievably talented actor gave an amazing performance!",
+            segment_type="sentence",
+            start_pos=0,
+            end_pos=61
+        )
+        full_score = ContextualAnalyzer(attention_mode='full').analyze_segment(segment)
+        off_score = ContextualAnalyzer(attention_mode='off').analyze_segment(segment)
+        last_score = self.analyzer.analyze_segment(segment)
+        
+        self.assertEqual(off_score.attention_weights, {})
+        self.assertAlmostEqual(off_score.sentiment_score, last_score.sentiment_score, places=4)
+        self.assertIn("unbelievably", last_score.attention_weights)
+        for word, weight in full_score.attention_weights.items():
+            self.assertAlmostEqual(last_score.attention_weights[word], weight, places=4)
+            
+    def test_invalid_attention_mode(self):
+        with self.assertRaises(ValueError):
+            ContextualAnalyzer(attention_mode='partial')
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
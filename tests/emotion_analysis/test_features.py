@@ -0,0 +1,30 @@
+import unittest
+from pyprosody.emotion_analysis.features import SegmentFeatures
+from pyprosody.text_processing.segmentation import TextSegment, SegmentStore
+
+class TestSegmentFeatures(unittest.TestCase):
+    def test_text_is_preprocessed_once(self):
+        features = SegmentFeatures.from_text("Really?! It's “GREAT”... really.")
+
+        self.assertEqual(features.lower, "really?! it's “great”... really.")
+        self.assertEqual(features.words, ["really?!", "it's", "“great”...", "really."])
+        self.assertEqual(features.tokens, ["really", "it", "s", "great", "really"])
+        self.assertEqual(features.token_set, {"really", "it", "s", "great"})
+        self.assertEqual(features.punctuation, {'!': 1, '?': 1, "'": 1, '.': 4})
+        self.assertEqual(features.count('.'), 4)
+        self.assertEqual(features.count('*'), 0)
+        self.assertIsNone(features.tagged)
+
+    def test_segment_tokens_are_kept(self):
+        store = SegmentStore("Good day.")
+        store.append(1, 0, 9, 0)
+        for start, end, tag in ((0, 4, 'JJ'), (5, 8, 'NN'), (8, 9, '.')):
+            store.append_token(start, end, tag)
+
+        self.assertEqual(SegmentFeatures.from_segment(store[0]).tagged,
+                         [("Good", "JJ"), ("day", "NN"), (".", ".")])
+        plain = TextSegment(id="s0", text="Good day.", segment_type="sentence", start_pos=0, end_pos=9)
+        self.assertIsNone(SegmentFeatures.from_segment(plain).tagged)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import unittest
+from unittest import mock
 from pyprosody.emotion_analysis.lexical import LexicalAnalyzer
-from pyprosody.text_processing.segmentation import TextSegment
+from pyprosody.text_processing.segmentation import TextSegment, SegmentStore
 
 class TestLexicalAnalyzer(unittest.TestCase):
     def setUp(self):
@@ -78,5 +79,42 @@ class TestLexicalAnalyzer(unittest.TestCase):
         self.assertEqual(score.objective_score, 1.0)
         self.assertEqual(score.compound_score, 0)
 
+class TestLexicalBatch(unittest.TestCase):
+    def setUp(self):
+        # Stand-ins for AFINN and SentiWordNet, so only token handling is exercised
+        self.analyzer = LexicalAnalyzer()
+        self.analyzer._afinn = mock.Mock(**{'score.return_value': 0.0})
+        scores = {('happy', 'a'): (0.75, 0.0, 0.25), ('rain', 'n'): (0.0, 0.25, 0.75)}
+        self.analyzer._swn = mock.Mock(**{'word_scores.side_effect': lambda word, pos: scores.get((word.lower(), pos))})
+
+        self.store = SegmentStore("Happy rain.")
+        self.store.append(1, 0, 11, 0)
+        for start, end, tag in ((0, 5, 'JJ'), (6, 10, 'NN'), (10, 11, '.')):
+            self.store.append_token(start, end, tag)
+
+    def test_uses_segment_tokens_without_nltk(self):
+        with mock.patch('nltk.word_tokenize') as tokenize, mock.patch('nltk.pos_tag_sents') as tag:
+            score = self.analyzer.analyze_segment(self.store[0])
+            tokenize.assert_not_called()
+            tag.assert_not_called()
+
+        self.assertEqual(score.positive_score, 0.375)
+        self.assertEqual(score.negative_score, 0.125)
+        self.assertEqual(score.objective_score, 0.5)
+
+    def test_untagged_segments_are_tagged_together(self):
+        plain = [TextSegment(id=f"s{i}", text="Happy rain.", segment_type="sentence", start_pos=0, end_pos=11)
+                 for i in range(2)]
+        tagged = [('Happy', 'JJ'), ('rain', 'NN'), ('.', '.')]
+
+        with mock.patch.object(self.analyzer.resources, 'ensure'), \
+                mock.patch('nltk.word_tokenize', return_value=['Happy', 'rain', '.']), \
+                mock.patch('nltk.pos_tag_sents', return_value=[tagged, tagged]) as tag:
+            scores = self.analyzer.analyze_batch([plain[0], self.store[0], plain[1]])
+            tag.assert_called_once()
+
+        self.assertEqual(scores[0], scores[1])
+        self.assertEqual(scores[1], scores[2])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,7 @@
 import unittest
-from pyprosody.emotion_analysis.pragmatic import PragmaticAnalyzer
+import time
+from pyprosody.emotion_analysis.pragmatic import PragmaticAnalyzer, PragmaticConfig, PhraseMatcher
+from pyprosody.emotion_analysis.features import SegmentFeatures
 from pyprosody.text_processing.segmentation import TextSegment
 
 class TestPragmaticAnalyzer(unittest.TestCase):
@@ -68,5 +70,83 @@ class TestPragmaticAnalyzer(unittest.TestCase):
         self.assertGreater(score.emotional_intensity, 0.5)
         self.assertGreater(score.certainty_level, 0.7)
 
+    def test_markers_match_whole_words(self):
+        segment = TextSegment(
+            id="test_6",
+            text="She also went to the island, but hesitantly.",
+            segment_type="sentence",
+            start_pos=0,
+            end_pos=44
+        )
+        score = self.analyzer.analyze_segment(segment)
+
+        self.assertEqual(score.features.discourse_markers, {'contrast': 1})
+        self.assertNotIn('comparison', score.features.rhetorical_devices)
+
+    def test_batch_matches_single_segments(self):
+        texts = [
+            "Well, you\nknow, it's kind of done.",
+            "Moreover, it is certainly clear.",
+            "",
+            "So it may be, then, like before."
+        ]
+        segments = [
+            TextSegment(id=f"b{i}", text=text, segment_type="sentence", start_pos=0, end_pos=len(text))
+            for i, text in enumerate(texts)
+        ]
+
+        self.assertEqual(
+            self.analyzer.analyze_batch(segments),
+            [self.analyzer.analyze_segment(segment) for segment in segments]
+        )
+
+    def test_parallel_structure(self):
+        parallel = "We shall fight on the beaches, we shall fight on the landing grounds."
+        plain = "The cat sat on the mat and looked at the dog on the rug."
+
+        self.assertTrue(self.analyzer._has_parallel_structure(SegmentFeatures.from_text(parallel).tokens))
+        self.assertFalse(self.analyzer._has_parallel_structure(SegmentFeatures.from_text(plain).tokens))
+
+    def test_long_paragraph_is_linear(self):
+        text = " ".join(f"word{i}" for i in range(50000)) + " why"
+        segment = TextSegment(id="long", text=text, segment_type="paragraph", start_pos=0, end_pos=len(text))
+
+        analyzer = PragmaticAnalyzer(PragmaticConfig(max_pattern_chars=len(text)))
+        start = time.perf_counter()
+        score = analyzer.analyze_segment(segment)
+
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertNotIn('parallel_structure', score.features.rhetorical_devices)
+        self.assertNotIn('rhetorical_question', score.features.rhetorical_devices)
+
+    def test_long_segment_skips_pattern_checks(self):
+        text = "Why?? Why NOT, why not?"
+        segment = TextSegment(id="long", text=text, segment_type="sentence", start_pos=0, end_pos=len(text))
+
+        with self.assertLogs('pyprosody', level='WARNING'):
+            skipped = PragmaticAnalyzer(PragmaticConfig(max_pattern_chars=len(text) - 1)).analyze_segment(segment)
+        checked = PragmaticAnalyzer(PragmaticConfig(max_pattern_chars=len(text))).analyze_segment(segment)
+
+        self.assertEqual(skipped.features.emphasis_patterns, [])
+        self.assertEqual(skipped.features.rhetorical_devices, [])
+        self.assertIn('capitalization', checked.features.emphasis_patterns)
+        self.assertIn('rhetorical_question', checked.features.rhetorical_devices)
+
+class TestPhraseMatcher(unittest.TestCase):
+    def setUp(self):
+        self.matcher = PhraseMatcher({
+            'a': {'so', 'kind of'},
+            'b': {'so', 'kind'},
+        })
+
+    def test_counts_distinct_phrases_per_category(self):
+        self.assertEqual(self.matcher.count("so so, kind  of"), {'a': 2, 'b': 2})
+        self.assertEqual(self.matcher.count("also kindly"), {})
+
+    def test_phrases_do_not_span_punctuation(self):
+        self.assertEqual(self.matcher.count("kind. of"), {'b': 1})
+        self.assertEqual(self.matcher.count("\u201ckind\u201d of"), {'b': 1})
+        self.assertEqual(self.matcher.count("it's kind of"), {'a': 1, 'b': 1})
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
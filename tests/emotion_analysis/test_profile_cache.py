@@ -0,0 +1,70 @@
+import unittest
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pyprosody.emotion_analysis.cache import ProfileCache
+from pyprosody.emotion_analysis.combiner import EmotionProfile
+from pyprosody.text_processing.segmentation import TextSegment
+
+class TestProfileCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "profiles.sqlite")
+        self.cache = ProfileCache(self.path, memory_entries=1)
+        self.segment = TextSegment(id="p0_s0", text="He said.", segment_type="sentence",
+                                   start_pos=0, end_pos=8, parent_id="p0")
+        self.profile = EmotionProfile(
+            segment_id="p0_s0",
+            text_reference=self.segment,
+            basic_sentiment={'polarity': 0.25, 'objectivity': 0.5},
+            complex_emotions=[{'type': 'joy', 'intensity': 0.4}],
+            sarcasm_indicators={'probability': 0.1, 'features': []},
+            prosody_markers={'speed_factor': 1.0},
+            metadata={'timestamp': datetime(2024, 1, 1), 'attention_weights': {'said': 0.3}}
+        )
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.test_dir)
+
+    def test_round_trip_rebinds_segment(self):
+        key = self.cache.key(self.segment.text, "v1")
+        self.cache.put(key, self.profile)
+        other = TextSegment(id="p9_s3", text="He said.", segment_type="sentence",
+                            start_pos=90, end_pos=98, parent_id="p9")
+
+        cached = self.cache.get(key, other)
+
+        self.assertEqual(cached.segment_id, "p9_s3")
+        self.assertIs(cached.text_reference, other)
+        self.assertEqual(cached.basic_sentiment, self.profile.basic_sentiment)
+        self.assertEqual(cached.complex_emotions, self.profile.complex_emotions)
+        self.assertEqual(cached.metadata['timestamp'], datetime(2024, 1, 1))
+
+    def test_put_many_in_one_transaction(self):
+        keys = [self.cache.key(f"text {i}", "v1") for i in range(3)]
+        self.cache.put_many((key, self.profile) for key in keys)
+        self.cache.close()
+
+        with ProfileCache(self.path) as reopened:
+            for key in keys:
+                self.assertEqual(reopened.get(key, self.segment).basic_sentiment, self.profile.basic_sentiment)
+        self.cache = ProfileCache(self.path)
+
+    def test_version_changes_key(self):
+        self.assertNotEqual(self.cache.key("text", "v1"), self.cache.key("text", "v2"))
+
+    def test_persists_beyond_memory_front(self):
+        first, second = self.cache.key("first", "v1"), self.cache.key("second", "v1")
+        self.cache.put(first, self.profile)
+        self.cache.put(second, self.profile)
+        self.cache.close()
+
+        self.cache = ProfileCache(self.path)
+
+        self.assertIsNotNone(self.cache.get(first, self.segment))
+        self.assertIsNone(self.cache.get(self.cache.key("missing", "v1"), self.segment))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
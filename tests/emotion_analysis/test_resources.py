@@ -0,0 +1,181 @@
+import unittest
+from unittest import mock
+import os
+import shutil
+import tempfile
+import numpy as np
+from pyprosody.emotion_analysis import resources
+from pyprosody.emotion_analysis.resources import (
+    NLTKResources, NLTKResourceConfig, SentiWordNetLookup, SentiWordNetTable, TABLE_FORMAT
+)
+from pyprosody.utils.exceptions import ModelLoadError
+
+SENTIWORDNET = (
+    "# POS\tID\tPosScore\tNegScore\tSynsetTerms\tGloss\n"
+    "a\t00001740\t0.125\t0\table#1\t(usually followed by `to')\n"
+    "n\t00001740\t0\t0\tentity#1\tthat which is perceived\n"
+    "a\t01123148\t0.75\t0\tgood#1\thaving desirable qualities\n"
+    "\n"
+)
+
+class TestNLTKResources(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        resources._verified.clear()
+        resources._lookups.clear()
+        resources._tables.clear()
+
+    def tearDown(self):
+        import nltk
+        if self.data_dir in nltk.data.path:
+            nltk.data.path.remove(self.data_dir)
+        shutil.rmtree(self.data_dir)
+        resources._verified.clear()
+        resources._lookups.clear()
+
+    def provision(self):
+        for package, path in NLTKResources()._resources().values():
+            target = os.path.join(self.data_dir, path)
+            if path.endswith('/'):
+                os.makedirs(target, exist_ok=True)
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target, 'w', encoding='utf-8') as f:
+                    f.write(SENTIWORDNET)
+
+    def test_local_data_dir_is_verified_once(self):
+        self.provision()
+        config = NLTKResourceConfig(data_dir=self.data_dir, allow_download=False)
+
+        with mock.patch('nltk.download') as download:
+            NLTKResources(config).ensure()
+            with mock.patch('nltk.data.find') as find:
+                NLTKResources(config).ensure()
+                find.assert_not_called()
+            download.assert_not_called()
+
+    def test_missing_data_fails_fast_offline(self):
+        config = NLTKResourceConfig(data_dir=self.data_dir, allow_download=False)
+
+        with mock.patch('nltk.data.path', [self.data_dir]), mock.patch('nltk.download') as download:
+            with self.assertRaises(ModelLoadError) as context:
+                NLTKResources(config).ensure()
+            download.assert_not_called()
+        self.assertIn('sentiwordnet', str(context.exception))
+        self.assertEqual(resources._verified, set())
+
+    def test_resources_are_verified_by_name(self):
+        config = NLTKResourceConfig(data_dir=self.data_dir, allow_download=False)
+        tokenizer_path = NLTKResources()._resources()['tokenizer'][1]
+        os.makedirs(os.path.join(self.data_dir, tokenizer_path))
+
+        with mock.patch('nltk.data.path', [self.data_dir]):
+            NLTKResources(config).ensure(('tokenizer',))
+            with self.assertRaises(ModelLoadError):
+                NLTKResources(config).ensure(('tokenizer', 'wordnet'))
+        self.assertEqual(resources._verified, {(self.data_dir, 'tokenizer')})
+
+    def test_sentiwordnet_is_parsed_once(self):
+        self.provision()
+        config = NLTKResourceConfig(data_dir=self.data_dir, allow_download=False)
+
+        lookup = NLTKResources(config).sentiwordnet()
+
+        self.assertIs(NLTKResources(config).sentiwordnet(), lookup)
+        self.assertEqual(len(lookup), 3)
+
+    def test_existing_table_needs_no_nltk_data(self):
+        import nltk
+        path = os.path.join(self.data_dir, f"sentiwordnet-v{TABLE_FORMAT}-nltk{nltk.__version__}.npy")
+        build_table(FakeLookup({('good', 'a'): (0.75, 0.0, 0.25)})).save(path)
+        config = NLTKResourceConfig(data_dir=self.data_dir, allow_download=False, table_dir=self.data_dir)
+
+        with mock.patch.object(SentiWordNetTable, 'build') as build:
+            table = NLTKResources(config).sentiwordnet()
+            build.assert_not_called()
+
+        self.assertIsInstance(table, SentiWordNetTable)
+        self.assertIsInstance(table.table, np.memmap)
+        self.assertEqual(resources._verified, set())
+        self.assertEqual(table.word_scores('good', 'a'), (0.75, 0.0, 0.25))
+
+class FakeLookup:
+    def __init__(self, scores):
+        self.scores = scores
+
+    def first_sense_scores(self, word, pos):
+        return self.scores.get((word.lower(), pos))
+
+def build_table(lookup):
+    wordnet = mock.Mock(
+        _exception_map={'n': {'geese': ['goose']}, 'v': {}, 'a': {'better': ['good', 'well']}, 'r': {}},
+        MORPHOLOGICAL_SUBSTITUTIONS={'n': [('s', ''), ('ies', 'y')], 'v': [], 'a': [('er', '')], 'r': []}
+    )
+    wordnet.all_lemma_names.side_effect = lambda pos: {'n': ['goose', 'lady'], 'a': ['good']}.get(pos, [])
+    with mock.patch('nltk.corpus.wordnet', new=wordnet):
+        return SentiWordNetTable.build(lookup)
+
+class TestSentiWordNetTable(unittest.TestCase):
+    def setUp(self):
+        self.lookup = FakeLookup({
+            ('goose', 'n'): (0.0, 0.0, 1.0),
+            ('geese', 'n'): (0.0, 0.0, 1.0),
+            ('ladies', 'n'): (0.0, 0.125, 0.875),
+            ('good', 'a'): (0.75, 0.0, 0.25),
+            ('better', 'a'): (0.875, 0.0, 0.125),
+        })
+        self.table = build_table(self.lookup)
+
+    def test_covers_lemmas_exceptions_and_inflections(self):
+        self.assertEqual(len(self.table), 5)
+        self.assertEqual(self.table.word_scores('Ladies', 'n'), (0.0, 0.125, 0.875))
+        self.assertEqual(self.table.word_scores('better', 'a'), (0.875, 0.0, 0.125))
+        self.assertIsNone(self.table.word_scores('gooder', 'a'))
+        self.assertIsNone(self.table.word_scores('good', 'n'))
+
+    def test_save_and_load_round_trip(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'table.npy')
+
+        self.table.save(path)
+        loaded = SentiWordNetTable.load(path)
+
+        self.assertEqual(os.listdir(directory), ['table.npy'])
+        for word, pos in self.lookup.scores:
+            self.assertEqual(loaded.word_scores(word, pos), self.lookup.scores[(word, pos)])
+
+class TestSentiWordNetLookup(unittest.TestCase):
+    def setUp(self):
+        self.lookup = SentiWordNetLookup.parse(SENTIWORDNET.splitlines())
+
+    def test_synset_scores(self):
+        self.assertEqual(self.lookup.synset_scores('a', 1123148), (0.75, 0.0, 0.25))
+        self.assertEqual(self.lookup.synset_scores('n', 1740), (0.0, 0.0, 1.0))
+        self.assertIsNone(self.lookup.synset_scores('v', 1740))
+
+    def test_satellite_adjectives_use_adjective_scores(self):
+        self.assertEqual(self.lookup.synset_scores('s', 1740), self.lookup.synset_scores('a', 1740))
+
+    def test_table_build_leaves_no_memo(self):
+        wordnet = mock.Mock(_exception_map={'n': {}, 'v': {}, 'a': {}, 'r': {}},
+                            MORPHOLOGICAL_SUBSTITUTIONS={'n': [], 'v': [], 'a': [], 'r': []})
+        wordnet.all_lemma_names.side_effect = lambda pos: ['good'] if pos == 'a' else []
+        wordnet.synsets.return_value = [mock.Mock(**{'pos.return_value': 'a', 'offset.return_value': 1123148})]
+        with mock.patch('nltk.corpus.wordnet', new=wordnet):
+            table = SentiWordNetTable.build(self.lookup)
+
+        self.assertEqual(table.word_scores('good', 'a'), (0.75, 0.0, 0.25))
+        self.assertEqual(self.lookup._memo, {})
+
+    def test_word_scores_use_first_covered_sense(self):
+        senses = [mock.Mock(**{'pos.return_value': 'a', 'offset.return_value': offset})
+                  for offset in (999, 1123148, 1740)]
+        wordnet = mock.Mock()
+        with mock.patch('nltk.corpus.wordnet', new=wordnet):
+            wordnet.synsets.return_value = senses
+            self.assertEqual(self.lookup.word_scores('good', 'a'), (0.75, 0.0, 0.25))
+            self.assertEqual(self.lookup.word_scores('good', 'a'), (0.75, 0.0, 0.25))
+            wordnet.synsets.return_value = []
+            self.assertIsNone(self.lookup.word_scores('xyzzy', 'a'))
+        self.assertEqual(wordnet.synsets.call_count, 2)
\ No newline at end of file
@@ -0,0 +1,80 @@
+import unittest
+from datetime import datetime
+from pyprosody.emotion_analysis.store import ProfileStore
+from pyprosody.emotion_analysis.combiner import EmotionProfile
+from pyprosody.audio_generation.prosody import ProsodyMapper
+from pyprosody.text_processing.segmentation import TextSegment
+
+class TestProfileStore(unittest.TestCase):
+    def setUp(self):
+        self.profiles = [self._profile(i) for i in range(5)]
+        self.store = ProfileStore(capacity=2)
+        self.store.extend(self.profiles)
+
+    def _profile(self, index):
+        segment = TextSegment(id=f"p0_s{index}", text=f"Sentence {index}.", segment_type="sentence",
+                              start_pos=index * 12, end_pos=index * 12 + 11, parent_id="p0")
+        return EmotionProfile(
+            segment_id=segment.id,
+            text_reference=segment,
+            basic_sentiment={'polarity': 0.25 * (index - 2), 'objectivity': 0.5},
+            complex_emotions=[{'type': 'joy', 'intensity': 0.5}, {'type': 'anger', 'intensity': 0.1 * index}],
+            sarcasm_indicators={'probability': 0.2 * index, 'features': ["Excessive use of intensifiers"] if index % 2 else []},
+            prosody_markers={'speed_factor': 1.0, 'pitch_shift': 0.0, 'volume_adjust': 1.0, 'emphasis_level': 0.5},
+            metadata={
+                'timestamp': datetime(2024, 1, 1, 12, index),
+                'model_version': '1.0',
+                'processing_time': 0.25,
+                'attention_weights': {'sentence': 0.75, str(index): 0.5}
+            }
+        )
+
+    def test_views_match_profiles(self):
+        self.assertEqual(len(self.store), 5)
+        for view, profile in zip(self.store, self.profiles):
+            self.assertEqual(view.segment_id, profile.segment_id)
+            self.assertIs(view.text_reference, profile.text_reference)
+            for key, value in profile.basic_sentiment.items():
+                self.assertAlmostEqual(view.basic_sentiment[key], value, places=6)
+            self.assertEqual(view.sarcasm_indicators['features'], profile.sarcasm_indicators['features'])
+            self.assertAlmostEqual(view.sarcasm_indicators['probability'],
+                                   profile.sarcasm_indicators['probability'], places=6)
+            self.assertEqual(view.metadata['timestamp'], profile.metadata['timestamp'])
+            self.assertEqual(view.metadata['model_version'], '1.0')
+            self.assertEqual(view.metadata['attention_weights'], profile.metadata['attention_weights'])
+            emotions = {e['type']: e['intensity'] for e in view.complex_emotions}
+            self.assertAlmostEqual(emotions['joy'], 0.5)
+        self.assertNotIn('anger', {e['type'] for e in self.store[0].complex_emotions})
+        self.assertEqual(self.store[-1].segment_id, "p0_s4")
+
+    def test_unknown_keys_are_kept(self):
+        profile = self._profile(9)
+        profile.complex_emotions.append({'emotion_type': 'awe', 'intensity': 0.3, 'confidence': 0.5})
+        profile.basic_sentiment['confidence'] = 0.8
+        profile.metadata['aggregated_from'] = ["p0_s9", "p0"]
+
+        restored = self.store.profile(self.store.append(profile))
+
+        self.assertIn({'emotion_type': 'awe', 'intensity': 0.3, 'confidence': 0.5}, restored.complex_emotions)
+        self.assertEqual(restored.basic_sentiment['confidence'], 0.8)
+        self.assertEqual(restored.metadata['aggregated_from'], ["p0_s9", "p0"])
+
+    def test_shared_tables_are_interned(self):
+        self.assertEqual(self.store.features, ["Excessive use of intensifiers"])
+        self.assertEqual(self.store.versions, ['1.0'])
+        self.assertEqual(self.store.words.count('sentence'), 1)
+
+    def test_prosody_mapper_reads_columns(self):
+        mapper = ProsodyMapper()
+
+        from_store = mapper.map_batch(self.store)
+        from_profiles = mapper.map_batch(self.profiles)
+
+        for a, b in zip(from_store, from_profiles):
+            self.assertAlmostEqual(a.speed, b.speed, places=5)
+            self.assertAlmostEqual(a.pitch, b.pitch, places=5)
+            self.assertAlmostEqual(a.energy, b.energy, places=5)
+            self.assertEqual(a.emphasis_words, b.emphasis_words)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -21,6 +21,8 @@ class TestPipelineIntegration(unittest.TestCase):
         }
         
     def tearDown(self):
+        self.pipeline.close()
+
         # Clean up test files
         for file in Path(self.test_dir).glob("*"):
             file.unlink()
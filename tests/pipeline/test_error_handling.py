@@ -22,6 +22,8 @@ class TestPipelineErrorHandling(unittest.TestCase):
         Path(self.test_input).write_text("Test content")
     
     def tearDown(self):
+        self.pipeline.close()
+
         # Clean up test files
         for path in [self.test_input, self.test_output]:
             if Path(path).exists():
@@ -39,7 +41,7 @@ class TestPipelineErrorHandling(unittest.TestCase):
     
     @patch('pyprosody.pipeline.main.EmotionAnalyzer')
     def test_emotion_analysis_error(self, mock_analyzer):
-        mock_analyzer.return_value.analyze.side_effect = EmotionAnalysisError("Failed to analyze emotions")
+        mock_analyzer.return_value.analyze_batch.side_effect = EmotionAnalysisError("Failed to analyze emotions")
         
         result = self.pipeline.process(self.test_input, self.test_output)
         
@@ -49,7 +51,7 @@ class TestPipelineErrorHandling(unittest.TestCase):
     
     @patch('pyprosody.pipeline.main.TTSEngine')
     def test_audio_generation_error(self, mock_tts):
-        mock_tts.return_value.generate_speech.side_effect = AudioGenerationError("Failed to generate audio")
+        mock_tts.return_value.generate_batch.side_effect = AudioGenerationError("Failed to generate audio")
         
         result = self.pipeline.process(self.test_input, self.test_output)
         
@@ -1,7 +1,17 @@
 import unittest
 import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
+import numpy as np
 from pyprosody.pipeline.main import Pipeline
+from pyprosody.audio_generation.tts import AudioSegment
+from pyprosody.emotion_analysis.analyzer import EmotionAnalyzer
+from pyprosody.emotion_analysis.combiner import EmotionProfile
+from pyprosody.text_processing.segmentation import TextSegment
 
 class TestPipeline(unittest.TestCase):
     def setUp(self):
@@ -17,6 +27,8 @@ class TestPipeline(unittest.TestCase):
         self.output_path = self.test_dir / "test_output.wav"
     
     def tearDown(self):
+        self.pipeline.close()
+
         # Clean up test files
         if self.input_path.exists():
             self.input_path.unlink()
@@ -45,5 +57,87 @@ class TestPipeline(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertIn("error", result)
 
+def _segments():
+    return [
+        TextSegment(id="p0", text="A b. C d.", segment_type="paragraph", start_pos=0, end_pos=9),
+        TextSegment(id="p0_s0", text="A b.", segment_type="sentence", start_pos=0, end_pos=4, parent_id="p0"),
+        TextSegment(id="p0_s1", text="C d.", segment_type="sentence", start_pos=5, end_pos=9, parent_id="p0")
+    ]
+
+def _profiles(segments, batch_size):
+    return [
+        EmotionProfile(
+            segment_id=segment.id,
+            text_reference=segment,
+            basic_sentiment={'polarity': 0.5, 'objectivity': 0.5},
+            complex_emotions=[{'type': 'joy', 'intensity': 0.5}],
+            sarcasm_indicators={'probability': 0.1, 'features': []},
+            prosody_markers={},
+            metadata={'timestamp': datetime.now(), 'attention_weights': {'b': 0.9}}
+        )
+        for segment in segments
+    ]
+
+def _synthesize(jobs, output_dir):
+    for segment, _ in jobs:
+        yield AudioSegment(segment_id=segment.id, audio_path=None, duration=0.5, sample_rate=1000,
+                           metadata={}, samples=np.full(500, 0.3, dtype=np.float32))
+
+class TestPipelineLifecycle(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.input_path = Path(self.test_dir.name) / "input.txt"
+        self.input_path.write_text("A b. C d.")
+        self.config = {'tts_workers': 2, 'profile_cache_path': str(Path(self.test_dir.name) / "profiles.db")}
+
+    def tearDown(self):
+        self.test_dir.cleanup()
+
+    @patch.object(EmotionAnalyzer, '_analyze_uncached', side_effect=_profiles)
+    @patch('pyprosody.pipeline.main.TextSegmenter')
+    @patch('pyprosody.pipeline.main.TTSWorkerPool')
+    def test_process_reuses_workers_and_cache(self, mock_pool, mock_segmenter, mock_analyze):
+        mock_segmenter.return_value.segment_text.side_effect = lambda text: _segments()
+        mock_pool.return_value.generate_batch.side_effect = _synthesize
+
+        with Pipeline(self.config) as pipeline:
+            results = [
+                pipeline.process(str(self.input_path), str(Path(self.test_dir.name) / f"out{i}.wav"))
+                for i in range(2)
+            ]
+            mock_pool.return_value.close.assert_not_called()
+
+        for result in results:
+            self.assertTrue(result["success"], result.get("error"))
+            self.assertEqual(result["stats"]["units_synthesized"], 2)
+        # The second file is served from the still-open profile cache
+        self.assertEqual(mock_analyze.call_count, 2)
+        self.assertEqual(len(mock_analyze.call_args_list[1][0][0]), 0)
+
+    @patch('pyprosody.pipeline.main.ProfileCache')
+    @patch('pyprosody.pipeline.main.TTSWorkerPool')
+    def test_close_releases_workers_and_cache(self, mock_pool, mock_cache):
+        with Pipeline(self.config):
+            mock_pool.return_value.close.assert_not_called()
+
+        mock_pool.return_value.close.assert_called_once()
+        mock_cache.return_value.close.assert_called_once()
+
+class TestLazyLoading(unittest.TestCase):
+    def test_construction_loads_no_models(self):
+        # Run in a fresh interpreter so other tests' imports don't leak in
+        code = (
+            "import sys\n"
+            "from pyprosody.pipeline.main import Pipeline\n"
+            "Pipeline()\n"
+            "heavy = ('torch', 'transformers', 'TTS', 'spacy', 'nltk')\n"
+            "print(','.join(m for m in heavy if m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                cwd=str(Path(__file__).resolve().parents[2]))
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,177 @@
+import unittest
+import os
+import tempfile
+import threading
+from datetime import datetime
+from unittest.mock import patch
+import numpy as np
+import soundfile as sf
+from pyprosody.pipeline.main import Pipeline
+from pyprosody.pipeline.streaming import StageRunner, group_paragraphs
+from pyprosody.audio_generation.tts import AudioSegment
+from pyprosody.emotion_analysis.combiner import EmotionProfile
+from pyprosody.text_processing.segmentation import TextSegment
+from pyprosody.utils.exceptions import AudioGenerationError
+
+class TestStageRunner(unittest.TestCase):
+    def setUp(self):
+        self.runner = StageRunner(queue_size=2, poll_interval=0.01)
+
+    def test_preserves_order_across_stages(self):
+        results = list(self.runner.run(
+            range(50),
+            [lambda x: [x, x], lambda x: [x * 10]]
+        ))
+
+        self.assertEqual(results, [x * 10 for x in range(50) for _ in range(2)])
+
+    def test_backpressure_bounds_producer(self):
+        produced = []
+        release = threading.Event()
+
+        def source():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        def slow_stage(x):
+            release.wait()
+            yield x
+
+        results = self.runner.run(source(), [slow_stage])
+        consumer = threading.Thread(target=lambda: list(results))
+        consumer.start()
+        consumer.join(timeout=0.3)
+
+        # One item held by the stage plus one full input queue and a blocked put
+        self.assertLessEqual(len(produced), 4)
+        release.set()
+        consumer.join()
+        self.assertEqual(len(produced), 100)
+
+    def test_stage_error_is_raised(self):
+        def failing(x):
+            if x == 3:
+                raise RuntimeError("stage failed")
+            yield x
+
+        with self.assertRaises(RuntimeError):
+            list(self.runner.run(range(10), [failing]))
+
+    def test_source_error_is_raised(self):
+        def source():
+            yield 1
+            raise ValueError("bad input")
+
+        with self.assertRaises(ValueError):
+            list(self.runner.run(source(), [lambda x: [x]]))
+
+class TestGroupParagraphs(unittest.TestCase):
+    def _segment(self, segment_id, segment_type):
+        return TextSegment(id=segment_id, text="x", segment_type=segment_type, start_pos=0, end_pos=1)
+
+    def test_groups_split_at_paragraph_boundaries(self):
+        segments = [
+            self._segment("p0", "paragraph"), self._segment("p0_s0", "sentence"),
+            self._segment("p1", "paragraph"), self._segment("p1_s0", "sentence"),
+            self._segment("p1_s1", "sentence"),
+            self._segment("p2", "paragraph"),
+        ]
+        groups = list(group_paragraphs(segments, min_size=3))
+
+        self.assertEqual([[s.id for s in group] for group in groups],
+                         [["p0", "p0_s0", "p1", "p1_s0", "p1_s1"], ["p2"]])
+
+def _profiles(segments, batch_size):
+    return [
+        EmotionProfile(
+            segment_id=segment.id,
+            text_reference=segment,
+            basic_sentiment={'polarity': 0.5, 'objectivity': 0.5},
+            complex_emotions=[{'type': 'joy', 'intensity': 0.5}],
+            sarcasm_indicators={'probability': 0.1, 'features': []},
+            prosody_markers={},
+            metadata={'timestamp': datetime.now(), 'attention_weights': {}}
+        )
+        for segment in segments
+    ]
+
+class TestStreamingPipeline(unittest.TestCase):
+    # One second per unit, at the audio processor's default rate
+    SAMPLE_RATE = 44100
+    CROSSFADE = 4410
+
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.test_dir.name, "input.txt")
+        self.output_path = os.path.join(self.test_dir.name, "output.wav")
+        self.segments = []
+        for p in range(2):
+            self.segments.append(TextSegment(id=f"p{p}", text="A b. C d.", segment_type="paragraph",
+                                             start_pos=0, end_pos=9))
+            for s in range(2):
+                self.segments.append(TextSegment(id=f"p{p}_s{s}", text="A b." if s == 0 else "C d.",
+                                                 segment_type="sentence", start_pos=5 * s,
+                                                 end_pos=5 * s + 4, parent_id=f"p{p}"))
+        self.synthesized = []
+
+    def tearDown(self):
+        self.test_dir.cleanup()
+
+    def _synthesize(self, jobs, output_dir):
+        for segment, _ in jobs:
+            self.synthesized.append(segment.id)
+            # Each unit has its own level, so the output shows the order units were written in
+            level = 0.1 * len(self.synthesized)
+            yield AudioSegment(segment_id=segment.id, audio_path=None, duration=1.0,
+                               sample_rate=self.SAMPLE_RATE, metadata={},
+                               samples=np.full(self.SAMPLE_RATE, level, dtype=np.float32))
+
+    def _process(self, mock_reader, mock_analyzer):
+        mock_reader.return_value.stream_segments.side_effect = lambda path: iter(self.segments)
+        mock_analyzer.return_value.analyze_batch.side_effect = _profiles
+        with Pipeline({'streaming': True, 'analysis_batch_size': 2, 'queue_size': 1}) as pipeline:
+            return pipeline.process(self.input_path, self.output_path)
+
+    @patch('pyprosody.pipeline.main.TTSEngine')
+    @patch('pyprosody.pipeline.main.EmotionAnalyzer')
+    @patch('pyprosody.pipeline.main.TextReader')
+    def test_units_are_written_in_order(self, mock_reader, mock_analyzer, mock_tts):
+        mock_tts.return_value.generate_batch.side_effect = self._synthesize
+
+        result = self._process(mock_reader, mock_analyzer)
+
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual(result["stats"]["segments_processed"], 6)
+        self.assertEqual(result["stats"]["units_synthesized"], 4)
+        self.assertEqual(self.synthesized, ["p0_s0", "p0_s1", "p1_s0", "p1_s1"])
+        # Paragraphs are grouped separately, so each group is analyzed on its own
+        self.assertEqual(mock_analyzer.return_value.analyze_batch.call_count, 2)
+
+        written, sample_rate = sf.read(self.output_path, dtype='float32')
+        step = self.SAMPLE_RATE - self.CROSSFADE
+        self.assertEqual(sample_rate, self.SAMPLE_RATE)
+        self.assertEqual(len(written), 4 * self.SAMPLE_RATE - 3 * self.CROSSFADE)
+        levels = [written[i * step + self.SAMPLE_RATE // 2] for i in range(4)]
+        np.testing.assert_allclose(np.array(levels) / levels[-1], [0.25, 0.5, 0.75, 1.0], atol=1e-3)
+
+    @patch('pyprosody.pipeline.main.TTSEngine')
+    @patch('pyprosody.pipeline.main.EmotionAnalyzer')
+    @patch('pyprosody.pipeline.main.TextReader')
+    def test_stage_error_leaves_no_output(self, mock_reader, mock_analyzer, mock_tts):
+        def fail_second_group(jobs, output_dir):
+            if self.synthesized:
+                raise AudioGenerationError("Failed to generate audio")
+            return self._synthesize(jobs, output_dir)
+        mock_tts.return_value.generate_batch.side_effect = fail_second_group
+
+        result = self._process(mock_reader, mock_analyzer)
+
+        self.assertFalse(result["success"])
+        self.assertIn("Failed to generate audio", result["error"])
+        self.assertEqual(self.synthesized, ["p0_s0", "p0_s1"])
+        # The writer's abort removes both the output and its temporary file
+        self.assertEqual(os.listdir(self.test_dir.name), [])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
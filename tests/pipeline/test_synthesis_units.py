@@ -0,0 +1,82 @@
+import unittest
+from datetime import datetime
+from pyprosody.pipeline.synthesis_units import SynthesisUnitSelector, SynthesisUnitConfig
+from pyprosody.emotion_analysis.combiner import EmotionProfile
+from pyprosody.emotion_analysis.store import ProfileStore
+from pyprosody.text_processing.segmentation import TextSegment
+
+class TestSynthesisUnitSelector(unittest.TestCase):
+    def setUp(self):
+        self.selector = SynthesisUnitSelector()
+        self.segments = [
+            TextSegment(id="p0", text="I won. It hurt.", segment_type="paragraph",
+                        start_pos=0, end_pos=15),
+            TextSegment(id="p0_s0", text="I won.", segment_type="sentence",
+                        start_pos=0, end_pos=6, parent_id="p0"),
+            TextSegment(id="p0_s0_ph0", text="won", segment_type="phrase",
+                        start_pos=2, end_pos=5, parent_id="p0_s0"),
+            TextSegment(id="p0_s1", text="It hurt.", segment_type="sentence",
+                        start_pos=7, end_pos=15, parent_id="p0"),
+        ]
+        self.profiles = [
+            self._profile("p0", 0.0, {'lost': 0.9}),
+            self._profile("p0_s0", 0.5, {'i': 0.1}),
+            self._profile("p0_s0_ph0", 1.0, {'won': 0.9}, emotions=[{'type': 'joy', 'intensity': 0.8}]),
+            self._profile("p0_s1", -0.5, {}),
+        ]
+
+    def _profile(self, segment_id, polarity, attention_weights, emotions=None):
+        return EmotionProfile(
+            segment_id=segment_id,
+            text_reference=None,
+            basic_sentiment={'polarity': polarity, 'objectivity': 0.5},
+            complex_emotions=emotions or [],
+            sarcasm_indicators={'probability': 0.0, 'features': []},
+            prosody_markers={'speed_factor': 1.0},
+            metadata={'timestamp': datetime.now(), 'attention_weights': attention_weights}
+        )
+
+    def test_selects_non_overlapping_sentences(self):
+        units = self.selector.select(self.segments, self.profiles)
+
+        self.assertEqual([segment.id for segment, _ in units], ["p0_s0", "p0_s1"])
+
+    def test_aggregates_parent_and_children(self):
+        units = dict((segment.id, profile) for segment, profile in self.selector.select(self.segments, self.profiles))
+
+        # Own 0.5 (w=1.0), parent 0.0 (w=0.25), phrase 1.0 (w=0.25)
+        self.assertAlmostEqual(units["p0_s0"].basic_sentiment['polarity'], 0.75 / 1.5)
+        self.assertEqual(units["p0_s0"].complex_emotions[0]['type'], 'joy')
+        self.assertIn('won', units["p0_s0"].metadata['attention_weights'])
+        self.assertNotIn('lost', units["p0_s0"].metadata['attention_weights'])
+
+    def test_paragraph_level(self):
+        selector = SynthesisUnitSelector(SynthesisUnitConfig(level='paragraph'))
+        units = selector.select(self.segments, self.profiles)
+
+        self.assertEqual([segment.id for segment, _ in units], ["p0"])
+
+    def test_store_selection_matches_profiles(self):
+        store = ProfileStore(capacity=2)
+        store.extend(self.profiles)
+
+        segments, unit_store = self.selector.select_store(self.segments, store)
+        expected = self.selector.select(self.segments, self.profiles)
+
+        self.assertEqual([segment.id for segment in segments], [segment.id for segment, _ in expected])
+        for view, (_, profile) in zip(unit_store, expected):
+            self.assertEqual(view.segment_id, profile.segment_id)
+            for key, value in profile.basic_sentiment.items():
+                self.assertAlmostEqual(view.basic_sentiment[key], value, places=6)
+            self.assertAlmostEqual(view.sarcasm_indicators['probability'], profile.sarcasm_indicators['probability'])
+            self.assertEqual({e['type']: round(e['intensity'], 6) for e in view.complex_emotions},
+                             {e['type']: round(e['intensity'], 6) for e in profile.complex_emotions})
+            self.assertEqual(view.attention_weights.keys(), profile.metadata['attention_weights'].keys())
+            self.assertEqual(view.metadata['aggregated_from'], profile.metadata['aggregated_from'])
+
+    def test_invalid_level(self):
+        with self.assertRaises(ValueError):
+            SynthesisUnitSelector(SynthesisUnitConfig(level='phrase'))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import unittest
+import tempfile
+from pathlib import Path
+from pyprosody.text_processing.reader import TextReader, TextProcessingConfig
+
+class TestTextReaderStreaming(unittest.TestCase):
+    def setUp(self):
+        # A tiny chunk size forces paragraph breaks to straddle reads
+        self.reader = TextReader(TextProcessingConfig(chunk_size=4))
+        self.temp_dir = tempfile.mkdtemp()
+        self.text = "First paragraph here.\n\n\nSecond one. Two sentences.\n\n  \n\nFirst paragraph here.\n"
+        self.path = Path(self.temp_dir) / "story.txt"
+        self.path.write_text(self.text, encoding="utf-8")
+
+    def tearDown(self):
+        self.path.unlink()
+        Path(self.temp_dir).rmdir()
+
+    def test_iter_paragraphs_offsets(self):
+        paragraphs = list(self.reader.iter_paragraphs(str(self.path)))
+
+        self.assertEqual([para for _, para in paragraphs],
+                         ["First paragraph here.", "Second one. Two sentences.", "First paragraph here."])
+        for offset, para in paragraphs:
+            self.assertEqual(self.text[offset:offset + len(para)], para)
+
+    def test_long_paragraph_is_split_at_breaks(self):
+        text = "One sentence here. Another one!\nA new line without a break " + "x" * 30
+        self.path.write_text(text, encoding="utf-8")
+        reader = TextReader(TextProcessingConfig(chunk_size=7, max_paragraph_chars=40))
+
+        paragraphs = list(reader.iter_paragraphs(str(self.path)))
+
+        self.assertEqual([para for _, para in paragraphs][:2], ["One sentence here. Another one!", "A new line without a break"])
+        for offset, para in paragraphs:
+            self.assertLessEqual(len(para), 40)
+            self.assertEqual(text[offset:offset + len(para)], para)
+        self.assertEqual("".join("".join(para.split()) for _, para in paragraphs), "".join(text.split()))
+
+    def test_stream_segments_matches_full_read(self):
+        streamed = list(self.reader.stream_segments(str(self.path)))
+        segments, _ = self.reader.process_text(str(self.path))
+
+        self.assertEqual([(s.id, s.start_pos, s.end_pos) for s in streamed],
+                         [(s.id, s.start_pos, s.end_pos) for s in segments])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
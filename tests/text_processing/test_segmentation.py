@@ -1,5 +1,6 @@
 import unittest
-from pyprosody.text_processing.segmentation import TextSegmenter, TextSegment
+import pickle
+from pyprosody.text_processing.segmentation import TextSegmenter, TextSegment, SegmentStore
 
 class TestTextSegmentation(unittest.TestCase):
     def setUp(self):
@@ -59,4 +60,80 @@ class TestTextSegmentation(unittest.TestCase):
         
         self.assertEqual(len(segments), 2)
         self.assertIn("émoji", segments[0].text)
-        self.assertIn("😊", segments[0].text)
\ No newline at end of file
+        self.assertIn("😊", segments[0].text)
+
+    def test_repeated_paragraph_offsets(self):
+        text = "Same words here.\n\nSame words here."
+        segments = self.segmenter.segment_text(text)
+        paragraphs = [s for s in segments if s.segment_type == "paragraph"]
+        
+        self.assertEqual(len(paragraphs), 2)
+        self.assertEqual(paragraphs[0].start_pos, 0)
+        self.assertEqual(paragraphs[1].start_pos, 18)
+        for segment in segments:
+            self.assertEqual(text[segment.start_pos:segment.end_pos], segment.text)
+
+class TestSegmentStore(unittest.TestCase):
+    def setUp(self):
+        self.text = "One two. Three.\n\nFour."
+        self.store = SegmentStore(self.text)
+        p0 = self.store.append(0, 0, 15, 0)
+        s0 = self.store.append(1, 0, 8, 0, p0)
+        self.store.append(2, 4, 7, 0, s0)
+        self.store.append(1, 9, 15, 1, p0)
+        p1 = self.store.append(0, 17, 22, 1)
+        self.store.append(1, 17, 22, 0, p1)
+
+    def test_views_derive_fields(self):
+        segments = list(self.store)
+
+        self.assertEqual([s.id for s in segments], ["p0", "p0_s0", "p0_s0_ph0", "p0_s1", "p1", "p1_s0"])
+        self.assertEqual([s.parent_id for s in segments], [None, "p0", "p0_s0", "p0", None, "p1"])
+        self.assertEqual(segments[2].text, "two")
+        self.assertEqual(segments[2].segment_type, "phrase")
+        self.assertIsInstance(segments[0], TextSegment)
+        for segment in segments:
+            self.assertEqual(self.text[segment.start_pos:segment.end_pos], segment.text)
+
+    def test_indexing_and_slicing(self):
+        self.assertEqual(len(self.store), 6)
+        self.assertEqual(self.store[-1].id, "p1_s0")
+        self.assertEqual([s.id for s in self.store[1:3]], ["p0_s0", "p0_s0_ph0"])
+        with self.assertRaises(IndexError):
+            self.store[6]
+
+    def test_pickles_as_plain_segment(self):
+        restored = pickle.loads(pickle.dumps(self.store[3]))
+
+        self.assertIs(type(restored), TextSegment)
+        self.assertEqual(restored, TextSegment(id="p0_s1", text="Three.", segment_type="sentence",
+                                               start_pos=9, end_pos=15, parent_id="p0"))
+
+    def test_view_equals_plain_segment(self):
+        plain = TextSegment(id="p0_s1", text="Three.", segment_type="sentence",
+                            start_pos=9, end_pos=15, parent_id="p0")
+
+        self.assertEqual(self.store[3], plain)
+        self.assertEqual(plain, self.store[3])
+        self.assertEqual(self.store[3], self.store[3])
+        self.assertNotEqual(self.store[1], plain)
+
+    def test_tokens_follow_segment_bounds(self):
+        self.assertIsNone(self.store[0].tokens)
+        for start, end, tag in ((0, 3, 'CD'), (4, 7, 'CD'), (7, 8, '.'), (9, 14, 'CD'), (14, 15, '.'),
+                                (17, 21, 'CD'), (21, 22, '.')):
+            self.store.append_token(start, end, tag)
+
+        self.assertEqual(self.store[2].tokens, [("two", "CD")])
+        self.assertEqual(self.store[3].tokens, [("Three", "CD"), (".", ".")])
+        self.assertEqual(len(self.store[0].tokens), 5)
+        self.assertEqual(self.store.tags, ['CD', '.'])
+
+    def test_offset_store_uses_document_positions(self):
+        store = SegmentStore("Four.", offset=17)
+        store.append(0, 17, 22, 1)
+        store.append_token(17, 21, 'CD')
+
+        self.assertEqual(store[0].text, "Four.")
+        self.assertEqual(store[0].id, "p1")
+        self.assertEqual(store[0].tokens, [("Four", "CD")])
\ No newline at end of file